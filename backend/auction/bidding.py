@@ -0,0 +1,191 @@
+"""
+Bid validation rules shared by every bid acceptance path.
+Pure functions - no database or socket access, so the HTTP endpoint and the
+in-memory auction state apply exactly the same checks in the same order.
+"""
+from datetime import datetime, timedelta
+from typing import Optional
+
+
+class BidRejected(Exception):
+    """
+    Raised when a bid fails validation.
+
+    status_code/detail map directly onto the HTTPException the endpoint returns;
+    reason is the BID_REJECTED metric label (None = not counted, as before).
+    """
+
+    def __init__(self, status_code: int, detail: str, reason: Optional[str] = None):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+        self.reason = reason
+
+
+def validate_bid(
+    user_id: str,
+    amount: float,
+    minimum_budget: float,
+    budget_remaining: float,
+    clubs_won_count: int,
+    club_slots: int,
+    current_club_id: Optional[str],
+    current_bid: Optional[float],
+    current_bidder_id: Optional[str],
+) -> None:
+    """
+    Apply the auction bidding rules to a single bid.
+
+    Args:
+        user_id: Bidder's user ID
+        amount: Bid amount
+        minimum_budget: Auction minimum bid (auction.minimumBudget)
+        budget_remaining: Bidder's remaining budget
+        clubs_won_count: Number of clubs the bidder already owns
+        club_slots: Roster size (league.clubSlots)
+        current_club_id: Club currently on the block (None if no lot running)
+        current_bid: Current highest bid on the lot (None/0 if no bids yet)
+        current_bidder_id: User ID of the current highest bidder
+
+    Raises:
+        BidRejected: If any rule fails
+    """
+    # Check minimum bid amount
+    if amount < minimum_budget:
+        raise BidRejected(400, f"Bid must be at least £{minimum_budget:,.0f}", "minimum_bid")
+
+    # Check if user has enough budget
+    if amount > budget_remaining:
+        raise BidRejected(
+            400,
+            f"Insufficient budget. You have £{budget_remaining:,.0f} remaining",
+            "insufficient_budget"
+        )
+
+    # Everton Bug Fix: Enforce budget reserve for remaining slots
+    # User must keep £1m per remaining slot (except on final slot)
+    slots_remaining = club_slots - clubs_won_count
+    if slots_remaining > 1:
+        reserve_needed = (slots_remaining - 1) * 1_000_000
+        max_allowed_bid = budget_remaining - reserve_needed
+        if amount > max_allowed_bid:
+            raise BidRejected(
+                400,
+                f"Must reserve £{reserve_needed/1_000_000:.0f}m for {slots_remaining - 1} remaining slot(s). "
+                f"Max bid: £{max_allowed_bid/1_000_000:.1f}m",
+                "insufficient_reserve"
+            )
+
+    # Check if user has reached roster limit (Prompt C: Roster enforcement)
+    if clubs_won_count >= club_slots:
+        raise BidRejected(
+            400,
+            f"Roster full. You already own {clubs_won_count}/{club_slots} teams",
+            "roster_full"
+        )
+
+    if not current_club_id:
+        raise BidRejected(400, "No club currently on the block. Please wait for commissioner to start a lot.")
+
+    # CRITICAL: Prevent user from outbidding themselves
+    if current_bidder_id and current_bidder_id == user_id:
+        raise BidRejected(400, "You are already the highest bidder", "self_outbid")
+
+    # CRITICAL: Bid must exceed current highest bid
+    current_bid = current_bid or 0
+    if current_bid > 0 and amount <= current_bid:
+        raise BidRejected(400, f"Bid must exceed current bid of £{current_bid:,.0f}. Please bid higher.")
+
+
+def anti_snipe_deadline(
+    timer_ends_at: Optional[datetime],
+    anti_snipe_seconds: float,
+    now: datetime,
+) -> Optional[datetime]:
+    """
+    Return the extended lot deadline if a bid at `now` lands inside the
+    anti-snipe window, otherwise None.
+    """
+    if not timer_ends_at:
+        return None
+    time_remaining = (timer_ends_at - now).total_seconds()
+    if 0 < time_remaining <= anti_snipe_seconds:
+        return now + timedelta(seconds=anti_snipe_seconds)
+    return None
+
+
+def guarded_bid_update(
+    auction_id: str,
+    club_id: str,
+    user_id: str,
+    amount: float,
+    current_bidder: dict,
+    anti_snipe_seconds: float,
+    now: datetime,
+):
+    """
+    Build the (filter, update pipeline, extended deadline) for accepting a bid
+    with a single find_one_and_update on `auctions`.
+
+    The filter re-checks everything that can change under contention (status,
+    lot, current bid, current bidder), so a bid that lost a race matches no
+    document instead of overwriting the winner. The pipeline bumps bidSequence
+    and applies the anti-snipe extension in the same write: if the deadline is
+    inside the window it becomes the returned `extended_until`, otherwise it is
+    left untouched.
+    """
+    # Mongo stores millisecond precision - truncate so the caller can compare
+    # the returned timerEndsAt against extended_until exactly
+    extended_until = now + timedelta(seconds=anti_snipe_seconds)
+    extended_until = extended_until.replace(microsecond=extended_until.microsecond // 1000 * 1000)
+
+    query = {
+        "id": auction_id,
+        "status": "active",
+        "currentClubId": club_id,
+        "$or": [{"currentBid": None}, {"currentBid": {"$lt": amount}}],
+        "currentBidder.userId": {"$ne": user_id},
+    }
+    pipeline = [
+        {"$set": {
+            "currentBid": {"$literal": amount},
+            "currentBidder": {"$literal": current_bidder},
+            "bidSequence": {"$add": [{"$ifNull": ["$bidSequence", 0]}, 1]},
+            "timerEndsAt": {"$cond": [
+                {"$and": [
+                    {"$gt": ["$timerEndsAt", now]},
+                    {"$lte": ["$timerEndsAt", extended_until]},
+                ]},
+                extended_until,
+                "$timerEndsAt",
+            ]},
+        }}
+    ]
+    return query, pipeline, extended_until
+
+
+def bid_rollback_update(auction_id: str, user_id: str, amount: float, bid_sequence: int, before: dict):
+    """
+    Build the (filter, update) undoing an accepted bid whose bid row could not be written,
+    restoring the auction's current bid, bidder and deadline from `before` (the document the
+    bid was validated against).
+
+    The filter only matches while that bid is still the latest write, so a later bid is never
+    rolled back. bidSequence moves on instead of back: a snapshot cached at the rolled-back
+    sequence must not be reused for the restored state.
+    """
+    query = {
+        "id": auction_id,
+        "bidSequence": bid_sequence,
+        "currentBid": amount,
+        "currentBidder.userId": user_id,
+    }
+    update = {
+        "$set": {
+            "currentBid": before.get("currentBid"),
+            "currentBidder": before.get("currentBidder"),
+            "timerEndsAt": before.get("timerEndsAt"),
+        },
+        "$inc": {"bidSequence": 1},
+    }
+    return query, update
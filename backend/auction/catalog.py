@@ -0,0 +1,190 @@
+"""
+Pre-materialised lot catalog.
+
+start_auction snapshots the display fields of every queued asset once and
+persists them to auction_lots, one document per lot keyed by (auctionId,
+order), so neither the auction document nor any single catalog document grows
+with the catalog. Lot transitions, snapshots and settlement then build their
+events from the catalog instead of reading assets, and the static part of each
+lot_started payload is built once per lot.
+
+The lot order lives in the same documents (order = position in the initial
+queue), so the auction document only records queueLength and the queue is read
+a window at a time. Assets looked up outside the queue (clubs started manually)
+are added as documents without an order.
+
+Auctions whose catalog is still a single auction_lot_catalogs document (lots +
+queue arrays) are moved to per-lot documents the first time this process
+touches them.
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from pymongo.errors import BulkWriteError
+
+from models import Club
+
+logger = logging.getLogger(__name__)
+
+LOTS_PROJECTION = {"_id": 0, "assetId": 1, "order": 1, "lot": 1}
+
+
+def lot_display(asset: dict, sport_key: str) -> dict:
+    """The club/asset payload sent to clients (same shape the lot events always used)"""
+    if sport_key == "football":
+        try:
+            return Club(**asset).model_dump()
+        except ValueError as e:
+            logger.warning(f"Asset {asset.get('id')} is not a valid Club, sending raw fields: {e}")
+    display = dict(asset)
+    display.pop("_id", None)
+    return display
+
+
+def lot_document(auction_id: str, display: dict, sport_key: str, order: Optional[int] = None) -> dict:
+    doc = {"auctionId": auction_id, "assetId": display["id"], "name": display.get("name"), "sportKey": sport_key,
+           "lot": display}
+    if order is not None:
+        doc["order"] = order
+    return doc
+
+
+class LotCatalogStore:
+    """
+    Args:
+        db: Motor database
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._lots: Dict[str, Dict[str, dict]] = {}  # auctionId -> assetId -> display (filled as lots are read)
+        self._sports: Dict[str, str] = {}
+        self._migrated: Set[str] = set()
+        self._lot_frames: Dict[Tuple[str, str], dict] = {}
+
+    async def create(self, auction_id: str, assets: Iterable[dict], sport_key: str) -> None:
+        """Snapshot the queued assets, in lot order, for a new auction"""
+        lots = [lot_display(asset, sport_key) for asset in assets]
+        self._lots[auction_id] = {lot["id"]: lot for lot in lots}
+        self._sports[auction_id] = sport_key
+        self._migrated.add(auction_id)
+        await self.db.auction_lots.delete_many({"auctionId": auction_id})
+        if lots:
+            await self.db.auction_lots.insert_many(
+                [lot_document(auction_id, lot, sport_key, order) for order, lot in enumerate(lots)]
+            )
+        logger.info(f"📚 Lot catalog created for auction {auction_id}: {len(lots)} lots")
+
+    async def asset(self, auction_id: str, asset_id: str, sport_key: Optional[str] = None) -> Optional[dict]:
+        """
+        Display payload for one asset. Falls back to the assets collection for
+        auctions created before catalogs existed or clubs started manually.
+        """
+        cached = self._lots.setdefault(auction_id, {})
+        if asset_id in cached:
+            return cached[asset_id]
+        await self._migrate(auction_id)
+        doc = await self.db.auction_lots.find_one({"auctionId": auction_id, "assetId": asset_id}, LOTS_PROJECTION)
+        if doc:
+            cached[asset_id] = doc["lot"]
+            return doc["lot"]
+
+        sport_key = sport_key or self._sports.get(auction_id)
+        query = {"id": asset_id}
+        if sport_key and sport_key != "football":
+            query["sportKey"] = sport_key
+        asset = await self.db.assets.find_one(query, {"_id": 0})
+        if not asset:
+            return None
+        sport_key = sport_key or asset.get("sportKey", "football")
+        display = lot_display(asset, sport_key)
+        cached[asset_id] = display
+        await self.db.auction_lots.update_one(
+            {"auctionId": auction_id, "assetId": asset_id},
+            {"$setOnInsert": lot_document(auction_id, display, sport_key)},
+            upsert=True,
+        )
+        return display
+
+    async def queue_page(self, auction_id: str, start: int = 0, count: Optional[int] = None) -> List[str]:
+        """Asset ids of lots start..start+count-1 of the initial queue (count None = to the end)"""
+        await self._migrate(auction_id)
+        order = {"$gte": start} if count is None else {"$gte": start, "$lt": start + count}
+        cursor = self.db.auction_lots.find(
+            {"auctionId": auction_id, "order": order}, {"_id": 0, "assetId": 1}
+        ).sort("order", 1)
+        return [doc["assetId"] async for doc in cursor]
+
+    async def lot_at(self, auction_id: str, order: int) -> Optional[str]:
+        """Asset id of the lot at this queue position"""
+        page = await self.queue_page(auction_id, order, 1)
+        return page[0] if page else None
+
+    async def lots_page(self, auction_id: str, skip: int = 0, limit: int = 0) -> List[dict]:
+        """
+        Queued lots by name (the draw order stays hidden), limit 0 = all. Each entry is the
+        display payload plus lotNumber (1-based queue position).
+        """
+        await self._migrate(auction_id)
+        cursor = self.db.auction_lots.find(
+            {"auctionId": auction_id, "order": {"$exists": True}}, LOTS_PROJECTION
+        ).sort([("name", 1), ("order", 1)]).skip(skip).limit(limit)
+        cached = self._lots.setdefault(auction_id, {})
+        lots = []
+        async for doc in cursor:
+            cached[doc["assetId"]] = doc["lot"]
+            lots.append({**doc["lot"], "lotNumber": doc["order"] + 1})
+        return lots
+
+    async def lot_started(self, auction_id: str, lot_id: str, lot_number: int, asset_id: str,
+                          sport_key: Optional[str] = None, is_unsold_retry: bool = False) -> Optional[dict]:
+        """
+        Static part of a lot_started event, built once per lot.
+        Callers add the timer: {**frame, 'timer': timer_data}.
+        """
+        key = (auction_id, lot_id)
+        frame = self._lot_frames.get(key)
+        if frame is None:
+            club = await self.asset(auction_id, asset_id, sport_key)
+            if club is None:
+                return None
+            frame = {"club": club, "lotNumber": lot_number, "isUnsoldRetry": bool(is_unsold_retry)}
+            self._lot_frames[key] = frame
+        return frame
+
+    def drop(self, auction_id: str) -> None:
+        """Forget cached catalog and frames (auction completed, reset or deleted)"""
+        self._lots.pop(auction_id, None)
+        self._sports.pop(auction_id, None)
+        self._migrated.discard(auction_id)
+        for key in [key for key in self._lot_frames if key[0] == auction_id]:
+            del self._lot_frames[key]
+
+    async def delete(self, auction_id: str) -> None:
+        self.drop(auction_id)
+        await self.db.auction_lots.delete_many({"auctionId": auction_id})
+        await self.db.auction_lot_catalogs.delete_one({"auctionId": auction_id})
+
+    async def _migrate(self, auction_id: str) -> None:
+        """Move a single-document catalog to per-lot documents (once per auction per process)"""
+        if auction_id in self._migrated:
+            return
+        legacy = await self.db.auction_lot_catalogs.find_one({"auctionId": auction_id}, {"_id": 0})
+        if legacy:
+            sport_key = legacy.get("sportKey", "football")
+            lots = {lot["id"]: lot for lot in legacy.get("lots", [])}
+            queue = legacy.get("queue", [])
+            docs = [lot_document(auction_id, lots[asset_id], sport_key, order)
+                    for order, asset_id in enumerate(queue) if asset_id in lots]
+            docs += [lot_document(auction_id, lot, sport_key) for asset_id, lot in lots.items() if asset_id not in queue]
+            if docs:
+                try:
+                    await self.db.auction_lots.insert_many(docs, ordered=False)
+                except BulkWriteError as e:
+                    # Duplicates mean another process migrated (some of) it first - the unique index kept one copy
+                    if any(error.get("code") != 11000 for error in e.details.get("writeErrors", [])):
+                        raise
+            await self.db.auction_lot_catalogs.delete_one({"auctionId": auction_id})
+            self._sports.setdefault(auction_id, sport_key)
+            logger.info(f"📚 Lot catalog for auction {auction_id} moved to per-lot documents: {len(docs)} lots")
+        self._migrated.add(auction_id)
@@ -93,3 +93,112 @@ def compute_auction_status(league, participants, auction_state):
         "filled_managers": filled_managers,
         "unfilled_managers": unfilled_managers
     }
+
+
+# ===== INCREMENTAL COUNTERS =====
+# Kept on the auction document and moved with $inc at settlement, so completion
+# checks never need to scan league_participants.
+COUNTER_FIELDS = ("managerCount", "remainingDemand", "eligibleBidders", "lotsSold")
+
+
+def count_completion(league, participants, minimum_budget):
+    """
+    Full-scan computation of the completion counters.
+    Used once to seed an auction's counters and by verify_counters.
+    """
+    required_slots = league.get("clubSlots", 3)
+    managers = [p for p in participants if "clubsWon" in p]
+    return {
+        "managerCount": len(managers),
+        "remainingDemand": sum(max(0, required_slots - len(p.get("clubsWon", []))) for p in managers),
+        "eligibleBidders": sum(
+            1 for p in managers
+            if len(p.get("clubsWon", [])) < required_slots and p.get("budgetRemaining", 0) >= minimum_budget
+        ),
+        "lotsSold": sum(len(p.get("clubsWon", [])) for p in managers),
+    }
+
+
+def award_counter_increments(winner_after, required_slots, minimum_budget):
+    """
+    $inc for the auction counters after one club was awarded.
+
+    winner_after is the winner's participant document after the award. The winner
+    was eligible before (a valid bid needs a free slot and at least the minimum
+    budget), so they leave the eligible pool iff they are ineligible now.
+    """
+    clubs_won = len(winner_after.get("clubsWon", []))
+    still_eligible = clubs_won < required_slots and winner_after.get("budgetRemaining", 0) >= minimum_budget
+    return {
+        "lotsSold": 1,
+        "remainingDemand": -1,
+        "eligibleBidders": 0 if still_eligible else -1,
+    }
+
+
+def join_counter_increments(participant, required_slots, minimum_budget):
+    """
+    $inc for the auction counters when a manager joins the league mid-auction.
+    Mirrors count_completion for one participant, so the counters stay equal to a rescan.
+    """
+    clubs_won = len(participant.get("clubsWon", []))
+    return {
+        "managerCount": 1,
+        "remainingDemand": max(0, required_slots - clubs_won),
+        "eligibleBidders": int(clubs_won < required_slots and participant.get("budgetRemaining", 0) >= minimum_budget),
+        "lotsSold": clubs_won,
+    }
+
+
+def compute_status_from_counters(league, counters, auction_state):
+    """
+    O(1) equivalent of compute_auction_status using the auction's counters.
+    Per-manager breakdowns are not available here - use compute_auction_status for those.
+    """
+    manager_count = counters.get("managerCount", 0)
+    remaining_demand = counters.get("remainingDemand", 0)
+    all_filled = manager_count > 0 and remaining_demand == 0
+
+    reasons = []
+    should_complete = False
+
+    if all_filled:
+        should_complete = True
+        reasons.append("ALL_ROSTERS_FILLED")
+        reasons.append("ZERO_DEMAND")
+
+    if auction_state.get("current_lot", 0) >= auction_state.get("total_lots", 0):
+        if auction_state.get("unsold_count", 0) == 0:
+            should_complete = True
+            reasons.append("ALL_LOTS_EXHAUSTED")
+
+    if manager_count == 0:
+        should_complete = False
+        reasons.append("NO_MANAGERS")
+
+    return {
+        "should_complete": should_complete,
+        "reasons": reasons if reasons else ["CONTINUE"],
+        "all_filled": all_filled,
+        "manager_count": manager_count,
+        "required_slots": league.get("clubSlots", 3),
+        "remaining_demand": remaining_demand,
+        "eligible_bidders": counters.get("eligibleBidders", 0),
+        "lots_sold": counters.get("lotsSold", 0),
+        "current_lot": auction_state.get("current_lot", 0),
+        "total_lots": auction_state.get("total_lots", 0),
+        "unsold_count": auction_state.get("unsold_count", 0),
+    }
+
+
+def verify_counters(league, participants, counters, minimum_budget):
+    """
+    Cross-check incremental counters against a full scan.
+    Returns {field: (counter_value, scanned_value)} for every mismatch - empty when consistent.
+    """
+    scanned = count_completion(league, participants, minimum_budget)
+    return {
+        field: (counters.get(field), scanned[field])
+        for field in COUNTER_FIELDS
+        if counters.get(field) != scanned[field]
+    }
@@ -0,0 +1,122 @@
+"""
+Idempotency keys for bid submission.
+
+A client that retries a bid with the same key (Idempotency-Key header or
+clientBidId) gets the original outcome back - the accepted bid or the
+rejection - instead of the bid path running again. Outcomes are kept for a
+short TTL in process and, with a Redis client attached, in Redis so a retry
+that lands on another replica is answered without touching Mongo. A retry
+that arrives while the original is still running awaits it. Server errors and
+rate-limit rejections (429) are not remembered, so those can be retried for real.
+"""
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+KEY_FORMAT = "bid-idem:{auction_id}:{user_id}:{key}"
+DEFAULT_TTL_SECONDS = 120
+MAX_KEY_LENGTH = 128
+
+
+@dataclass
+class BidOutcome:
+    status: int  # 200 when accepted, otherwise the rejection's HTTP status
+    body: Any  # Response body, or the rejection detail
+
+
+class BidIdempotencyStore:
+    """
+    Args:
+        ttl_seconds: how long an outcome answers retries
+        max_entries: in-process outcomes kept (oldest dropped first)
+        redis: optional redis.asyncio client (decode_responses=True) shared by replicas
+        on_duplicate: called with "memory", "inflight" or "redis" for each suppressed retry
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS, max_entries: int = 10000, redis=None,
+                 on_duplicate: Optional[Callable[[str], None]] = None):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.redis = redis
+        self.on_duplicate = on_duplicate
+        self._outcomes: "OrderedDict[str, Tuple[float, BidOutcome]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def use_redis(self, redis) -> None:
+        self.redis = redis
+
+    async def run(self, auction_id: str, user_id: str, key: str,
+                  execute: Callable[[], Awaitable[BidOutcome]]) -> BidOutcome:
+        """Return the outcome remembered for key, or run execute() once and remember its outcome"""
+        cache_key = KEY_FORMAT.format(auction_id=auction_id, user_id=user_id, key=key)
+        outcome = self._get(cache_key)
+        if outcome:
+            self._duplicate("memory")
+            return outcome
+
+        task = self._inflight.get(cache_key)
+        if task:
+            self._duplicate("inflight")
+            return await asyncio.shield(task)
+
+        task = asyncio.create_task(self._resolve(cache_key, execute))
+        self._inflight[cache_key] = task
+        task.add_done_callback(lambda t: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    def __len__(self) -> int:
+        return len(self._outcomes)
+
+    async def _resolve(self, cache_key: str, execute: Callable[[], Awaitable[BidOutcome]]) -> BidOutcome:
+        if self.redis:
+            try:
+                stored = await self.redis.get(cache_key)
+            except Exception as e:
+                logger.warning(f"⚠️ Idempotency lookup in Redis failed, running bid: {e}")
+                stored = None
+            if stored:
+                outcome = BidOutcome(**json.loads(stored))
+                self._put(cache_key, outcome)
+                self._duplicate("redis")
+                return outcome
+
+        outcome = await execute()
+        if outcome.status < 500 and outcome.status != 429:
+            self._put(cache_key, outcome)
+            if self.redis:
+                try:
+                    await self.redis.set(cache_key, json.dumps(asdict(outcome)), ex=int(self.ttl_seconds))
+                except Exception as e:
+                    logger.warning(f"⚠️ Idempotency store in Redis failed: {e}")
+        return outcome
+
+    def _get(self, cache_key: str) -> Optional[BidOutcome]:
+        entry = self._outcomes.get(cache_key)
+        if not entry:
+            return None
+        expires_at, outcome = entry
+        if expires_at <= time.monotonic():
+            del self._outcomes[cache_key]
+            return None
+        return outcome
+
+    def _put(self, cache_key: str, outcome: BidOutcome) -> None:
+        now = time.monotonic()
+        self._outcomes.pop(cache_key, None)
+        self._outcomes[cache_key] = (now + self.ttl_seconds, outcome)
+        # Constant TTL keeps insertion order = expiry order, so expired entries sit at the front
+        while self._outcomes:
+            oldest_key, (expires_at, _) = next(iter(self._outcomes.items()))
+            if expires_at > now and len(self._outcomes) <= self.max_entries:
+                break
+            del self._outcomes[oldest_key]
+
+    def _duplicate(self, source: str) -> None:
+        if self.on_duplicate:
+            self.on_duplicate(source)
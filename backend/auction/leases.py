@@ -0,0 +1,223 @@
+"""
+Redis-backed lot timer ownership for multi-replica deployments.
+
+Each auction's lot timer is owned by exactly one replica, recorded as a
+Redis lease (SET NX PX) that the owner renews on a heartbeat. The current
+deadline of every running lot is kept in a Redis hash, so when an owner
+dies its lease expires and another replica's sweep takes the timer over
+within lease_ttl + heartbeat seconds. Deadline changes made on a
+non-owning replica (lot start, anti-snipe, cancel) are published on a
+channel and applied by the owner.
+
+Lot sequence numbers live in Redis counters so every replica hands out
+one monotonic sequence per lot.
+
+The local LotTimerScheduler still does the actual ticking/expiry - this
+class only decides which replica's scheduler holds each timer.
+"""
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Optional, Set
+
+import metrics
+from auction.timers import LotTimerScheduler, to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+LEASE_KEY = "auction:timer-lease:{auction_id}"
+DEADLINES_KEY = "auction:timer-deadlines"
+EVENTS_CHANNEL = "auction:timer-events"
+SEQ_KEY = "auction:lot-seq:{lot_id}"
+SEQ_TTL_SECONDS = 24 * 60 * 60
+
+# Only the holder may renew/release its lease
+RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+def _from_ms(ends_at_ms: int) -> datetime:
+    return datetime.fromtimestamp(ends_at_ms / 1000, tz=timezone.utc)
+
+
+class TimerLeaseCoordinator:
+    """
+    Args:
+        redis: redis.asyncio client (decode_responses=True)
+        scheduler: this replica's LotTimerScheduler
+        replica_id: unique id for this process
+        lease_ttl: seconds a lease survives without renewal
+    """
+
+    def __init__(self, redis, scheduler: LotTimerScheduler, replica_id: str, lease_ttl: float = 5.0):
+        self.redis = redis
+        self.scheduler = scheduler
+        self.replica_id = replica_id
+        self.lease_ttl_ms = int(lease_ttl * 1000)
+        self.heartbeat = lease_ttl / 3
+        self._owned: Set[str] = set()
+        self._tasks = []
+
+    # ===== LIFECYCLE =====
+    async def start(self) -> None:
+        self._tasks = [
+            asyncio.create_task(self._heartbeat_loop()),
+            asyncio.create_task(self._listen()),
+        ]
+        logger.info(f"✅ Timer leases enabled: replica={self.replica_id} ttl={self.lease_ttl_ms}ms")
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        self._tasks = []
+        # Hand timers over immediately instead of waiting for leases to lapse
+        for auction_id in list(self._owned):
+            self.scheduler.cancel(auction_id)
+            await self._release(auction_id)
+
+    # ===== TIMER API (mirrors LotTimerScheduler) =====
+    async def schedule(self, auction_id: str, lot_id: str, ends_at: datetime) -> None:
+        ends_at_ms = to_epoch_ms(ends_at)
+        await self.redis.hset(DEADLINES_KEY, auction_id, json.dumps({"lotId": lot_id, "endsAt": ends_at_ms}))
+        if await self._acquire(auction_id):
+            self.scheduler.schedule(auction_id, lot_id, ends_at)
+        else:
+            await self._publish("schedule", auction_id, lot_id, ends_at_ms)
+
+    async def extend(self, auction_id: str, lot_id: str, ends_at: datetime) -> None:
+        ends_at_ms = to_epoch_ms(ends_at)
+        await self.redis.hset(DEADLINES_KEY, auction_id, json.dumps({"lotId": lot_id, "endsAt": ends_at_ms}))
+        if auction_id in self._owned:
+            self.scheduler.extend(auction_id, lot_id, ends_at)
+        else:
+            await self._publish("extend", auction_id, lot_id, ends_at_ms)
+
+    async def cancel(self, auction_id: str) -> None:
+        await self.redis.hdel(DEADLINES_KEY, auction_id)
+        self.scheduler.cancel(auction_id)
+        if auction_id in self._owned:
+            await self._release(auction_id)
+        else:
+            await self._publish("cancel", auction_id)
+
+    async def next_seq(self, lot_id: str) -> int:
+        key = SEQ_KEY.format(lot_id=lot_id)
+        pipe = self.redis.pipeline()
+        pipe.incr(key)
+        pipe.expire(key, SEQ_TTL_SECONDS)
+        seq, _ = await pipe.execute()
+        return int(seq)
+
+    def stats(self) -> dict:
+        return {"replicaId": self.replica_id, "leasesOwned": len(self._owned), "leaseTtlMs": self.lease_ttl_ms}
+
+    # ===== LEASES =====
+    async def _acquire(self, auction_id: str) -> bool:
+        key = LEASE_KEY.format(auction_id=auction_id)
+        if auction_id in self._owned:
+            renewed = await self.redis.eval(RENEW_SCRIPT, 1, key, self.replica_id, self.lease_ttl_ms)
+            if renewed:
+                return True
+            self._lose(auction_id)
+        acquired = await self.redis.set(key, self.replica_id, nx=True, px=self.lease_ttl_ms)
+        if acquired:
+            self._owned.add(auction_id)
+            metrics.set_timer_leases_owned(len(self._owned))
+        return bool(acquired)
+
+    async def _release(self, auction_id: str) -> None:
+        self._owned.discard(auction_id)
+        metrics.set_timer_leases_owned(len(self._owned))
+        await self.redis.eval(RELEASE_SCRIPT, 1, LEASE_KEY.format(auction_id=auction_id), self.replica_id)
+
+    def _lose(self, auction_id: str) -> None:
+        logger.warning(f"⚠️ Timer lease lost for auction {auction_id} - another replica owns it now")
+        self._owned.discard(auction_id)
+        self.scheduler.cancel(auction_id)
+        metrics.set_timer_leases_owned(len(self._owned))
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            try:
+                await self._renew_owned()
+                await self._take_over_orphans()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Timer lease heartbeat failed: {e}")
+            await asyncio.sleep(self.heartbeat)
+
+    async def _renew_owned(self) -> None:
+        for auction_id in list(self._owned):
+            key = LEASE_KEY.format(auction_id=auction_id)
+            renewed = await self.redis.eval(RENEW_SCRIPT, 1, key, self.replica_id, self.lease_ttl_ms)
+            if not renewed:
+                self._lose(auction_id)
+
+    async def _take_over_orphans(self) -> None:
+        deadlines = await self.redis.hgetall(DEADLINES_KEY)
+        for auction_id, raw in deadlines.items():
+            if auction_id in self._owned:
+                continue
+            if await self.redis.exists(LEASE_KEY.format(auction_id=auction_id)):
+                continue
+            if await self._acquire(auction_id):
+                entry = json.loads(raw)
+                self.scheduler.schedule(auction_id, entry["lotId"], _from_ms(entry["endsAt"]))
+                metrics.increment_timer_lease_takeover()
+                logger.warning(f"🔁 Took over lot timer for auction {auction_id} (lot {entry['lotId']})")
+
+    # ===== CROSS-REPLICA EVENTS =====
+    async def _publish(self, action: str, auction_id: str, lot_id: Optional[str] = None,
+                       ends_at_ms: Optional[int] = None) -> None:
+        await self.redis.publish(EVENTS_CHANNEL, json.dumps({
+            "action": action,
+            "auctionId": auction_id,
+            "lotId": lot_id,
+            "endsAt": ends_at_ms,
+            "origin": self.replica_id,
+        }))
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") == "message":
+                        await self._apply(json.loads(message["data"]))
+            except asyncio.CancelledError:
+                await pubsub.close()
+                raise
+            except Exception as e:
+                logger.error(f"Timer event subscription failed, resubscribing: {e}")
+                await pubsub.close()
+                await asyncio.sleep(self.heartbeat)
+
+    async def _apply(self, event: dict) -> None:
+        if event.get("origin") == self.replica_id:
+            return
+        auction_id = event["auctionId"]
+        action = event["action"]
+        if action == "cancel":
+            self.scheduler.cancel(auction_id)
+            if auction_id in self._owned:
+                await self._release(auction_id)
+        elif action == "extend":
+            if auction_id in self._owned:
+                self.scheduler.extend(auction_id, event["lotId"], _from_ms(event["endsAt"]))
+        elif action == "schedule":
+            # Owner applies it; if the lease lapsed in the meantime, whoever grabs it first does
+            if auction_id in self._owned or await self._acquire(auction_id):
+                self.scheduler.schedule(auction_id, event["lotId"], _from_ms(event["endsAt"]))
@@ -0,0 +1,299 @@
+"""
+Room presence: which sockets and distinct users are in each auction:/league: room.
+
+Socket.IO's Redis manager can't answer room sizes (membership is spread over
+replicas), so presence is tracked here. Without Redis it lives in process;
+with a client attached every room is two Redis hashes:
+
+    presence:{room}:sockets   sid -> userId      (HLEN = sockets in the room)
+    presence:{room}:users     userId -> sockets  (HLEN = distinct users)
+
+Joins and leaves are single Lua calls, so counts stay exact across replicas.
+Each replica also records its own memberships in a set and refreshes a
+heartbeat key with a TTL; when a replica dies its heartbeat expires and the
+next sweep on a live replica removes its sockets, so a crashed pod leaves no
+ghosts behind.
+
+join/leave return a PresenceChange only when a user's first socket enters or
+last socket leaves a room - the diff waiting_room_updated broadcasts.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+SOCKETS_KEY = "presence:{room}:sockets"
+USERS_KEY = "presence:{room}:users"
+REPLICAS_KEY = "presence:replicas"
+ALIVE_KEY = "presence:replica:{replica_id}"
+MEMBERS_KEY = "presence:replica:{replica_id}:members"
+
+# KEYS sockets, users, members; ARGV sid, userId ('' when anonymous), member.
+# Returns {sockets the user now has in the room (0 = already present/anonymous), room socket count}
+JOIN_SCRIPT = """
+if redis.call('HSETNX', KEYS[1], ARGV[1], ARGV[2]) == 0 then
+    return {0, redis.call('HLEN', KEYS[1])}
+end
+redis.call('SADD', KEYS[3], ARGV[3])
+local count = 0
+if ARGV[2] ~= '' then
+    count = redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+end
+return {count, redis.call('HLEN', KEYS[1])}
+"""
+# KEYS sockets, users, members; ARGV sid, member.
+# Returns {userId, sockets the user has left in the room (-1 = socket wasn't there), room socket count}
+LEAVE_SCRIPT = """
+redis.call('SREM', KEYS[3], ARGV[2])
+local user = redis.call('HGET', KEYS[1], ARGV[1])
+if not user then
+    return {'', -1, redis.call('HLEN', KEYS[1])}
+end
+redis.call('HDEL', KEYS[1], ARGV[1])
+local left = 0
+if user ~= '' then
+    left = redis.call('HINCRBY', KEYS[2], user, -1)
+    if left <= 0 then
+        redis.call('HDEL', KEYS[2], user)
+        left = 0
+    end
+end
+return {user, left, redis.call('HLEN', KEYS[1])}
+"""
+
+
+@dataclass
+class PresenceChange:
+    room: str
+    user_id: str
+    joined: bool  # False when the user's last socket left
+
+
+class RoomPresence:
+    """
+    Args:
+        replica_id: unique id for this process
+        ttl_seconds: how long a replica's memberships survive without a heartbeat
+        redis: optional redis.asyncio client (decode_responses=True) shared by replicas
+    """
+
+    def __init__(self, replica_id: str, ttl_seconds: float = 30.0, redis=None):
+        self.replica_id = replica_id
+        self.ttl_seconds = ttl_seconds
+        self.redis = redis
+        # This replica's own sockets: room -> sid -> userId, room -> userId -> sockets, sid -> rooms
+        self._sockets: Dict[str, Dict[str, str]] = {}
+        self._users: Dict[str, Dict[str, int]] = {}
+        self._rooms_by_sid: Dict[str, Set[str]] = {}
+        # Last shared socket count seen per room, for logging without a round trip
+        self._sizes: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def use_redis(self, redis) -> None:
+        self.redis = redis
+
+    # ===== LIFECYCLE =====
+    async def start(self, on_reaped: Callable[[List[PresenceChange]], Awaitable[None]]) -> None:
+        """Heartbeat this replica and sweep dead ones; on_reaped gets the users they left behind"""
+        if not self.redis or self._task:
+            return
+        self._task = asyncio.create_task(self._heartbeat_loop(on_reaped))
+        logger.info(f"✅ Room presence in Redis: replica={self.replica_id} ttl={self.ttl_seconds}s")
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self.redis:
+            # Our sockets are gone with us - don't leave them for the TTL sweep
+            try:
+                await self._reap(self.replica_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Presence cleanup on shutdown failed, left to the TTL sweep: {e}")
+
+    # ===== MEMBERSHIP =====
+    async def join(self, room: str, sid: str, user_id: Optional[str] = None) -> Optional[PresenceChange]:
+        user = user_id or ""
+        first_here = self._join_local(room, sid, user)
+        if first_here is None:
+            return None
+        if not self.redis:
+            return PresenceChange(room, user, True) if first_here else None
+        try:
+            user_sockets, size = await self.redis.eval(
+                JOIN_SCRIPT, 3, *self._keys(room), sid, user, self._member(room, sid)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Presence join not recorded in Redis for {room}: {e}")
+            return None
+        self._sizes[room] = int(size)
+        return PresenceChange(room, user, True) if int(user_sockets) == 1 else None
+
+    async def join_many(self, rooms: Iterable[str], sid: str, user_id: Optional[str] = None) -> List[PresenceChange]:
+        """Reconnect: join several rooms with one Redis round trip (a pipeline of JOIN_SCRIPT calls)"""
+        user = user_id or ""
+        joined = []
+        for room in rooms:
+            first_here = self._join_local(room, sid, user)
+            if first_here is not None:
+                joined.append((room, first_here))
+        if not self.redis:
+            return [PresenceChange(room, user, True) for room, first_here in joined if first_here]
+        if not joined:
+            return []
+        pipe = self.redis.pipeline(transaction=False)
+        for room, _ in joined:
+            pipe.eval(JOIN_SCRIPT, 3, *self._keys(room), sid, user, self._member(room, sid))
+        try:
+            results = await pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Presence joins not recorded in Redis for socket {sid}: {e}")
+            return []
+        changes = []
+        for (room, _), (user_sockets, size) in zip(joined, results):
+            self._sizes[room] = int(size)
+            if int(user_sockets) == 1:
+                changes.append(PresenceChange(room, user, True))
+        return changes
+
+    async def leave(self, room: str, sid: str) -> Optional[PresenceChange]:
+        members = self._sockets.get(room, {})
+        if sid not in members:
+            return None
+        user = members.pop(sid)
+        if not members:
+            self._sockets.pop(room, None)
+        rooms = self._rooms_by_sid.get(sid)
+        if rooms is not None:
+            rooms.discard(room)
+            if not rooms:
+                del self._rooms_by_sid[sid]
+        last_here = False
+        if user:
+            users = self._users[room]
+            users[user] -= 1
+            if not users[user]:
+                del users[user]
+                last_here = True
+                if not users:
+                    del self._users[room]
+        if not self.redis:
+            return PresenceChange(room, user, False) if last_here else None
+        return await self._leave_shared(room, sid, self.replica_id)
+
+    async def leave_all(self, sid: str) -> List[PresenceChange]:
+        """Disconnect: leave every room the socket was tracked in"""
+        changes = []
+        for room in list(self._rooms_by_sid.get(sid, ())):
+            change = await self.leave(room, sid)
+            if change:
+                changes.append(change)
+        return changes
+
+    # ===== QUERIES (O(1) sizes) =====
+    async def socket_count(self, room: str) -> int:
+        if not self.redis:
+            return len(self._sockets.get(room, {}))
+        try:
+            size = int(await self.redis.hlen(SOCKETS_KEY.format(room=room)))
+        except Exception as e:
+            logger.warning(f"⚠️ Presence size unavailable for {room}: {e}")
+            return self.cached_socket_count(room)
+        self._sizes[room] = size
+        return size
+
+    async def user_count(self, room: str) -> int:
+        if not self.redis:
+            return len(self._users.get(room, {}))
+        return int(await self.redis.hlen(USERS_KEY.format(room=room)))
+
+    async def user_ids(self, room: str) -> List[str]:
+        if not self.redis:
+            return sorted(self._users.get(room, {}))
+        return sorted(await self.redis.hkeys(USERS_KEY.format(room=room)))
+
+    def cached_socket_count(self, room: str) -> int:
+        """Last known size without I/O - exact in process, as of the last join/leave/query with Redis"""
+        if not self.redis:
+            return len(self._sockets.get(room, {}))
+        return self._sizes.get(room, len(self._sockets.get(room, {})))
+
+    def local_members(self, room: str) -> Dict[str, str]:
+        """sid -> userId for this replica's sockets in the room"""
+        return dict(self._sockets.get(room, {}))
+
+    # ===== HEARTBEAT / SWEEP =====
+    async def heartbeat(self) -> List[PresenceChange]:
+        """Refresh this replica's TTL and remove the memberships of replicas whose TTL lapsed"""
+        await self.redis.set(ALIVE_KEY.format(replica_id=self.replica_id), "1", ex=max(1, int(self.ttl_seconds)))
+        await self.redis.sadd(REPLICAS_KEY, self.replica_id)
+        changes = []
+        for replica_id in await self.redis.smembers(REPLICAS_KEY):
+            if replica_id == self.replica_id:
+                continue
+            if not await self.redis.exists(ALIVE_KEY.format(replica_id=replica_id)):
+                logger.warning(f"🧹 Removing presence of lapsed replica {replica_id}")
+                changes.extend(await self._reap(replica_id))
+        return changes
+
+    async def _heartbeat_loop(self, on_reaped) -> None:
+        while True:
+            try:
+                changes = await self.heartbeat()
+                if changes:
+                    await on_reaped(changes)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Presence heartbeat failed: {e}")
+            await asyncio.sleep(self.ttl_seconds / 3)
+
+    async def _reap(self, replica_id: str) -> List[PresenceChange]:
+        members_key = MEMBERS_KEY.format(replica_id=replica_id)
+        changes = []
+        for member in await self.redis.smembers(members_key):
+            room, sid = member.rsplit("|", 1)
+            change = await self._leave_shared(room, sid, replica_id)
+            if change:
+                changes.append(change)
+        await self.redis.delete(members_key)
+        await self.redis.srem(REPLICAS_KEY, replica_id)
+        return changes
+
+    async def _leave_shared(self, room: str, sid: str, replica_id: str) -> Optional[PresenceChange]:
+        try:
+            user, user_sockets, size = await self.redis.eval(
+                LEAVE_SCRIPT, 3, *self._keys(room, replica_id), sid, self._member(room, sid)
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Presence leave not recorded in Redis for {room}: {e}")
+            return None
+        self._sizes[room] = int(size)
+        # Several replicas may sweep the same dead one; only the call that removed the socket reports it
+        return PresenceChange(room, user, False) if user and int(user_sockets) == 0 else None
+
+    def _join_local(self, room: str, sid: str, user: str) -> Optional[bool]:
+        """Record the socket in this replica; None if it was already in the room, else whether it's the user's first"""
+        members = self._sockets.setdefault(room, {})
+        if sid in members:
+            return None
+        members[sid] = user
+        self._rooms_by_sid.setdefault(sid, set()).add(room)
+        if not user:
+            return False
+        users = self._users.setdefault(room, {})
+        users[user] = users.get(user, 0) + 1
+        return users[user] == 1
+
+    def _keys(self, room: str, replica_id: Optional[str] = None) -> List[str]:
+        return [
+            SOCKETS_KEY.format(room=room),
+            USERS_KEY.format(room=room),
+            MEMBERS_KEY.format(replica_id=replica_id or self.replica_id),
+        ]
+
+    @staticmethod
+    def _member(room: str, sid: str) -> str:
+        return f"{room}|{sid}"
@@ -0,0 +1,84 @@
+"""
+Proxy (maximum) bidding.
+
+A participant registers a private maximum for the current lot. Competing
+maxima are resolved in one step into the visible bids they would have
+produced, so a minimum-increment bidding war becomes at most two accepted
+bids (challenger, then defender), each going through the normal acceptance
+path and its budget/roster rules. Maxima are stored on the auction document
+under proxyBids ({lotId, bids: {userId: {maxAmount, at}}}) and are never
+broadcast.
+"""
+from typing import Dict, List, Optional, Tuple
+
+PROXY_BID_INCREMENT = 1_000_000
+
+
+def current_proxies(auction: dict) -> Dict[str, dict]:
+    """Maxima registered for the auction's current lot (older lots' entries are ignored)"""
+    proxy_bids = auction.get("proxyBids") or {}
+    if not proxy_bids.get("lotId") or proxy_bids.get("lotId") != auction.get("currentLotId"):
+        return {}
+    return dict(proxy_bids.get("bids") or {})
+
+
+def proxy_set_updates(auction_id: str, lot_id: str, user_id: str, entry: dict) -> List[Tuple[dict, dict]]:
+    """
+    Query/update pairs registering entry for user_id on lot_id, tried in order:
+    add to this lot's proxies, or replace a previous lot's proxies with this one.
+    Both only match while lot_id is still the running lot.
+    """
+    running = {"id": auction_id, "status": "active", "currentLotId": lot_id}
+    return [
+        ({**running, "proxyBids.lotId": lot_id}, {"$set": {f"proxyBids.bids.{user_id}": entry}}),
+        ({**running, "proxyBids.lotId": {"$ne": lot_id}},
+         {"$set": {"proxyBids": {"lotId": lot_id, "bids": {user_id: entry}}}}),
+    ]
+
+
+def resolve_proxy_bids(
+    current_bid: Optional[float],
+    current_bidder_id: Optional[str],
+    proxies: Dict[str, dict],
+    increment: float = PROXY_BID_INCREMENT,
+) -> List[Tuple[str, float]]:
+    """
+    Visible bids the registered maxima produce against the current price.
+
+    Highest maximum wins, earlier registration breaks ties. The winner pays one
+    increment over the best competing level (capped at their maximum). When the
+    winner already leads, the best challenger's bid is emitted first so the
+    leader can answer it - the bid rules don't let a leader raise their own bid.
+
+    Args:
+        current_bid: Visible price (None/0 before the first bid)
+        current_bidder_id: User currently leading
+        proxies: {userId: {"maxAmount": float, "at": float}}
+
+    Returns:
+        [(userId, amount), ...] in the order they must be accepted (0-2 entries)
+    """
+    price = current_bid or 0
+    ranked = sorted(proxies.items(), key=lambda item: (-item[1]["maxAmount"], item[1].get("at", 0)))
+    if not ranked:
+        return []
+
+    top_user, top = ranked[0]
+    top_max = top["maxAmount"]
+    others = [(user, proxy["maxAmount"]) for user, proxy in ranked[1:]]
+
+    if top_user == current_bidder_id:
+        # Leader defends: the best challenger goes as high as it can without taking the lead
+        challengers = [(user, max_amount) for user, max_amount in others if max_amount > price]
+        if not challengers:
+            return []
+        challenger, challenger_max = challengers[0]
+        challenge = min(challenger_max, top_max - increment) if challenger_max >= top_max else challenger_max
+        if challenge <= price:
+            return []
+        return [(challenger, challenge), (top_user, min(top_max, challenge + increment))]
+
+    if top_max <= price:
+        return []
+    level = max([price] + [max_amount for _, max_amount in others])
+    return [(top_user, min(top_max, level + increment))]
@@ -0,0 +1,102 @@
+"""
+Per-bidder token bucket for the bid path.
+
+Each (auctionId, userId) gets a bucket of `burst` tokens refilled at `rate`
+per second; a bid takes one token. The check is in process and O(1): buckets
+live in an insertion-ordered dict, most recently used last, and a bucket that
+has been idle long enough to refill completely is dropped (recreating it full
+is equivalent), so memory only holds active bidders.
+
+With a Redis client attached the same bucket is also kept in Redis so the
+limit holds across replicas. The local bucket still answers first - it never
+holds fewer tokens than the shared one, so a local rejection needs no round
+trip. Redis errors fail open to the local decision.
+"""
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Tuple
+
+logger = logging.getLogger(__name__)
+
+REDIS_KEY = "bid-rate:{key}"
+
+# KEYS[1] bucket, ARGV[1] tokens per second, ARGV[2] burst. Uses the Redis clock so replicas agree.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local clock = redis.call('TIME')
+local now = tonumber(clock[1]) * 1000 + math.floor(tonumber(clock[2]) / 1000)
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - ts) * rate / 1000)
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return allowed
+"""
+
+
+class TokenBucketLimiter:
+    """
+    Args:
+        rate: tokens added per second
+        burst: bucket size (bids allowed back to back)
+        redis: optional redis.asyncio client shared by replicas
+    """
+
+    def __init__(self, rate: float, burst: int, redis=None):
+        self.rate = rate
+        self.burst = burst
+        self.redis = redis
+        self.refill_seconds = burst / rate
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+
+    def use_redis(self, redis) -> None:
+        self.redis = redis
+
+    async def allow(self, key: str) -> bool:
+        """Take a token for key; False when the bucket is empty"""
+        if not self.take_local(key, time.monotonic()):
+            return False
+        if not self.redis:
+            return True
+        try:
+            return bool(await self.redis.eval(
+                TOKEN_BUCKET_SCRIPT, 1, REDIS_KEY.format(key=key), self.rate, self.burst
+            ))
+        except Exception as e:
+            logger.warning(f"⚠️ Shared bid rate limit unavailable, using local bucket: {e}")
+            return True
+
+    def take_local(self, key: str, now: float) -> bool:
+        bucket = self._buckets.pop(key, None)
+        tokens = self.burst if bucket is None else min(self.burst, bucket[0] + (now - bucket[1]) * self.rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        self._buckets[key] = (tokens, now)
+        self._evict_refilled(now)
+        return allowed
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _evict_refilled(self, now: float) -> None:
+        # Least recently used first: stop at the first bucket that could still be short of tokens
+        while self._buckets:
+            key, (_, last) = next(iter(self._buckets.items()))
+            if now - last < self.refill_seconds:
+                break
+            del self._buckets[key]
+
+
+def retry_after_seconds(rate: float) -> int:
+    """Whole seconds until at least one token is back"""
+    return max(1, math.ceil(1 / rate))
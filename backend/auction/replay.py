@@ -0,0 +1,73 @@
+"""
+Per-auction replay buffer for resumable socket streams.
+
+State-changing auction events (bid_update, anti_snipe, sold, lot_started,
+pause/resume, auction_complete) are stamped with a per-auction streamSeq and
+kept in a bounded ring buffer. A client that reconnects with the last
+(streamId, streamSeq) it saw is sent only the events it missed; if the gap is
+older than the buffer, or the stream restarted (new streamId), it falls back
+to a full auction_snapshot.
+
+Single-replica only: each process numbers the events it emits itself, so
+server.py enables this via FEATURE_EVENT_REPLAY.
+"""
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, List, Optional, Tuple
+
+DEFAULT_BUFFER_SIZE = 256
+
+
+@dataclass
+class AuctionStream:
+    stream_id: str
+    seq: int = 0
+    events: Deque[Tuple[int, str, dict]] = field(default_factory=deque)
+
+
+class AuctionEventLog:
+    """
+    Args:
+        buffer_size: events kept per auction
+    """
+
+    def __init__(self, buffer_size: int = DEFAULT_BUFFER_SIZE):
+        self.buffer_size = buffer_size
+        self._streams: Dict[str, AuctionStream] = {}
+
+    def record(self, auction_id: str, event: str, payload: dict) -> dict:
+        """Stamp payload with the next streamSeq, buffer it and return the stamped copy"""
+        stream = self._stream(auction_id)
+        stream.seq += 1
+        stamped = {**payload, "auctionId": auction_id, "streamId": stream.stream_id, "streamSeq": stream.seq}
+        stream.events.append((stream.seq, event, stamped))
+        return stamped
+
+    def position(self, auction_id: str) -> dict:
+        """Current stream position, sent with snapshots so clients can resume from it"""
+        stream = self._stream(auction_id)
+        return {"auctionId": auction_id, "streamId": stream.stream_id, "streamSeq": stream.seq}
+
+    def since(self, auction_id: str, stream_id: Optional[str], seq: Optional[int]) -> Optional[List[Tuple[str, dict]]]:
+        """
+        Events after seq as (event, payload) pairs, oldest first. None means the
+        client can't resume (unknown stream, or seq older than the buffer).
+        """
+        stream = self._streams.get(auction_id)
+        if not stream or stream_id != stream.stream_id or not isinstance(seq, int) or seq > stream.seq:
+            return None
+        oldest = stream.events[0][0] if stream.events else stream.seq + 1
+        if seq + 1 < oldest:
+            return None
+        return [(event, payload) for event_seq, event, payload in stream.events if event_seq > seq]
+
+    def drop(self, auction_id: str) -> None:
+        self._streams.pop(auction_id, None)
+
+    def _stream(self, auction_id: str) -> AuctionStream:
+        stream = self._streams.get(auction_id)
+        if stream is None:
+            stream = AuctionStream(stream_id=uuid.uuid4().hex, events=deque(maxlen=self.buffer_size))
+            self._streams[auction_id] = stream
+        return stream
@@ -0,0 +1,91 @@
+"""
+League -> active auction index, so reconnects can rejoin rooms without queries.
+
+A socket belongs in league:{id} for each of its user's leagues (the socket
+session's leagueIds, kept current by SocketSessionIndex) and in the stream
+rooms of each of those leagues' active auction. This index answers the second
+half. It is seeded from Mongo once at startup and kept current by the auction
+lifecycle: start/begin/resume activate an entry, and pause, completion, reset
+and deletion clear it.
+
+Without Redis it is a dict in process. With a client attached the entries
+live in one shared hash, so a rejoin is a single HMGET whichever replica ran
+the transition.
+"""
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_AUCTIONS_KEY = "rooms:active-auctions"
+
+# KEYS hash; ARGV leagueId, auctionId. Clears the entry only if it still names this auction,
+# so a late completion can't drop the auction that replaced it
+DEACTIVATE_SCRIPT = """
+if redis.call('HGET', KEYS[1], ARGV[1]) == ARGV[2] then
+    return redis.call('HDEL', KEYS[1], ARGV[1])
+end
+return 0
+"""
+
+
+class ActiveAuctionIndex:
+    """
+    Args:
+        redis: optional redis.asyncio client (decode_responses=True) shared by replicas
+    """
+
+    def __init__(self, redis=None):
+        self.redis = redis
+        self._active: Dict[str, str] = {}  # leagueId -> auctionId
+
+    def use_redis(self, redis) -> None:
+        self.redis = redis
+
+    async def seed(self, pairs: Iterable[Tuple[str, str]]) -> None:
+        """(leagueId, auctionId) of every active auction; existing shared entries win (set by live transitions)"""
+        pairs = list(pairs)
+        if not self.redis:
+            self._active.update(pairs)
+            return
+        if not pairs:
+            return
+        pipe = self.redis.pipeline(transaction=False)
+        for league_id, auction_id in pairs:
+            pipe.hsetnx(ACTIVE_AUCTIONS_KEY, league_id, auction_id)
+        try:
+            await pipe.execute()
+        except Exception as e:
+            logger.warning(f"⚠️ Active auction index not seeded in Redis: {e}")
+
+    async def activate(self, league_id: str, auction_id: str) -> None:
+        if not self.redis:
+            self._active[league_id] = auction_id
+            return
+        try:
+            await self.redis.hset(ACTIVE_AUCTIONS_KEY, league_id, auction_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Active auction {auction_id} not indexed, reconnecting sockets miss its rooms: {e}")
+
+    async def deactivate(self, league_id: str, auction_id: str) -> None:
+        if not self.redis:
+            if self._active.get(league_id) == auction_id:
+                del self._active[league_id]
+            return
+        try:
+            await self.redis.eval(DEACTIVATE_SCRIPT, 1, ACTIVE_AUCTIONS_KEY, league_id, auction_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Auction {auction_id} not removed from the active index: {e}")
+
+    async def lookup(self, league_ids: List[str]) -> Optional[List[str]]:
+        """Active auction ids for these leagues, or None when the shared index can't be read"""
+        if not league_ids:
+            return []
+        if not self.redis:
+            return [self._active[league_id] for league_id in league_ids if league_id in self._active]
+        try:
+            auction_ids = await self.redis.hmget(ACTIVE_AUCTIONS_KEY, league_ids)
+        except Exception as e:
+            logger.warning(f"⚠️ Active auction index unavailable: {e}")
+            return None
+        return [auction_id for auction_id in auction_ids if auction_id]
@@ -0,0 +1,151 @@
+"""
+Sealed-bid batch rounds.
+
+Instead of one live lot at a time, a sealed-mode auction opens a round of up to
+sealedRoundSize lots together. Bids are private and collected until the round
+closes; the whole round is then resolved in one pass and settled lot by lot
+through the normal settlement writes. There is no per-lot timer, tick stream or
+anti-snipe: one deadline per round (a lot timer on the round's lot id, so it
+gets the same lease and takeover as live lots, minus the ticks), one results
+event per round.
+
+Resolution is greedy over every bid in the round, highest first (earlier bid
+breaks ties). A bid wins its lot if the lot is still open and the bidder can
+still afford it under the usual bid rules, given the lots they have already
+won in this round - so a manager who bids on more lots than their budget or
+roster allows keeps their strongest bids and loses the rest.
+
+The resolved awards are recorded on the round before any lot is settled, so a
+retried or taken-over settlement replays the same awards instead of resolving
+again against budgets the first attempt already charged.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+
+from auction.bidding import BidRejected, validate_bid
+
+LIVE = "live"
+SEALED = "sealed"
+
+SECOND_PRICE = "second"
+FIRST_PRICE = "first"
+
+
+@dataclass
+class SealedAward:
+    club_id: str
+    user_id: Optional[str] = None  # None = unsold
+    amount: Optional[float] = None  # Price paid
+    bid_count: int = 0
+
+
+def award_record(award: SealedAward) -> dict:
+    """Stored form of an award (sealedRound.awards)"""
+    return {"clubId": award.club_id, "userId": award.user_id, "amount": award.amount, "bidCount": award.bid_count}
+
+
+def award_from_record(record: dict) -> SealedAward:
+    return SealedAward(record["clubId"], record.get("userId"), record.get("amount"), record.get("bidCount", 0))
+
+
+def round_lot_id(auction_id: str, round_number: int) -> str:
+    """currentLotId while a round is open (there is no single lot on the block)"""
+    return f"{auction_id}-round-{round_number}"
+
+
+def is_round_lot_id(lot_id: str) -> bool:
+    return "-round-" in lot_id
+
+
+def next_round_clubs(upcoming: List[str], unsold_clubs: List[str], round_size: int) -> List[str]:
+    """
+    Clubs for the next round: the rest of the initial queue first (upcoming = the
+    queue window from the current lot), then unsold re-offers. A round never mixes
+    the two, so a round of re-offers that sells nothing tells the caller the
+    auction is exhausted.
+    """
+    if upcoming:
+        return list(upcoming[:round_size])
+    return list(unsold_clubs[:round_size])
+
+
+def _can_afford(user_id: str, club_id: str, amount: float, budget: dict,
+                club_slots: int, minimum_budget: float) -> bool:
+    try:
+        validate_bid(
+            user_id=user_id,
+            amount=amount,
+            minimum_budget=minimum_budget,
+            budget_remaining=budget["budgetRemaining"],
+            clubs_won_count=budget["clubsWon"],
+            club_slots=club_slots,
+            current_club_id=club_id,
+            current_bid=None,
+            current_bidder_id=None,
+        )
+    except BidRejected:
+        return False
+    return True
+
+
+def resolve_sealed_round(
+    club_ids: Iterable[str],
+    bids: Iterable[dict],
+    participants: Iterable[dict],
+    club_slots: int,
+    minimum_budget: float,
+    pricing: str = SECOND_PRICE,
+) -> List[SealedAward]:
+    """
+    Allocate every lot in a round.
+
+    Args:
+        club_ids: Lots in the round, in display order
+        bids: [{"clubId", "userId", "amount", "at"}] - at most one per user per lot
+        participants: League participant documents (budgetRemaining, clubsWon)
+        pricing: SECOND_PRICE pays the best competing bid that could still have won
+            (at least the minimum, at most the winner's own bid); FIRST_PRICE pays the bid
+
+    Returns:
+        One SealedAward per club, in club_ids order
+    """
+    club_ids = list(club_ids)
+    awards = {club_id: SealedAward(club_id) for club_id in club_ids}
+    budgets = {
+        p["userId"]: {"budgetRemaining": p.get("budgetRemaining", 0), "clubsWon": len(p.get("clubsWon", []))}
+        for p in participants
+    }
+
+    by_club: Dict[str, List[dict]] = {club_id: [] for club_id in club_ids}
+    for bid in bids:
+        if bid["clubId"] in by_club and bid["userId"] in budgets:
+            by_club[bid["clubId"]].append(bid)
+    for club_id, club_bids in by_club.items():
+        awards[club_id].bid_count = len(club_bids)
+
+    ranked = sorted(
+        (bid for club_bids in by_club.values() for bid in club_bids),
+        key=lambda bid: (-bid["amount"], bid.get("at", 0)),
+    )
+    for bid in ranked:
+        award = awards[bid["clubId"]]
+        user_id = bid["userId"]
+        if award.user_id or not _can_afford(user_id, award.club_id, bid["amount"], budgets[user_id],
+                                            club_slots, minimum_budget):
+            continue
+
+        price = bid["amount"]
+        if pricing == SECOND_PRICE:
+            competing = [
+                other["amount"] for other in by_club[award.club_id]
+                if other["userId"] != user_id and _can_afford(
+                    other["userId"], award.club_id, other["amount"], budgets[other["userId"]],
+                    club_slots, minimum_budget)
+            ]
+            price = min(bid["amount"], max(competing + [minimum_budget]))
+
+        award.user_id, award.amount = user_id, price
+        budgets[user_id]["budgetRemaining"] -= price
+        budgets[user_id]["clubsWon"] += 1
+
+    return [awards[club_id] for club_id in club_ids]
@@ -0,0 +1,142 @@
+"""
+Membership upkeep for authenticated socket sessions.
+
+connect verifies the client's JWT once and stores userId, displayName and the
+user's leagueIds in the Socket.IO session, so room joins and socket bids read
+identity from the session instead of trusting payloads and querying Mongo.
+
+Sessions live in the replica that holds the socket. This index maps users and
+leagues to the sids of this replica's authenticated sockets, so join_league and
+league deletion can patch the affected sessions. With a Redis client attached
+the change is also published and every other replica patches its own.
+"""
+import asyncio
+import json
+import logging
+from typing import Dict, Iterable, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "socket:membership-events"
+LEAGUE_JOINED = "league_joined"
+LEAGUE_DELETED = "league_deleted"
+
+
+class SocketSessionIndex:
+    """
+    Args:
+        sio: the Socket.IO server (sessions are patched through sio.session(sid))
+        replica_id: unique id for this process
+        redis: optional redis.asyncio client (decode_responses=True) shared by replicas
+    """
+
+    def __init__(self, sio, replica_id: str, redis=None):
+        self.sio = sio
+        self.replica_id = replica_id
+        self.redis = redis
+        self._sockets: Dict[str, Tuple[str, Set[str]]] = {}  # sid -> (userId, leagueIds)
+        self._by_user: Dict[str, Set[str]] = {}
+        self._by_league: Dict[str, Set[str]] = {}
+        self._task = None
+
+    def use_redis(self, redis) -> None:
+        self.redis = redis
+
+    # ===== LIFECYCLE =====
+    async def start(self) -> None:
+        if self.redis and not self._task:
+            self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    # ===== LOCAL SOCKETS =====
+    def track(self, sid: str, user_id: str, league_ids: Iterable[str]) -> None:
+        leagues = set(league_ids)
+        self._sockets[sid] = (user_id, leagues)
+        self._by_user.setdefault(user_id, set()).add(sid)
+        for league_id in leagues:
+            self._by_league.setdefault(league_id, set()).add(sid)
+
+    def untrack(self, sid: str) -> None:
+        entry = self._sockets.pop(sid, None)
+        if not entry:
+            return
+        user_id, leagues = entry
+        _discard(self._by_user, user_id, sid)
+        for league_id in leagues:
+            _discard(self._by_league, league_id, sid)
+
+    def sids_for_user(self, user_id: str) -> Set[str]:
+        return set(self._by_user.get(user_id, ()))
+
+    def __len__(self) -> int:
+        return len(self._sockets)
+
+    # ===== MEMBERSHIP CHANGES =====
+    async def league_joined(self, user_id: str, league_id: str) -> None:
+        await self._publish_and_apply({"action": LEAGUE_JOINED, "userId": user_id, "leagueId": league_id})
+
+    async def league_deleted(self, league_id: str) -> None:
+        await self._publish_and_apply({"action": LEAGUE_DELETED, "leagueId": league_id})
+
+    async def _publish_and_apply(self, event: dict) -> None:
+        await self._apply(event)
+        if self.redis:
+            try:
+                await self.redis.publish(EVENTS_CHANNEL, json.dumps({**event, "origin": self.replica_id}))
+            except Exception as e:
+                logger.warning(f"⚠️ Socket membership change not published, other replicas keep stale sessions: {e}")
+
+    async def _apply(self, event: dict) -> None:
+        league_id = event["leagueId"]
+        if event["action"] == LEAGUE_JOINED:
+            for sid in self.sids_for_user(event["userId"]):
+                leagues = self._sockets[sid][1]
+                if league_id in leagues:
+                    continue
+                leagues.add(league_id)
+                self._by_league.setdefault(league_id, set()).add(sid)
+                await self._patch_session(sid, sorted(leagues))
+        elif event["action"] == LEAGUE_DELETED:
+            for sid in self._by_league.pop(league_id, set()):
+                leagues = self._sockets[sid][1]
+                leagues.discard(league_id)
+                await self._patch_session(sid, sorted(leagues))
+
+    async def _patch_session(self, sid: str, league_ids) -> None:
+        try:
+            async with self.sio.session(sid) as session:
+                session["leagueIds"] = league_ids
+        except KeyError:
+            # Disconnected between the lookup and the patch
+            self.untrack(sid)
+
+    async def _listen(self) -> None:
+        while True:
+            pubsub = self.redis.pubsub()
+            try:
+                await pubsub.subscribe(EVENTS_CHANNEL)
+                async for message in pubsub.listen():
+                    if message.get("type") != "message":
+                        continue
+                    event = json.loads(message["data"])
+                    if event.get("origin") != self.replica_id:
+                        await self._apply(event)
+            except asyncio.CancelledError:
+                await pubsub.close()
+                raise
+            except Exception as e:
+                logger.error(f"Socket membership subscription failed, resubscribing: {e}")
+                await pubsub.close()
+                await asyncio.sleep(1)
+
+
+def _discard(index: Dict[str, Set[str]], key: str, sid: str) -> None:
+    sids = index.get(key)
+    if sids is not None:
+        sids.discard(sid)
+        if not sids:
+            del index[key]
@@ -0,0 +1,135 @@
+"""
+Lot settlement as atomic, guarded Mongo updates.
+
+Every write is a single update whose filter encodes the idempotency check, so
+concurrent or repeated settlement of the same lot can never double-award a club
+or double-charge a budget:
+- award: $push clubsWon guarded by clubsWon $ne, $inc totalSpent / budgetRemaining
+- unsold: $push unsoldClubs guarded by the lot's identity (a club re-offered from
+  unsoldClubs is no longer in it, so membership can't tell a repeat apart)
+- re-offer: $pop the head of unsoldClubs, returning the popped club
+- completion counters on the auction: $inc from the winner's post-award document,
+  in the same write that adds the club to the auction's soldClubs set and bumps
+  participantsVersion (the version clients use to apply participant deltas)
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from pymongo import ReturnDocument
+
+from auction.completion import award_counter_increments
+
+SOLD = "sold"
+UNSOLD = "unsold"
+ALREADY_SETTLED = "already_settled"
+PARTICIPANT_MISSING = "participant_missing"
+
+# Participant fields broadcast to the room (no email)
+# Lots settled unsold are remembered as "<lotId>:<clubId>"; repeats come within a lot or two,
+# so only the latest keys are kept (at least a full sealed round's worth)
+UNSOLD_LOT_KEYS_KEPT = 100
+
+PUBLIC_PARTICIPANT_FIELDS = {"_id": 0, "userId": 1, "userName": 1, "clubsWon": 1, "budgetRemaining": 1, "totalSpent": 1}
+
+
+@dataclass
+class Settlement:
+    outcome: str
+    counters: Optional[dict] = None  # Updated "completion" subdocument, when it changed
+    participant: Optional[dict] = None  # Winner's post-award public fields (SOLD only)
+    participants_version: Optional[int] = None  # Auction's participantsVersion after the award
+
+
+def award_club_update(league_id: str, user_id: str, club_id: str, amount: float) -> Tuple[dict, dict]:
+    """Query/update pair awarding club_id to user_id (matches nothing if already awarded)"""
+    query = {"leagueId": league_id, "userId": user_id, "clubsWon": {"$ne": club_id}}
+    update = {
+        "$push": {"clubsWon": club_id},
+        "$inc": {"totalSpent": amount, "budgetRemaining": -amount},
+    }
+    return query, update
+
+
+def unsold_lot_key(lot_id: str, club_id: str) -> str:
+    return f"{lot_id}:{club_id}"
+
+
+def unsold_push_update(auction_id: str, lot_id: str, club_id: str) -> Tuple[dict, dict]:
+    """Query/update pair queueing club_id for re-offer (matches nothing if this lot already settled unsold)"""
+    key = unsold_lot_key(lot_id, club_id)
+    return (
+        {"id": auction_id, "unsoldLotKeys": {"$ne": key}},
+        {"$push": {
+            "unsoldClubs": club_id,
+            "unsoldLotKeys": {"$each": [key], "$slice": -UNSOLD_LOT_KEYS_KEPT},
+        }},
+    )
+
+
+async def settle_lot(db, auction: dict, league: dict, club_id: str, winning_bid: Optional[dict], lot_id: str,
+                     session=None) -> Settlement:
+    """
+    Apply the outcome of a lot: one guarded write, plus one auction update when sold.
+    lot_id identifies the lot being settled (a sealed round's lot id for each club in it).
+
+    The outcome is SOLD / UNSOLD when this call settled the lot, ALREADY_SETTLED when
+    an earlier trigger did, or PARTICIPANT_MISSING when the winner has no participant row.
+    """
+    if not winning_bid:
+        query, update = unsold_push_update(auction["id"], lot_id, club_id)
+        result = await db.auctions.update_one(query, update, session=session)
+        return Settlement(UNSOLD if result.modified_count else ALREADY_SETTLED)
+
+    query, update = award_club_update(
+        auction["leagueId"], winning_bid["userId"], club_id, winning_bid["amount"]
+    )
+    winner = await db.league_participants.find_one_and_update(
+        query, update,
+        projection=PUBLIC_PARTICIPANT_FIELDS,
+        return_document=ReturnDocument.AFTER,
+        session=session,
+    )
+    if not winner:
+        # Guard failed - tell "already awarded" apart from "no such participant"
+        exists = await db.league_participants.find_one(
+            {"leagueId": auction["leagueId"], "userId": winning_bid["userId"]},
+            {"_id": 1},
+            session=session,
+        )
+        return Settlement(ALREADY_SETTLED if exists else PARTICIPANT_MISSING)
+
+    increments = award_counter_increments(
+        winner, league.get("clubSlots", 3), auction.get("minimumBudget", 1000000.0)
+    )
+    sale = {"$addToSet": {"soldClubs": club_id}, "$inc": {"participantsVersion": 1}}
+    counter_inc = {f"completion.{field}": value for field, value in increments.items()}
+    updated = await db.auctions.find_one_and_update(
+        {"id": auction["id"], "completion": {"$exists": True}},
+        {**sale, "$inc": {**sale["$inc"], **counter_inc}},
+        projection={"_id": 0, "completion": 1, "participantsVersion": 1},
+        return_document=ReturnDocument.AFTER,
+        session=session,
+    )
+    counters = (updated or {}).get("completion")
+    if not updated:
+        # Counters not seeded yet - still record the sale
+        updated = await db.auctions.find_one_and_update(
+            {"id": auction["id"]}, sale,
+            projection={"_id": 0, "participantsVersion": 1},
+            return_document=ReturnDocument.AFTER,
+            session=session,
+        )
+    return Settlement(SOLD, counters, winner, (updated or {}).get("participantsVersion"))
+
+
+async def pop_unsold_club(db, auction_id: str) -> Optional[str]:
+    """Atomically take the first club off the unsold queue (None if it is empty)"""
+    before = await db.auctions.find_one_and_update(
+        {"id": auction_id, "unsoldClubs.0": {"$exists": True}},
+        {"$pop": {"unsoldClubs": -1}},
+        projection={"_id": 0, "unsoldClubs": {"$slice": 1}},
+        return_document=ReturnDocument.BEFORE,
+    )
+    if not before or not before.get("unsoldClubs"):
+        return None
+    return before["unsoldClubs"][0]
@@ -0,0 +1,76 @@
+"""
+Per-auction single-flight guard for lot settlement.
+
+Concurrent complete_lot calls for the same auction collapse onto the first
+one: later callers await its result instead of repeating the reads, awards
+and broadcasts. With a Redis client attached, a short SET NX lock extends the
+guard across replicas - a replica that finds another one settling skips.
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+LOCK_KEY = "auction:settle-lock:{key}"
+
+# Only the holder may release the lock
+RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class SingleFlight:
+    """
+    Args:
+        redis: optional redis.asyncio client (decode_responses=True) for the cross-replica lock
+        owner: value stored in the lock so only this process releases it
+        lock_ttl: seconds before a crashed holder's lock expires
+    """
+
+    def __init__(self, redis=None, owner: str = "", lock_ttl: float = 30.0):
+        self.redis = redis
+        self.owner = owner
+        self.lock_ttl_ms = int(lock_ttl * 1000)
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    def use_redis(self, redis, owner: str) -> None:
+        self.redis = redis
+        self.owner = owner
+
+    async def run(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run fn() unless a call for key is already running; then share its result"""
+        task = self._inflight.get(key)
+        if task:
+            metrics.increment_settlement_collapsed("local")
+            logger.info(f"🔒 Settlement for {key} already running, awaiting it")
+            return await asyncio.shield(task)
+
+        task = asyncio.create_task(self._run_locked(key, fn))
+        self._inflight[key] = task
+        task.add_done_callback(lambda t: self._forget(key, t))
+        # Shielded so a cancelled caller doesn't abort a settlement others are waiting on
+        return await asyncio.shield(task)
+
+    def _forget(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    async def _run_locked(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Optional[Any]:
+        if not self.redis:
+            return await fn()
+
+        lock_key = LOCK_KEY.format(key=key)
+        if not await self.redis.set(lock_key, self.owner, nx=True, px=self.lock_ttl_ms):
+            metrics.increment_settlement_collapsed("remote")
+            logger.info(f"🔒 Settlement for {key} running on another replica, skipping")
+            return None
+        try:
+            return await fn()
+        finally:
+            await self.redis.eval(RELEASE_SCRIPT, 1, lock_key, self.owner)
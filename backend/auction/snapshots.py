@@ -0,0 +1,75 @@
+"""
+Versioned auction_snapshot cache for late joiners.
+
+The snapshot only changes when the auction does (a bid, a lot transition, a
+status change or a settlement), so it is built once per version and shared by
+every socket that joins while that version is current. Concurrent joiners that
+miss the cache await the same build instead of repeating its reads.
+"""
+import asyncio
+import logging
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def snapshot_version(auction: dict) -> tuple:
+    """Everything in the snapshot that can change without bidSequence moving"""
+    return (
+        auction.get("bidSequence", 0),
+        auction.get("currentLot", 0),
+        auction.get("status"),
+        auction.get("timerEndsAt"),
+        len(auction.get("soldClubs") or []),
+        len(auction.get("unsoldClubs") or []),
+    )
+
+
+def sold_club_ids(auction: dict, participants: list) -> list:
+    """
+    Clubs that have been awarded. Auctions created before soldClubs was tracked
+    fall back to the participants' rosters (never to bids - a bid is not a sale).
+    """
+    if auction.get("soldClubs") is not None:
+        return list(auction["soldClubs"])
+    sold = []
+    for participant in participants:
+        for club_id in participant.get("clubsWon", []):
+            if club_id not in sold:
+                sold.append(club_id)
+    return sold
+
+
+class AuctionSnapshotCache:
+    """Latest snapshot per auction, keyed by snapshot_version"""
+
+    def __init__(self):
+        self._snapshots: Dict[str, Tuple[tuple, dict]] = {}
+        self._building: Dict[Tuple[str, tuple], asyncio.Task] = {}
+
+    async def get(self, auction_id: str, version: tuple,
+                  build: Callable[[], Awaitable[Optional[dict]]]) -> Optional[dict]:
+        """Return the snapshot for version, building it at most once per version"""
+        cached = self._snapshots.get(auction_id)
+        if cached and cached[0] == version:
+            return cached[1]
+
+        key = (auction_id, version)
+        task = self._building.get(key)
+        if task is None:
+            task = asyncio.create_task(self._build(auction_id, version, build))
+            self._building[key] = task
+            task.add_done_callback(lambda t: self._building.pop(key, None))
+        return await asyncio.shield(task)
+
+    def drop(self, auction_id: str) -> None:
+        self._snapshots.pop(auction_id, None)
+
+    async def _build(self, auction_id: str, version: tuple,
+                     build: Callable[[], Awaitable[Optional[dict]]]) -> Optional[dict]:
+        snapshot = await build()
+        if snapshot is not None:
+            # A slow build of an older version only costs a rebuild: lookups match on equality
+            self._snapshots[auction_id] = (version, snapshot)
+            logger.info(f"📸 Auction snapshot built for {auction_id} version={version}")
+        return snapshot
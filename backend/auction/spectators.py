@@ -0,0 +1,163 @@
+"""
+Read-only spectator feed for the /spectate Socket.IO namespace.
+
+Watchers never enter the bidders' auction:{id} rooms, so they get no ticks,
+no per-bid frames and no join_auction snapshot work. Each auction a
+spectator watches on this replica instead gets one coalesced frame every
+interval_seconds, and only when the auction changed: a probe reads the
+auction's version, and the frame is rebuilt and serialized (UTF-8 JSON
+bytes) once per version. The same bytes are then sent to every watcher on
+this replica, and to each new watcher as-is.
+
+Every replica publishes to its own watchers only (the emit bypasses the
+Socket.IO Redis queue), so the watcher count changes neither what the
+bidder path does nor how often the auction is read.
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+
+from auction.wire import FastJson
+
+logger = logging.getLogger(__name__)
+
+SPECTATOR_NAMESPACE = "/spectate"
+SPECTATOR_FRAME_EVENT = "spectator_frame"
+
+# probe(auction_id) -> (version, auction doc) or None when the auction is gone
+Probe = Callable[[str], Awaitable[Optional[Tuple[tuple, dict]]]]
+# build(auction doc, previous view or None) -> view; the previous view lets unchanged parts be reused
+Build = Callable[[dict, Optional[dict]], Awaitable[dict]]
+# emit(auction_id, frame) -> sends the frame to this replica's watchers
+Emit = Callable[[str, bytes], Awaitable[None]]
+
+
+def spectator_room(auction_id: str) -> str:
+    return f"spectate:{auction_id}"
+
+
+@dataclass
+class SpectatorFrame:
+    version: tuple
+    view: dict
+    data: bytes  # Serialized once, shared by every watcher
+    checked_at: float  # Monotonic time of the last probe that confirmed this version
+
+
+class SpectatorFeed:
+    """
+    Args:
+        probe: cheap read of an auction's current version
+        build: spectator view for an auction doc (only called when the version changed)
+        interval_seconds: update cadence, also how stale a frame may be when handed to a new watcher
+    """
+
+    def __init__(self, probe: Probe, build: Build, interval_seconds: float = 2.0):
+        self.probe = probe
+        self.build = build
+        self.interval_seconds = interval_seconds
+        self._watching: Dict[str, str] = {}  # sid -> auctionId
+        self._watchers: Dict[str, Set[str]] = {}  # auctionId -> sids
+        self._frames: Dict[str, SpectatorFrame] = {}
+        self._published: Dict[str, tuple] = {}  # auctionId -> version last sent to the room
+        self._refreshing: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    # ===== LIFECYCLE =====
+    async def start(self, emit: Emit) -> None:
+        if not self._task:
+            self._task = asyncio.create_task(self._publish_loop(emit))
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    # ===== WATCHERS =====
+    def watch(self, sid: str, auction_id: str) -> Optional[str]:
+        """Start watching auction_id; returns the auction this socket watched before, if another"""
+        previous = self.unwatch(sid) if self._watching.get(sid) != auction_id else None
+        self._watching[sid] = auction_id
+        self._watchers.setdefault(auction_id, set()).add(sid)
+        return previous
+
+    def unwatch(self, sid: str) -> Optional[str]:
+        auction_id = self._watching.pop(sid, None)
+        if auction_id is None:
+            return None
+        sids = self._watchers.get(auction_id)
+        if sids is not None:
+            sids.discard(sid)
+            if not sids:
+                # Nobody left here - stop reading the auction
+                del self._watchers[auction_id]
+                self._frames.pop(auction_id, None)
+                self._published.pop(auction_id, None)
+        return auction_id
+
+    def watcher_count(self, auction_id: str) -> int:
+        return len(self._watchers.get(auction_id, ()))
+
+    # ===== FRAMES =====
+    async def frame(self, auction_id: str) -> Optional[bytes]:
+        """Current frame for a new watcher; at most interval_seconds old, so join waves reuse it"""
+        cached = self._frames.get(auction_id)
+        if cached and time.monotonic() - cached.checked_at < self.interval_seconds:
+            return cached.data
+        refreshed = await self.refresh(auction_id)
+        return refreshed.data if refreshed else None
+
+    async def refresh(self, auction_id: str) -> Optional[SpectatorFrame]:
+        """Probe the auction and rebuild the frame if its version moved; concurrent callers share one refresh"""
+        task = self._refreshing.get(auction_id)
+        if task is None:
+            task = asyncio.create_task(self._refresh(auction_id))
+            self._refreshing[auction_id] = task
+            task.add_done_callback(lambda t: self._refreshing.pop(auction_id, None))
+        return await asyncio.shield(task)
+
+    async def publish(self, emit: Emit) -> int:
+        """Send every watched auction's frame whose version changed since the last publish"""
+        sent = 0
+        for auction_id in list(self._watchers):
+            try:
+                frame = await self.refresh(auction_id)
+            except Exception as e:
+                logger.warning(f"⚠️ Spectator frame for auction {auction_id} not refreshed: {e}")
+                continue
+            if not frame or self._published.get(auction_id) == frame.version:
+                continue
+            if auction_id not in self._watchers:
+                continue  # Last watcher left while the frame was built
+            self._published[auction_id] = frame.version
+            await emit(auction_id, frame.data)
+            sent += 1
+        return sent
+
+    async def _refresh(self, auction_id: str) -> Optional[SpectatorFrame]:
+        probed = await self.probe(auction_id)
+        if probed is None:
+            self._frames.pop(auction_id, None)
+            return None
+        version, auction = probed
+        cached = self._frames.get(auction_id)
+        if cached and cached.version == version:
+            cached.checked_at = time.monotonic()
+            return cached
+        view = await self.build(auction, cached.view if cached else None)
+        frame = SpectatorFrame(version, view, FastJson.dumps(view).encode(), time.monotonic())
+        if auction_id in self._watchers:
+            self._frames[auction_id] = frame
+        return frame
+
+    async def _publish_loop(self, emit: Emit) -> None:
+        while True:
+            try:
+                await self.publish(emit)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Spectator publish failed: {e}")
+            await asyncio.sleep(self.interval_seconds)
@@ -0,0 +1,325 @@
+"""
+In-process authoritative auction state with write-behind persistence.
+
+One AuctionState per running auction holds everything the bid path needs
+(current lot, current bid/bidder, bidSequence, timerEndsAt, per-participant
+budget and roster counts). It is loaded from Mongo when a lot starts, bids are
+validated and accepted against it synchronously (no await between check and
+mutation, so the event loop serialises bids per process), and the resulting
+writes are persisted by a background write-behind queue.
+
+Single-replica only: with several backend replicas each one would hold its own
+copy, so server.py enables this via FEATURE_AUCTION_STATE_CACHE.
+
+Accepted bids are already acked and broadcast, so a failed write-behind batch
+is retried with backoff until it persists; meanwhile the store is failing and
+refuses new bids. Settlement closes an auction first (bids rejected, no reload
+from Mongo) and only then flushes, so the winner is read from complete bids.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
+
+import metrics
+from auction.bidding import BidRejected, anti_snipe_deadline, validate_bid
+from auction.proxy import current_proxies
+
+logger = logging.getLogger(__name__)
+
+SETTLING = "settling"  # Status of a closed state: the lot is being settled
+RETRY_INITIAL_SECONDS = 0.1
+RETRY_MAX_SECONDS = 5.0
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Mongo returns naive datetimes - treat them as UTC"""
+    if value is not None and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+@dataclass
+class ParticipantState:
+    userId: str
+    userName: str
+    userEmail: str
+    budgetRemaining: float
+    rosterCount: int
+
+    @classmethod
+    def from_document(cls, participant: dict) -> "ParticipantState":
+        return cls(
+            userId=participant["userId"],
+            userName=participant.get("userName", ""),
+            userEmail=participant.get("userEmail", ""),
+            budgetRemaining=participant.get("budgetRemaining", 0),
+            rosterCount=len(participant.get("clubsWon", [])),
+        )
+
+
+@dataclass
+class AcceptedBid:
+    """Result of accepting a bid against the in-memory state"""
+    participant: ParticipantState
+    lot_id: Optional[str]
+    club_id: str
+    bid_sequence: int
+    extended_until: Optional[datetime]  # New deadline if anti-snipe fired
+
+
+@dataclass
+class AuctionState:
+    auction_id: str
+    league_id: str
+    status: str
+    current_lot: int
+    current_lot_id: Optional[str]
+    current_club_id: Optional[str]
+    current_bid: Optional[float]
+    current_bidder: Optional[Dict[str, Any]]
+    bid_sequence: int
+    timer_ends_at: Optional[datetime]
+    anti_snipe_seconds: int
+    minimum_budget: float
+    club_slots: int
+    participants: Dict[str, ParticipantState] = field(default_factory=dict)
+    proxy_bids: Dict[str, dict] = field(default_factory=dict)  # Current lot's registered maxima
+
+    @classmethod
+    def from_documents(cls, auction: dict, league: dict, participants: List[dict]) -> "AuctionState":
+        return cls(
+            auction_id=auction["id"],
+            league_id=auction["leagueId"],
+            status=auction.get("status", "waiting"),
+            current_lot=auction.get("currentLot", 0),
+            current_lot_id=auction.get("currentLotId"),
+            current_club_id=auction.get("currentClubId"),
+            current_bid=auction.get("currentBid"),
+            current_bidder=auction.get("currentBidder"),
+            bid_sequence=auction.get("bidSequence", 0),
+            timer_ends_at=_as_utc(auction.get("timerEndsAt")),
+            anti_snipe_seconds=auction.get("antiSnipeSeconds", 10),
+            minimum_budget=auction.get("minimumBudget", 1000000.0),
+            club_slots=league.get("clubSlots", 3),
+            participants={p["userId"]: ParticipantState.from_document(p) for p in participants},
+            proxy_bids=current_proxies(auction),
+        )
+
+    def accept_bid(self, user_id: str, amount: float, now: datetime) -> AcceptedBid:
+        """
+        Validate and apply a bid. Synchronous on purpose - the check and the
+        mutation happen in one event-loop step so concurrent bids can't interleave.
+
+        Raises:
+            BidRejected: If the auction is not active or the bid fails validation
+            KeyError: If user_id is not a participant of this auction's league
+        """
+        if self.status != "active":
+            raise BidRejected(400, f"Auction is not active (status: {self.status})")
+
+        participant = self.participants[user_id]
+        current_bidder_id = self.current_bidder.get("userId") if self.current_bidder else None
+        validate_bid(
+            user_id=user_id,
+            amount=amount,
+            minimum_budget=self.minimum_budget,
+            budget_remaining=participant.budgetRemaining,
+            clubs_won_count=participant.rosterCount,
+            club_slots=self.club_slots,
+            current_club_id=self.current_club_id,
+            current_bid=self.current_bid,
+            current_bidder_id=current_bidder_id,
+        )
+
+        self.current_bid = amount
+        self.current_bidder = {"userId": user_id, "displayName": participant.userName}
+        self.bid_sequence += 1
+
+        extended_until = anti_snipe_deadline(self.timer_ends_at, self.anti_snipe_seconds, now)
+        if extended_until:
+            self.timer_ends_at = extended_until
+
+        return AcceptedBid(
+            participant=participant,
+            lot_id=self.current_lot_id,
+            club_id=self.current_club_id,
+            bid_sequence=self.bid_sequence,
+            extended_until=extended_until,
+        )
+
+
+class AuctionStateStore:
+    """
+    Registry of in-memory auction states plus the write-behind queue that
+    persists accepted bids.
+    """
+
+    def __init__(self, db):
+        self.db = db
+        self._states: Dict[str, AuctionState] = {}
+        self._closed: Dict[str, str] = {}  # auctionId -> status, until the next load
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self.failing = False  # A write-behind batch is being retried
+
+    def get(self, auction_id: str) -> Optional[AuctionState]:
+        return self._states.get(auction_id)
+
+    async def get_or_load(self, auction_id: str) -> Optional[AuctionState]:
+        """
+        State for the bid paths, loaded on first use.
+
+        Raises:
+            BidRejected: While the auction is closed for settlement or bids can't be persisted
+        """
+        if auction_id in self._closed:
+            raise BidRejected(400, f"Auction is not active (status: {self._closed[auction_id]})")
+        if self.failing:
+            raise BidRejected(503, "Bids can't be saved right now, try again shortly")
+        return self._states.get(auction_id) or await self.load(auction_id)
+
+    def close(self, auction_id: str, status: str = SETTLING) -> None:
+        """Stop accepting bids for an auction until it is loaded again (the next lot transition)"""
+        self._closed[auction_id] = status
+        state = self._states.pop(auction_id, None)
+        if state:
+            # Holders of the object reject too
+            state.status = status
+
+    def drop(self, auction_id: str) -> None:
+        self._states.pop(auction_id, None)
+        self._closed.pop(auction_id, None)
+
+    async def load(self, auction_id: str) -> Optional[AuctionState]:
+        """(Re)load an auction's state from Mongo. Returns None if the auction or league is gone."""
+        auction = await self.db.auctions.find_one({"id": auction_id}, {"_id": 0})
+        if not auction:
+            self.drop(auction_id)
+            return None
+        league_task = self.db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0, "clubSlots": 1})
+        participants_task = self.db.league_participants.find(
+            {"leagueId": auction["leagueId"]},
+            {"_id": 0, "userId": 1, "userName": 1, "userEmail": 1, "budgetRemaining": 1, "clubsWon": 1}
+        ).to_list(None)
+        league, participants = await asyncio.gather(league_task, participants_task)
+        if not league:
+            self.drop(auction_id)
+            return None
+
+        state = AuctionState.from_documents(auction, league, participants)
+        self._states[auction_id] = state
+        self._closed.pop(auction_id, None)
+        logger.info(f"🧠 Auction state loaded: {auction_id} lot={state.current_lot} participants={len(state.participants)}")
+        return state
+
+    async def refresh_participant(self, auction_id: str, user_id: str) -> Optional[ParticipantState]:
+        """Pick up a participant who joined after the state was loaded"""
+        state = self._states.get(auction_id)
+        if not state:
+            return None
+        participant = await self.db.league_participants.find_one(
+            {"leagueId": state.league_id, "userId": user_id}, {"_id": 0}
+        )
+        if not participant:
+            return None
+        state.participants[user_id] = ParticipantState.from_document(participant)
+        return state.participants[user_id]
+
+    # ===== WRITE-BEHIND =====
+    def persist_bid(self, state: AuctionState, accepted: AcceptedBid, bid_doc: dict) -> None:
+        """Queue the bid row and the auction's current-bid fields for background persistence"""
+        auction_set = {
+            "currentBid": state.current_bid,
+            "currentBidder": state.current_bidder,
+        }
+        if accepted.extended_until:
+            auction_set["timerEndsAt"] = accepted.extended_until
+        self._enqueue({
+            "auctionId": state.auction_id,
+            "lotId": accepted.lot_id,
+            "bid": bid_doc,
+            "set": auction_set,
+            "seq": accepted.bid_sequence,
+        })
+
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue else 0
+
+    async def flush(self) -> None:
+        """Wait until every queued write has been applied (failed batches are retried until they are)"""
+        if self._queue:
+            await self._queue.join()
+
+    async def shutdown(self, timeout: float = 30.0) -> None:
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+        except asyncio.TimeoutError:
+            logger.error(f"❌ Shutting down with {self.pending()} accepted bids not persisted")
+        if self._worker:
+            self._worker.cancel()
+            self._worker = None
+
+    def _enqueue(self, op: dict) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+        self._queue.put_nowait(op)
+        metrics.set_write_behind_pending(self._queue.qsize())
+
+    async def _run(self) -> None:
+        while True:
+            ops = [await self._queue.get()]
+            # Drain whatever else is already queued so a burst becomes one batch
+            while not self._queue.empty():
+                ops.append(self._queue.get_nowait())
+            await self._apply_until_persisted(ops)
+            for _ in ops:
+                self._queue.task_done()
+            metrics.set_write_behind_pending(self._queue.qsize())
+
+    async def _apply_until_persisted(self, ops: List[dict]) -> None:
+        """The bids were acked and broadcast - keep the batch (in order) until it is written"""
+        delay = RETRY_INITIAL_SECONDS
+        retry = False
+        while True:
+            try:
+                await self._apply(ops, retry=retry)
+            except Exception as e:
+                if not self.failing:
+                    logger.error(f"❌ Write-behind batch of {len(ops)} ops failed, refusing bids until it persists: {e}")
+                self.failing = True
+                retry = True
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, RETRY_MAX_SECONDS)
+                continue
+            if self.failing:
+                logger.info(f"✅ Write-behind batch of {len(ops)} ops persisted after retrying")
+                self.failing = False
+            return
+
+    async def _apply(self, ops: List[dict], retry: bool = False) -> None:
+        bids = [op["bid"] for op in ops]
+        if retry:
+            # An earlier attempt may have inserted some rows before failing
+            written = set(await self.db.bids.distinct("id", {"id": {"$in": [bid["id"] for bid in bids]}}))
+            bids = [bid for bid in bids if bid["id"] not in written]
+        if bids:
+            await self.db.bids.insert_many(bids, ordered=True)
+
+        # Coalesce auction updates: last write per lot wins, bidSequence only moves forward
+        merged: Dict[tuple, dict] = {}
+        for op in ops:
+            key = (op["auctionId"], op["lotId"])
+            entry = merged.setdefault(key, {"set": {}, "seq": 0})
+            entry["set"].update(op["set"])
+            entry["seq"] = max(entry["seq"], op["seq"])
+
+        for (auction_id, lot_id), entry in merged.items():
+            # Guard on the lot so a late write can't clobber the next lot's fresh state
+            await self.db.auctions.update_one(
+                {"id": auction_id, "currentLotId": lot_id},
+                {"$set": entry["set"], "$max": {"bidSequence": entry["seq"]}}
+            )
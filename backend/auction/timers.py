@@ -0,0 +1,214 @@
+"""
+Centralised lot timer scheduler.
+
+One asyncio task per process owns every lot deadline instead of one polling
+task per auction. Deadlines live in a min-heap (lazy deletion via a version
+number), so the loop sleeps until the next tick or the next expiry - whichever
+comes first - and never reads the database. Anti-snipe extensions are pushed
+in from the bid path with extend(); ticks and expiries are delivered through
+the on_tick/on_expire callbacks supplied by server.py.
+
+The same loop runs one-off deferred jobs (e.g. the inter-lot countdown) so lot
+transitions never hold the caller in asyncio.sleep.
+"""
+import asyncio
+import heapq
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+
+def to_epoch_ms(value: datetime) -> int:
+    """Convert a (possibly naive, UTC) datetime to epoch milliseconds"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+@dataclass
+class LotTimer:
+    auction_id: str
+    lot_id: str
+    ends_at_ms: int
+    version: int
+
+
+class LotTimerScheduler:
+    """
+    Heap-based scheduler for lot deadlines.
+
+    Args:
+        on_tick: async callback(timer) called every tick_interval for each running timer
+        on_expire: async callback(timer) called once when a timer's deadline passes
+        tick_interval: seconds between tick broadcasts (0 disables ticks)
+    """
+
+    def __init__(self,
+                 on_tick: Optional[Callable[[LotTimer], Awaitable[None]]],
+                 on_expire: Callable[[LotTimer], Awaitable[None]],
+                 tick_interval: float = 0.5):
+        self.on_tick = on_tick
+        self.on_expire = on_expire
+        self.tick_interval = tick_interval
+        self._timers: Dict[str, LotTimer] = {}
+        self._heap: List[Tuple[int, int, str]] = []  # (ends_at_ms, version, auction_id)
+        self._jobs: Dict[str, Callable[[], Awaitable[None]]] = {}
+        self._job_heap: List[Tuple[int, str]] = []  # (run_at_ms, key)
+        self._version = 0
+        self._wakeup: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+        self._expired_total = 0
+        self._last_drift_ms = 0.0
+
+    # ===== PUBLIC API =====
+    def schedule(self, auction_id: str, lot_id: str, ends_at: datetime) -> LotTimer:
+        """Start (or replace) the timer for an auction's current lot"""
+        self._version += 1
+        timer = LotTimer(auction_id, lot_id, to_epoch_ms(ends_at), self._version)
+        self._timers[auction_id] = timer
+        heapq.heappush(self._heap, (timer.ends_at_ms, timer.version, auction_id))
+        self._changed()
+        logger.info(f"⏱️ Lot timer scheduled: auction={auction_id} lot={lot_id} endsAt={timer.ends_at_ms}")
+        return timer
+
+    def extend(self, auction_id: str, lot_id: str, ends_at: datetime) -> bool:
+        """
+        Push an anti-snipe extension. Ignored if the lot has moved on or the
+        new deadline is not later than the current one.
+        """
+        timer = self._timers.get(auction_id)
+        ends_at_ms = to_epoch_ms(ends_at)
+        if not timer or timer.lot_id != lot_id or ends_at_ms <= timer.ends_at_ms:
+            return False
+        self.schedule(auction_id, lot_id, ends_at)
+        return True
+
+    def defer(self, key: str, delay: float, job: Callable[[], Awaitable[None]]) -> bool:
+        """
+        Run job() once after delay seconds. A job with the same key already pending
+        is kept and the new one ignored, so double triggers schedule nothing twice.
+        """
+        if key in self._jobs:
+            return False
+        self._jobs[key] = job
+        heapq.heappush(self._job_heap, (int(time.time() * 1000 + delay * 1000), key))
+        self._changed()
+        return True
+
+    def cancel(self, auction_id: str) -> None:
+        """Stop an auction's timer (pause, delete, reset). Heap entry is dropped lazily."""
+        if self._timers.pop(auction_id, None):
+            self._changed()
+            logger.info(f"⏱️ Lot timer cancelled: auction={auction_id}")
+
+    def get(self, auction_id: str) -> Optional[LotTimer]:
+        return self._timers.get(auction_id)
+
+    def __contains__(self, auction_id: str) -> bool:
+        return auction_id in self._timers
+
+    def __len__(self) -> int:
+        return len(self._timers)
+
+    def stats(self) -> dict:
+        return {
+            "scheduled": len(self._timers),
+            "heapSize": len(self._heap),
+            "jobsPending": len(self._jobs),
+            "expiredTotal": self._expired_total,
+            "lastDriftMs": round(self._last_drift_ms, 1),
+            "tickIntervalMs": int(self.tick_interval * 1000),
+        }
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    # ===== LOOP =====
+    def _changed(self) -> None:
+        metrics.set_lot_timers_scheduled(len(self._timers))
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _pop_expired(self, now_ms: int) -> List[LotTimer]:
+        expired = []
+        while self._heap and self._heap[0][0] <= now_ms:
+            _, version, auction_id = heapq.heappop(self._heap)
+            timer = self._timers.get(auction_id)
+            if timer and timer.version == version:
+                # Live entry - stale ones (extended/cancelled) are simply skipped
+                del self._timers[auction_id]
+                expired.append(timer)
+        return expired
+
+    def _pop_due_jobs(self, now_ms: int) -> List[Tuple[str, Callable[[], Awaitable[None]]]]:
+        due = []
+        while self._job_heap and self._job_heap[0][0] <= now_ms:
+            _, key = heapq.heappop(self._job_heap)
+            due.append((key, self._jobs.pop(key)))
+        return due
+
+    async def _run(self) -> None:
+        next_tick = time.monotonic() + self.tick_interval
+        while self._timers or self._jobs:
+            self._wakeup.clear()
+            now_ms = int(time.time() * 1000)
+
+            expired = self._pop_expired(now_ms)
+            if expired:
+                metrics.set_lot_timers_scheduled(len(self._timers))
+            for timer in expired:
+                drift_ms = now_ms - timer.ends_at_ms
+                self._expired_total += 1
+                self._last_drift_ms = drift_ms
+                metrics.observe_lot_timer_drift(drift_ms / 1000)
+                # Separate task so one slow settlement never delays other auctions
+                asyncio.create_task(self._fire(timer))
+            for key, job in self._pop_due_jobs(now_ms):
+                asyncio.create_task(self._run_job(key, job))
+
+            if self.on_tick and self.tick_interval and time.monotonic() >= next_tick:
+                next_tick = time.monotonic() + self.tick_interval
+                await asyncio.gather(
+                    *(self.on_tick(timer) for timer in list(self._timers.values())),
+                    return_exceptions=True
+                )
+
+            # Sleep until the next tick or the earliest deadline, or until woken by a change
+            timeouts = []
+            if self.on_tick and self.tick_interval:
+                timeouts.append(next_tick - time.monotonic())
+            if self._heap:
+                timeouts.append(self._heap[0][0] / 1000 - time.time())
+            if self._job_heap:
+                timeouts.append(self._job_heap[0][0] / 1000 - time.time())
+            timeout = max(0.0, min(timeouts)) if timeouts else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        # Nothing left to watch - drop stale heap entries; next schedule() restarts the loop
+        self._heap.clear()
+
+    async def _fire(self, timer: LotTimer) -> None:
+        try:
+            await self.on_expire(timer)
+        except Exception as e:
+            logger.error(f"Lot timer expiry handler failed for auction {timer.auction_id}: {e}")
+
+    async def _run_job(self, key: str, job: Callable[[], Awaitable[None]]) -> None:
+        try:
+            await job()
+        except Exception as e:
+            logger.error(f"Deferred job {key} failed: {e}")
@@ -0,0 +1,140 @@
+"""
+Socket.IO payload encodings.
+
+Text clients get JSON, encoded by orjson when it is installed (stdlib json
+otherwise) through the json module socketio_init hands to the AsyncServer.
+
+Clients that connect with auth {encoding: "msgpack"} get auction stream events
+as a single binary MessagePack attachment instead: dict keys are shortened
+through COMPACT_KEYS (sent in the `connected` event so the client can expand
+them) and timestamps are epoch milliseconds rather than ISO strings.
+
+Each stream room has one sub-room per encoding (wire_room), so a broadcast is
+encoded once per encoding, not once per client.
+"""
+import json as stdlib_json
+from datetime import datetime, timezone
+from typing import Any, Dict
+
+try:
+    import orjson
+except ImportError:  # Plain json still works, just slower
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # Binary mode is then never negotiated
+    msgpack = None
+
+JSON = "json"
+MSGPACK = "msgpack"
+ENCODINGS = (JSON, MSGPACK)
+
+# Field names of the high-frequency frames (tick, timer_heartbeat, bid_update, anti_snipe,
+# sold, lot_started) and the bid/bidder/participant dicts inside them
+COMPACT_KEYS = {
+    "auctionId": "a",
+    "lotId": "l",
+    "seq": "s",
+    "endsAt": "e",
+    "serverNow": "n",
+    "timer": "tm",
+    "amount": "m",
+    "bidder": "b",
+    "bid": "bd",
+    "serverTime": "t",
+    "timestamp": "ts",
+    "id": "i",
+    "userId": "u",
+    "userName": "un",
+    "displayName": "dn",
+    "clubId": "c",
+    "clubName": "cn",
+    "club": "cl",
+    "lotNumber": "ln",
+    "isUnsoldRetry": "ur",
+    "winningBid": "w",
+    "unsold": "us",
+    "participantUpdates": "pu",
+    "participantsVersion": "pv",
+    "budgetRemaining": "br",
+    "clubsWon": "cw",
+    "totalSpent": "sp",
+    "streamId": "si",
+    "streamSeq": "sq",
+}
+
+# Keys whose ISO-string values become epoch ms in binary frames (datetimes are converted anywhere)
+TIMESTAMP_KEYS = frozenset({"serverTime", "timestamp", "timerEndsAt", "joinedAt", "createdAt", "endsAt"})
+
+
+class FastJson:
+    """json module stand-in for python-socketio / python-engineio (only dumps/loads are used)"""
+
+    @staticmethod
+    def dumps(obj: Any, **kwargs) -> str:
+        if orjson is None:
+            kwargs.setdefault("separators", (",", ":"))
+            return stdlib_json.dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS).decode()
+
+    @staticmethod
+    def loads(data, **kwargs) -> Any:
+        if orjson is None:
+            return stdlib_json.loads(data, **kwargs)
+        return orjson.loads(data)
+
+
+def negotiate_encoding(requested, binary_enabled: bool = True) -> str:
+    """Encoding for a connecting client; anything unknown (or msgpack when unavailable) is JSON"""
+    if requested == MSGPACK and binary_enabled and msgpack is not None:
+        return MSGPACK
+    return JSON
+
+
+def wire_room(room: str, encoding: str) -> str:
+    """Sub-room of a stream room holding the clients that use encoding"""
+    return f"{room}:{encoding}"
+
+
+def epoch_ms(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return int(value.timestamp() * 1000)
+
+
+def compact(value: Any, key: str = None) -> Any:
+    """Shorten dict keys through COMPACT_KEYS and turn timestamps into epoch ms, recursively"""
+    if isinstance(value, dict):
+        return {COMPACT_KEYS.get(k, k): compact(v, k) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [compact(item) for item in value]
+    if isinstance(value, datetime):
+        return epoch_ms(value)
+    if isinstance(value, str) and key in TIMESTAMP_KEYS:
+        try:
+            return epoch_ms(datetime.fromisoformat(value.replace("Z", "+00:00")))
+        except ValueError:
+            return value
+    return value
+
+
+def pack(payload: Any) -> bytes:
+    """Binary frame for msgpack clients"""
+    return msgpack.packb(compact(payload), use_bin_type=True)
+
+
+def unpack(frame: bytes) -> Any:
+    """Inverse of pack, keys expanded again (timestamps stay epoch ms) - what a client decodes"""
+    return _expand(msgpack.unpackb(frame, raw=False))
+
+
+_EXPANDED_KEYS: Dict[str, str] = {short: name for name, short in COMPACT_KEYS.items()}
+
+
+def _expand(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {_EXPANDED_KEYS.get(k, k): _expand(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_expand(item) for item in value]
+    return value
@@ -11,11 +11,18 @@ ENABLE_METRICS = os.getenv("ENABLE_METRICS", "true").lower() == "true"
 BID_ACCEPTED = Counter("bids_accepted_total", "Total accepted bids", ["auction_id"])
 BID_REJECTED = Counter("bids_rejected_total", "Total rejected bids", ["reason"])
 BID_LATENCY  = Histogram("bid_latency_seconds", "Bid processing latency in seconds")
+BID_DUPLICATES = Counter("bid_duplicates_suppressed_total", "Bid retries answered from the idempotency store", ["source"])
 
 # Timer and auction metrics
 TIMER_TICKS  = Counter("timer_ticks_total", "Emitted timer_update events", ["auction_id"])
 AUCTION_STARTED = Counter("auctions_started_total", "Total auctions started")
 AUCTION_COMPLETED = Counter("auctions_completed_total", "Total auctions completed", ["reason"])
+LOT_TIMERS_SCHEDULED = Gauge("lot_timers_scheduled", "Lot deadlines currently held by the timer scheduler")
+TIMER_LEASES_OWNED = Gauge("timer_leases_owned", "Auction timer leases held by this replica")
+TIMER_LEASE_TAKEOVERS = Counter("timer_lease_takeovers_total", "Lot timers taken over from a lapsed lease")
+SETTLEMENT_COLLAPSED = Counter("settlement_collapsed_total", "complete_lot calls collapsed onto one already running", ["scope"])
+LOT_TIMER_DRIFT = Histogram("lot_timer_drift_seconds", "Delay between a lot deadline and its expiry firing",
+                            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0))
 
 # Socket.IO connection metrics
 SOCKET_CONN  = Counter("socket_connections_total", "Socket connections")
@@ -33,6 +40,9 @@ API_LATENCY = Histogram("api_request_duration_seconds", "API request duration",
 # Rate limiting metrics
 RATE_LIMITED_REQUESTS = Counter("rate_limited_requests_total", "Total rate limited requests", ["endpoint"])
 
+# In-memory auction state metrics
+WRITE_BEHIND_PENDING = Gauge("auction_write_behind_pending", "Accepted bids queued for background persistence")
+
 if ENABLE_METRICS:
     logger.info("✅ Prometheus metrics enabled")
 else:
@@ -48,6 +58,11 @@ def increment_bid_rejected(reason: str):
     if ENABLE_METRICS:
         BID_REJECTED.labels(reason=reason).inc()
 
+def increment_bid_duplicate(source: str):
+    """Increment suppressed duplicate bid counter (source: memory/inflight/redis)"""
+    if ENABLE_METRICS:
+        BID_DUPLICATES.labels(source=source).inc()
+
 def observe_bid_latency(latency: float):
     """Record bid processing latency"""
     if ENABLE_METRICS:
@@ -58,6 +73,31 @@ def increment_timer_tick(auction_id: str):
     if ENABLE_METRICS:
         TIMER_TICKS.labels(auction_id=auction_id).inc()
 
+def set_lot_timers_scheduled(count: int):
+    """Record number of scheduled lot timers"""
+    if ENABLE_METRICS:
+        LOT_TIMERS_SCHEDULED.set(count)
+
+def observe_lot_timer_drift(drift: float):
+    """Record lot timer expiry drift in seconds"""
+    if ENABLE_METRICS:
+        LOT_TIMER_DRIFT.observe(max(0.0, drift))
+
+def set_timer_leases_owned(count: int):
+    """Record number of timer leases held by this replica"""
+    if ENABLE_METRICS:
+        TIMER_LEASES_OWNED.set(count)
+
+def increment_timer_lease_takeover():
+    """Increment timer lease takeover counter"""
+    if ENABLE_METRICS:
+        TIMER_LEASE_TAKEOVERS.inc()
+
+def increment_settlement_collapsed(scope: str):
+    """Increment collapsed settlement counter (scope: local/remote)"""
+    if ENABLE_METRICS:
+        SETTLEMENT_COLLAPSED.labels(scope=scope).inc()
+
 def increment_socket_connection():
     """Increment socket connection counter"""
     if ENABLE_METRICS:
@@ -89,4 +129,9 @@ def record_api_request(method: str, endpoint: str, status: int, duration: float)
 def increment_rate_limited(endpoint: str):
     """Increment rate limited requests"""
     if ENABLE_METRICS:
-        RATE_LIMITED_REQUESTS.labels(endpoint=endpoint).inc()
\ No newline at end of file
+        RATE_LIMITED_REQUESTS.labels(endpoint=endpoint).inc()
+
+def set_write_behind_pending(count: int):
+    """Record write-behind queue depth"""
+    if ENABLE_METRICS:
+        WRITE_BEHIND_PENDING.set(count)
@@ -1,8 +1,12 @@
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict, Any, Literal
+from typing import Optional, List, Dict, Any, Literal, Annotated
 from datetime import datetime, timezone
 import uuid
 
+# Sealed-round settings: a round needs at least one lot and a window people can bid in
+SealedRoundSize = Annotated[int, Field(ge=1, le=50)]
+SealedRoundSeconds = Annotated[int, Field(ge=10, le=3600)]
+
 # Validation helpers for assetsSelected field
 def validate_assets_selected(assets: Optional[List[str]]) -> Optional[List[str]]:
     """
@@ -144,6 +148,11 @@ class League(BaseModel):
     # Prompt D: Timer configuration
     timerSeconds: int = 30  # Default 30s (reduced from 60s)
     antiSnipeSeconds: int = 10  # Default 10s (reduced from 30s)
+    # Sealed-bid batch rounds instead of live lots (see auction/sealed.py)
+    lotMode: Literal["live", "sealed"] = "live"
+    sealedRoundSize: SealedRoundSize = 10  # Lots opened together per round
+    sealedRoundSeconds: SealedRoundSeconds = 60  # Bidding window per round
+    sealedPricing: Literal["second", "first"] = "second"
     # Prompt E: Team management
     assetsSelected: Optional[List[str]] = None  # If null, use sport default; else restrict to selected IDs
 
@@ -204,6 +213,10 @@ class LeagueCreate(BaseModel):
     # Prompt D: Timer configuration in league creation
     timerSeconds: int = 30  # Default 30s
     antiSnipeSeconds: int = 10  # Default 10s
+    lotMode: Literal["live", "sealed"] = "live"
+    sealedRoundSize: SealedRoundSize = 10
+    sealedRoundSeconds: SealedRoundSeconds = 60
+    sealedPricing: Literal["second", "first"] = "second"
     # Prompt 1: Team selection (Prompt E enhancement)
     assetsSelected: Optional[List[str]] = None  # If null/empty, use all assets for sport
     
@@ -223,6 +236,10 @@ class LeagueUpdate(BaseModel):
     clubSlots: Optional[int] = None
     timerSeconds: Optional[int] = None
     antiSnipeSeconds: Optional[int] = None
+    lotMode: Optional[Literal["live", "sealed"]] = None
+    sealedRoundSize: Optional[SealedRoundSize] = None
+    sealedRoundSeconds: Optional[SealedRoundSeconds] = None
+    sealedPricing: Optional[Literal["second", "first"]] = None
     assetsSelected: Optional[List[str]] = None  # Update selected assets
     
     @field_validator('assetsSelected')
@@ -258,22 +275,34 @@ class Auction(BaseModel):
     currentLotId: Optional[str] = None  # Track lot ID for timer events
     bidTimer: int = 60  # seconds
     antiSnipeSeconds: int = 30
+    lotMode: Literal["live", "sealed"] = "live"
+    sealedRoundSize: SealedRoundSize = 10
+    sealedRoundSeconds: SealedRoundSeconds = 60
+    sealedPricing: Literal["second", "first"] = "second"
+    sealedRound: Optional[Dict[str, Any]] = None  # Open round {number, clubIds, endsAt, reoffer}
     timerEndsAt: Optional[datetime] = None
-    clubQueue: List[str] = []  # Queue of club IDs to auction (prepared at creation)
+    clubQueue: List[str] = []  # Legacy: lot order now lives in the lot catalog (auction_lots)
+    queueLength: Optional[int] = None  # Lots in the initial queue
     unsoldClubs: List[str] = []  # Clubs that went unsold, will be re-offered
+    soldClubs: List[str] = []  # Clubs awarded so far (maintained at settlement)
+    participantsVersion: int = 0  # Bumped per award; versions participant deltas in sold events
     minimumBudget: float = 1000000.0  # £1m minimum budget per user
     pausedRemainingTime: Optional[float] = None  # Stored time when paused
     pausedAt: Optional[datetime] = None  # When auction was paused
     currentBid: Optional[float] = None  # Current highest bid amount
     currentBidder: Optional[Dict[str, Any]] = None  # Current bidder info {userId, displayName}
     bidSequence: int = 0  # Monotonic sequence number for bid updates
-    usersInWaitingRoom: Optional[List[str]] = []  # Track users who have clicked "Enter Auction"
+    usersInWaitingRoom: Optional[List[str]] = []  # Users in the auction room while waiting (from room presence, not stored)
     createdAt: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class AuctionCreate(BaseModel):
     leagueId: str
     bidTimer: int = 30  # Default 30s (Prompt D)
     antiSnipeSeconds: int = 10  # Default 10s (Prompt D)
+    lotMode: Literal["live", "sealed"] = "live"
+    sealedRoundSize: SealedRoundSize = 10
+    sealedRoundSeconds: SealedRoundSeconds = 60
+    sealedPricing: Literal["second", "first"] = "second"
 
 # Bid Models
 class Bid(BaseModel):
@@ -289,6 +318,16 @@ class Bid(BaseModel):
 class BidCreate(BaseModel):
     userId: str
     amount: float
+    clientBidId: Optional[str] = None  # Idempotency key: retries with the same id get the original result
+
+class ProxyBidCreate(BaseModel):
+    userId: str
+    maxAmount: float  # Private maximum for the current lot
+
+class SealedBidCreate(BaseModel):
+    userId: str
+    clubId: str  # Lot in the open sealed round
+    amount: float
 
 # League Points Models (for scoring)
 class LeaguePoints(BaseModel):
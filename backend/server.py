@@ -1,4 +1,4 @@
-from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Depends, Request, Response, Query, Body
+from fastapi import FastAPI, APIRouter, HTTPException, UploadFile, File, Depends, Request, Response, Query, Body, Header
 from fastapi.responses import JSONResponse, FileResponse
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
@@ -11,8 +11,9 @@ import os
 import logging
 import json
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 import socketio
+from socketio.exceptions import ConnectionRefusedError as SocketConnectionRefused
 import asyncio
 import uuid
 from uuid import uuid4
@@ -29,7 +30,28 @@ from fastapi_limiter.depends import RateLimiter
 import redis.asyncio as aioredis
 from socketio_init import sio
 import metrics
-from auction.completion import compute_auction_status
+from auction.completion import compute_status_from_counters, count_completion, join_counter_increments, verify_counters
+from auction.bidding import BidRejected, bid_rollback_update, validate_bid, guarded_bid_update
+from auction.state import AuctionStateStore
+from auction.timers import LotTimerScheduler, LotTimer, to_epoch_ms
+from auction.leases import TimerLeaseCoordinator
+from auction.singleflight import SingleFlight
+from auction.catalog import LotCatalogStore
+from auction.snapshots import AuctionSnapshotCache, snapshot_version, sold_club_ids
+from auction.replay import AuctionEventLog
+from auction.idempotency import BidIdempotencyStore, BidOutcome, MAX_KEY_LENGTH
+from auction.ratelimit import TokenBucketLimiter, retry_after_seconds
+from auction.presence import PresenceChange, RoomPresence
+from auction.sessions import SocketSessionIndex
+from auction.rooms import ActiveAuctionIndex
+from auction.spectators import SPECTATOR_FRAME_EVENT, SPECTATOR_NAMESPACE, SpectatorFeed, spectator_room
+from auction.wire import COMPACT_KEYS, ENCODINGS, JSON, MSGPACK, negotiate_encoding, pack as pack_frame, wire_room
+from auction.proxy import current_proxies, proxy_set_updates, resolve_proxy_bids
+from auction.sealed import (
+    SEALED, SealedAward, award_from_record, award_record, is_round_lot_id, next_round_clubs, resolve_sealed_round,
+    round_lot_id
+)
+from auction.settlement import settle_lot, pop_unsold_club, SOLD, ALREADY_SETTLED, PARTICIPANT_MISSING, PUBLIC_PARTICIPANT_FIELDS
 import sentry_sdk
 from sentry_sdk.integrations.fastapi import FastApiIntegration
 from sentry_sdk.integrations.starlette import StarletteIntegration
@@ -42,7 +64,7 @@ from models import (
     League, LeagueCreate,
     LeagueParticipant, LeagueParticipantCreate,
     Auction, AuctionCreate,
-    Bid, BidCreate,
+    Bid, BidCreate, ProxyBidCreate, SealedBidCreate,
     LeaguePoints,
     Fixture, Standing, StandingEntry,
     MagicLink, AuthTokenResponse
@@ -122,9 +144,13 @@ db = None
 db_manager: DatabaseManager = None
 sport_service = None
 asset_service = None
+auction_states: AuctionStateStore = None
+lot_catalogs: LotCatalogStore = None
+timer_leases: Optional[TimerLeaseCoordinator] = None
+auction_snapshots = AuctionSnapshotCache()
 
 async def startup_db_client():
-    global client, db, db_manager, sport_service, asset_service
+    global client, db, db_manager, sport_service, asset_service, auction_states, lot_catalogs
     
     # Initialize database manager with auto-reconnection
     db_manager = init_db_manager(
@@ -162,6 +188,7 @@ async def startup_db_client():
         await db.bids.create_index([("auctionId", 1), ("createdAt", -1)])
         await db.bids.create_index([("userId", 1), ("createdAt", -1)])
         await db.bids.create_index([("auctionId", 1), ("amount", -1)])
+        await db.bids.create_index([("auctionId", 1), ("clubId", 1), ("amount", -1)])
         
         # League stats indexes - CRITICAL for scoring/leaderboards
         await db.league_stats.create_index([
@@ -183,6 +210,12 @@ async def startup_db_client():
         # Auctions indexes
         await db.auctions.create_index("leagueId")
         await db.auctions.create_index([("leagueId", 1), ("status", 1)])
+        await db.auction_lots.create_index(
+            [("auctionId", 1), ("order", 1)], unique=True, partialFilterExpression={"order": {"$exists": True}}
+        )
+        await db.auction_lots.create_index([("auctionId", 1), ("assetId", 1)], unique=True)
+        await db.auction_lots.create_index([("auctionId", 1), ("name", 1), ("order", 1)])
+        await db.sealed_bids.create_index([("auctionId", 1), ("round", 1), ("clubId", 1), ("userId", 1)], unique=True)
         
         # Leagues indexes
         await db.leagues.create_index("sportKey")
@@ -208,6 +241,8 @@ async def startup_db_client():
     # Initialize services after database connection
     sport_service = SportService(db)
     asset_service = AssetService(db)
+    auction_states = AuctionStateStore(db)
+    lot_catalogs = LotCatalogStore(db)
     
     # Run team name migration (idempotent - safe to run multiple times)
     try:
@@ -258,25 +293,98 @@ logger.info(f"Asset Selection feature enabled: {FEATURE_ASSET_SELECTION}")
 FEATURE_WAITING_ROOM = os.environ.get('FEATURE_WAITING_ROOM', 'true').lower() == 'true'
 logger.info(f"Waiting Room feature enabled: {FEATURE_WAITING_ROOM}")
 
+# In-memory authoritative auction state with write-behind persistence.
+# Single-replica only, so it defaults off when REDIS_URL (multi-pod) is configured.
+FEATURE_AUCTION_STATE_CACHE = os.environ.get(
+    'FEATURE_AUCTION_STATE_CACHE',
+    'false' if os.environ.get('REDIS_URL', '').strip() else 'true'
+).lower() == 'true'
+logger.info(f"Auction state cache enabled: {FEATURE_AUCTION_STATE_CACHE}")
+
+# Redis leases decide which replica runs each auction's lot timer (multi-pod only)
+FEATURE_DISTRIBUTED_TIMERS = os.environ.get(
+    'FEATURE_DISTRIBUTED_TIMERS',
+    'true' if os.environ.get('REDIS_URL', '').strip() else 'false'
+).lower() == 'true'
+TIMER_LEASE_TTL_SECONDS = float(os.environ.get('TIMER_LEASE_TTL_SECONDS', '5'))
+REPLICA_ID = os.environ.get('REPLICA_ID') or f"{os.uname().nodename}-{uuid4().hex[:6]}"
+logger.info(f"Distributed lot timers enabled: {FEATURE_DISTRIBUTED_TIMERS} (replica {REPLICA_ID})")
+
+# Socket/user presence per auction:/league: room; in Redis (with per-replica TTL heartbeats) when REDIS_URL is set
+PRESENCE_TTL_SECONDS = float(os.environ.get('PRESENCE_TTL_SECONDS', '30'))
+room_presence = RoomPresence(REPLICA_ID, ttl_seconds=PRESENCE_TTL_SECONDS)
+
+# Authenticated sockets by user/league, so membership changes reach their sessions
+socket_sessions = SocketSessionIndex(sio, REPLICA_ID)
+
+# League -> active auction, so rejoin_rooms finds auction rooms without querying Mongo
+active_auctions = ActiveAuctionIndex()
+
+# Run lot settlement inside a Mongo transaction (requires a replica set / Atlas)
+FEATURE_SETTLEMENT_TRANSACTIONS = os.environ.get('FEATURE_SETTLEMENT_TRANSACTIONS', 'false').lower() == 'true'
+logger.info(f"Settlement transactions enabled: {FEATURE_SETTLEMENT_TRANSACTIONS}")
+
+# Cross-check the incremental completion counters against a full participant scan (debugging)
+AUCTION_COMPLETION_VERIFY = os.environ.get('AUCTION_COMPLETION_VERIFY', 'false').lower() == 'true'
+
+# Tick-free timer protocol: clients joining with timerMode="deadline" only get deadline changes
+# (lot_started, anti_snipe, pause/resume) plus a low-frequency timer_heartbeat instead of 2 ticks/sec
+TIMER_HEARTBEAT_SECONDS = float(os.environ.get('TIMER_HEARTBEAT_SECONDS', '10'))
+TIMER_MODES = ('tick', 'deadline')
+
+# Auction socket protocol negotiated on join_auction. 1: bid_update + legacy bid_placed per bid.
+# 2: one bid_update frame that also carries the bid, bid_placed is only sent to protocol 1 clients.
+AUCTION_PROTOCOL_VERSION = 2
+
+# Clients connecting with auth {encoding: "msgpack"} get auction stream events as compact binary frames.
+# Off by default: every stream event is then encoded and published once more, for the msgpack sub-room.
+SOCKET_MSGPACK_ENABLED = os.environ.get('SOCKET_MSGPACK_ENABLED', 'false').lower() == 'true'
+
+# Sockets connecting with auth {token: <access JWT>} get a verified session (userId, displayName, leagueIds).
+# When required, sockets without a valid token are refused; otherwise they fall back to payload userIds.
+SOCKET_AUTH_REQUIRED = os.environ.get('SOCKET_AUTH_REQUIRED', 'false').lower() == 'true'
+
+# Read-only watchers connect to the /spectate namespace instead of joining auction rooms: they get one
+# coalesced spectator_frame per auction every SPECTATOR_UPDATE_SECONDS (only when it changed), no ticks
+SPECTATOR_UPDATE_SECONDS = float(os.environ.get('SPECTATOR_UPDATE_SECONDS', '2'))
+logger.info(f"Timer heartbeat for deadline-mode clients: every {TIMER_HEARTBEAT_SECONDS}s")
+
+# Resumable auction streams: reconnecting clients get missed events from a per-auction
+# ring buffer instead of a full snapshot. Single-replica only, like the state cache.
+FEATURE_EVENT_REPLAY = os.environ.get(
+    'FEATURE_EVENT_REPLAY',
+    'false' if os.environ.get('REDIS_URL', '').strip() else 'true'
+).lower() == 'true'
+EVENT_REPLAY_BUFFER_SIZE = int(os.environ.get('EVENT_REPLAY_BUFFER_SIZE', '256'))
+logger.info(f"Auction event replay enabled: {FEATURE_EVENT_REPLAY} (buffer {EVENT_REPLAY_BUFFER_SIZE})")
+
+# Bid retries carrying the same Idempotency-Key / clientBidId get the original outcome for this long
+BID_IDEMPOTENCY_TTL_SECONDS = float(os.environ.get('BID_IDEMPOTENCY_TTL_SECONDS', '120'))
+
+# Per (auction, user) token bucket on bid, proxy-bid and sealed-bid submissions; 0 disables it
+BID_RATE_LIMIT_PER_SECOND = float(os.environ.get('BID_RATE_LIMIT_PER_SECOND', '5'))
+BID_RATE_LIMIT_BURST = int(os.environ.get('BID_RATE_LIMIT_BURST', '10'))
+
 # Socket.IO server imported from socketio_init.py (with Redis scaling support)
 
-# Helper function for Redis-compatible room size retrieval
-def get_room_size(room_name: str) -> int:
+# Room sizes come from room_presence, which works with both the in-memory and Redis managers
+async def get_room_size(room_name: str) -> int:
+    """Sockets in an auction:/league: room across all replicas (O(1))"""
+    return await room_presence.socket_count(room_name)
+
+async def broadcast_presence_changes(changes: List[PresenceChange]):
     """
-    Get room size in a way compatible with both in-memory and Redis managers.
-    With Redis, room membership is distributed so we can't query it locally.
-    Returns 0 with Redis (room size unknown), or actual size with in-memory manager.
+    waiting_room_updated carries only who arrived/left ({auctionId, joined, left}); clients
+    apply it to the usersInWaitingRoom list from GET /auction or the join_auction ack.
     """
-    try:
-        if hasattr(sio.manager, 'rooms'):
-            # In-memory manager: rooms is a dict
-            room_sockets = sio.manager.rooms.get(room_name, {}).get("/", set())
-            return len(room_sockets)
-        else:
-            # Redis manager: room info not available locally
-            return 0
-    except (AttributeError, TypeError):
-        return 0
+    by_room: Dict[str, dict] = {}
+    for change in changes:
+        if not change.room.startswith("auction:"):
+            continue
+        diff = by_room.setdefault(change.room, {'auctionId': change.room.split(":", 1)[1], 'joined': [], 'left': []})
+        diff['joined' if change.joined else 'left'].append(change.user_id)
+    for room_name, diff in by_room.items():
+        await sio.emit('waiting_room_updated', diff, room=room_name)
 
 # Production hardening configuration
 ENABLE_RATE_LIMITING = os.getenv("ENABLE_RATE_LIMITING", "true").lower() == "true"
@@ -306,6 +414,7 @@ def require_user_id(request: Request) -> str:
 # Lifespan management for rate limiting
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    global timer_leases
     # Startup
     # Initialize database connection and indexes
     await startup_db_client()
@@ -320,9 +429,58 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("📝 Rate limiting disabled or Redis not configured")
     
+    if FEATURE_DISTRIBUTED_TIMERS and REDIS_URL and REDIS_URL.strip():
+        try:
+            timer_redis = aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True)
+            timer_leases = TimerLeaseCoordinator(timer_redis, lot_timers, REPLICA_ID, TIMER_LEASE_TTL_SECONDS)
+            await timer_leases.start()
+            settlement_flight.use_redis(timer_redis, REPLICA_ID)
+        except Exception as e:
+            timer_leases = None
+            logger.error(f"❌ Timer lease initialization failed, timers run per-replica: {e}")
+    
+    if REDIS_URL and REDIS_URL.strip():
+        # Retries that land on another replica are answered from the shared store
+        bid_idempotency.use_redis(aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True))
+        room_presence.use_redis(aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True))
+        await room_presence.start(broadcast_presence_changes)
+        socket_sessions.use_redis(aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True))
+        await socket_sessions.start()
+        active_auctions.use_redis(aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True))
+        if bid_rate_limiter:
+            bid_rate_limiter.use_redis(aioredis.from_url(REDIS_URL, encoding="utf-8", decode_responses=True))
+    
+    # Auctions that were already running when this replica started
+    running = await db.auctions.find(
+        {"status": "active"},
+        {"_id": 0, "id": 1, "leagueId": 1, "lotMode": 1, "sealedRound.number": 1, "sealedRound.endsAt": 1}
+    ).to_list(None)
+    await active_auctions.seed((auction["leagueId"], auction["id"]) for auction in running)
+    
+    # Re-arm open sealed rounds (without timer leases their deadline only lived in the old process);
+    # a close that finds its round settled just moves the auction on
+    for auction in running:
+        sealed_round = auction.get("sealedRound")
+        if auction.get("lotMode") == SEALED and sealed_round and sealed_round.get("endsAt"):
+            try:
+                await schedule_sealed_round_close(auction["id"], sealed_round["number"], sealed_round["endsAt"])
+            except Exception as e:
+                logger.error(f"❌ Sealed round close for auction {auction['id']} not re-armed: {e}")
+    
+    await spectator_feed.start(emit_spectator_frame)
+    
     yield
     
     # Shutdown
+    await spectator_feed.stop()
+    await room_presence.stop()
+    await socket_sessions.stop()
+    if timer_leases:
+        await timer_leases.stop()
+    await lot_timers.stop()
+    if auction_states:
+        # Drain write-behind queue so accepted bids aren't lost
+        await auction_states.shutdown()
     logger.info("🔄 Application shutdown")
 
 # Create the main app with lifespan management
@@ -390,7 +548,8 @@ async def health_check():
                 "mode": "redis" if redis_enabled and mgr else "in-memory",
                 "redis_configured": redis_enabled,
                 "multi_pod_ready": redis_enabled and mgr is not None
-            }
+            },
+            "lotTimers": {**lot_timers.stats(), **(timer_leases.stats() if timer_leases else {})}
         }
         
         # Add warning if Redis is configured but might not be working
@@ -1624,23 +1783,229 @@ async def rate_limit_handler(request: Request, exc):
         }
     )
 
-# Store active timers and sequence numbers
-active_timers = {}
+# Store sequence numbers (lot deadlines live in lot_timers, see TIMER COUNTDOWN)
 lot_sequences = {}  # Track sequence numbers per lot
 
-def get_next_seq(lot_id: str) -> int:
-    """Get next sequence number for a lot"""
+async def get_next_seq(lot_id: str) -> int:
+    """Get next sequence number for a lot (shared Redis counter when timer leases are on)"""
+    if timer_leases:
+        try:
+            return await timer_leases.next_seq(lot_id)
+        except Exception as e:
+            logger.warning(f"⚠️ Redis lot sequence unavailable, using local counter: {e}")
     if lot_id not in lot_sequences:
         lot_sequences[lot_id] = 0
     lot_sequences[lot_id] += 1
     return lot_sequences[lot_id]
 
-def create_timer_event(lot_id: str, ends_at_ms: int) -> dict:
+async def schedule_lot_timer(auction_id: str, lot_id: str, ends_at: datetime):
+    """Start a lot's countdown - on the lease owner's scheduler when timer leases are on"""
+    if timer_leases:
+        await timer_leases.schedule(auction_id, lot_id, ends_at)
+    else:
+        lot_timers.schedule(auction_id, lot_id, ends_at)
+
+async def extend_lot_timer(auction_id: str, lot_id: str, ends_at: datetime):
+    """Push an anti-snipe extension to whichever replica owns the timer"""
+    if timer_leases:
+        await timer_leases.extend(auction_id, lot_id, ends_at)
+    else:
+        lot_timers.extend(auction_id, lot_id, ends_at)
+
+async def cancel_lot_timer(auction_id: str):
+    """Stop an auction's countdown (pause, completion, deletion)"""
+    timer_heartbeats.pop(auction_id, None)
+    if timer_leases:
+        await timer_leases.cancel(auction_id)
+    else:
+        lot_timers.cancel(auction_id)
+
+async def refresh_auction_state(auction_id: str):
+    """Reload the in-memory auction state after a lot transition (no-op when the cache is off)"""
+    if FEATURE_AUCTION_STATE_CACHE and auction_states:
+        await auction_states.load(auction_id)
+
+async def release_auction_state(auction_id: str, final: bool = False):
+    """
+    Close the in-memory state, then persist its queued bids (settlement, pause, completion, deletion).
+    Closed first so no bid is accepted after the flush; it stays closed - no reload from Mongo -
+    until the next lot transition reloads it. final (auction completed or deleted) forgets it instead.
+    """
+    if FEATURE_AUCTION_STATE_CACHE and auction_states:
+        auction_states.close(auction_id)
+        await auction_states.flush()
+        if final:
+            auction_states.drop(auction_id)
+    auction_snapshots.drop(auction_id)
+
+auction_events = AuctionEventLog(EVENT_REPLAY_BUFFER_SIZE)
+
+async def emit_auction_event(auction_id: str, event: str, payload: dict):
+    """Broadcast a state-changing event to the auction room, buffered for resumable clients"""
+    if FEATURE_EVENT_REPLAY:
+        payload = auction_events.record(auction_id, event, payload)
+    await emit_encoded(event, payload, f"auction:{auction_id}")
+
+async def emit_encoded(event: str, payload: dict, room: str):
+    """Broadcast a stream event once per wire encoding: JSON to room:json, binary to room:msgpack"""
+    await sio.emit(event, payload, room=wire_room(room, JSON))
+    if SOCKET_MSGPACK_ENABLED:
+        await sio.emit(event, pack_frame(payload), room=wire_room(room, MSGPACK))
+
+async def emit_to_socket(sid: str, event: str, payload: dict, encoding: str):
+    """Unicast a stream event (snapshot, replay) in the socket's encoding"""
+    await sio.emit(event, pack_frame(payload) if encoding == MSGPACK else payload, room=sid)
+
+async def socket_session(sid: str) -> dict:
+    """Session saved by connect (encoding, plus userId/displayName/email/leagueIds when authenticated)"""
+    try:
+        return await sio.get_session(sid) or {}
+    except Exception:
+        return {}
+
+async def socket_encoding(sid: str) -> str:
+    """Encoding negotiated when the socket connected"""
+    return (await socket_session(sid)).get('encoding', JSON)
+
+async def socket_user_id(sid: str, claimed: Optional[str]) -> Optional[str]:
+    """
+    The socket's user: the verified session user when the socket authenticated, otherwise
+    the payload's userId (legacy clients, unless SOCKET_AUTH_REQUIRED).
+    """
+    user_id = (await socket_session(sid)).get('userId')
+    if user_id:
+        return user_id
+    return None if SOCKET_AUTH_REQUIRED else claimed
+
+async def socket_bidder(sid: str, claimed: Optional[str]):
+    """
+    (userId, session user or None, error ack or None) for the socket bid events. An authenticated
+    socket may only bid as its own user; the session user saves the bid path a users lookup.
+    """
+    session = await socket_session(sid)
+    user_id = session.get('userId')
+    if not user_id:
+        if SOCKET_AUTH_REQUIRED:
+            return None, None, {'ok': False, 'status': 401, 'detail': 'Socket is not authenticated'}
+        return claimed, None, None
+    if claimed and claimed != user_id:
+        return None, None, {'ok': False, 'status': 403, 'detail': 'userId does not match the authenticated socket'}
+    user = {'id': user_id, 'name': session['displayName'], 'email': session.get('email')} if session.get('displayName') else None
+    return user_id, user, None
+
+def auction_stream_rooms(auction_id: str, timer_mode: str, protocol: int, encoding: str) -> List[str]:
+    """Rooms a fresh socket needs for an auction's stream (what enter_auction_stream ends with)"""
+    rooms = [f"auction:{auction_id}", wire_room(f"auction:{auction_id}", encoding)]
+    if timer_mode == 'tick':
+        rooms.append(wire_room(tick_room(auction_id), encoding))
+    if protocol < 2:
+        rooms.append(legacy_bid_room(auction_id))
+    return rooms
+
+async def enter_auction_stream(sid: str, auction_id: str, timer_mode: str, protocol: int, encoding: str):
+    """Put a socket in the auction room and the sub-rooms for its encoding, timer mode and protocol"""
+    await sio.enter_room(sid, f"auction:{auction_id}")
+    for candidate in ENCODINGS:
+        if candidate == encoding:
+            await sio.enter_room(sid, wire_room(f"auction:{auction_id}", candidate))
+        else:
+            await sio.leave_room(sid, wire_room(f"auction:{auction_id}", candidate))
+        if candidate == encoding and timer_mode == 'tick':
+            await sio.enter_room(sid, wire_room(tick_room(auction_id), candidate))
+        else:
+            await sio.leave_room(sid, wire_room(tick_room(auction_id), candidate))
+    if protocol < 2:
+        await sio.enter_room(sid, legacy_bid_room(auction_id))
+    else:
+        await sio.leave_room(sid, legacy_bid_room(auction_id))
+
+async def leave_auction_stream(sid: str, auction_id: str):
+    await sio.leave_room(sid, f"auction:{auction_id}")
+    for encoding in ENCODINGS:
+        await sio.leave_room(sid, wire_room(f"auction:{auction_id}", encoding))
+        await sio.leave_room(sid, wire_room(tick_room(auction_id), encoding))
+    await sio.leave_room(sid, legacy_bid_room(auction_id))
+
+def tick_room(auction_id: str) -> str:
+    """Room for legacy clients that still want a tick every 500ms"""
+    return f"auction:{auction_id}:ticks"
+
+def legacy_bid_room(auction_id: str) -> str:
+    """Room for protocol 1 clients that still want bid_placed alongside bid_update"""
+    return f"auction:{auction_id}:bid-placed"
+
+def negotiate_protocol(requested) -> int:
+    """Highest protocol both sides speak (clients that send nothing are protocol 1)"""
+    if not isinstance(requested, int) or requested < 1:
+        return 1
+    return min(requested, AUCTION_PROTOCOL_VERSION)
+
+async def load_completion_counters(auction: dict, league: dict) -> dict:
+    """
+    Return the auction's completion counters, seeding them from one participant scan
+    the first time (new auctions, or auctions started before counters existed).
+    The same scan seeds soldClubs, which settlement then maintains alongside the counters.
+    """
+    if auction.get("completion"):
+        return auction["completion"]
+    participants = await db.league_participants.find(
+        {"leagueId": auction["leagueId"]}, {"_id": 0, "clubsWon": 1, "budgetRemaining": 1}
+    ).to_list(None)
+    counters = count_completion(league, participants, auction.get("minimumBudget", 1000000.0))
+    seeded = await db.auctions.find_one_and_update(
+        {"id": auction["id"], "completion": {"$exists": False}},
+        {"$set": {"completion": counters, "soldClubs": sold_club_ids({}, participants)}},
+        projection={"_id": 0, "completion": 1},
+        return_document=ReturnDocument.AFTER
+    )
+    if not seeded:
+        # Another trigger seeded them first
+        seeded = await db.auctions.find_one({"id": auction["id"]}, {"_id": 0, "completion": 1})
+    auction["completion"] = (seeded or {}).get("completion", counters)
+    return auction["completion"]
+
+async def count_joined_participant(league: dict, participant: dict):
+    """
+    A manager joining mid-auction adds demand: $inc the counters of the league's unfinished
+    auctions that already seeded them (unseeded ones will count the participant when they seed).
+    """
+    auctions = await db.auctions.find(
+        {"leagueId": league["id"], "status": {"$ne": "completed"}, "completion": {"$exists": True}},
+        {"_id": 0, "id": 1, "minimumBudget": 1}
+    ).to_list(None)
+    for auction in auctions:
+        increments = join_counter_increments(
+            participant, league.get("clubSlots", 3), auction.get("minimumBudget", 1000000.0)
+        )
+        await db.auctions.update_one(
+            {"id": auction["id"], "completion": {"$exists": True}},
+            {"$inc": {f"completion.{name}": value for name, value in increments.items()}}
+        )
+
+def queue_length(auction: dict) -> int:
+    """Number of lots in the initial queue"""
+    if auction.get("queueLength") is not None:
+        return auction["queueLength"]
+    return len(auction.get("clubQueue") or [])
+
+async def auction_queue_page(auction: dict, start: int = 0, count: Optional[int] = None) -> List[str]:
+    """
+    Lots start..start+count-1 of the initial lot order (count None = to the end). Kept in the
+    lot catalog, one document per lot; auctions created before that still carry clubQueue.
+    """
+    if auction.get("clubQueue"):
+        return auction["clubQueue"][start:None if count is None else start + count]
+    return await lot_catalogs.queue_page(auction["id"], start, count)
+
+async def auction_club_queue(auction: dict) -> List[str]:
+    """Whole initial lot order - for reports; the auction engine reads it through auction_queue_page"""
+    return await auction_queue_page(auction)
+
+async def create_timer_event(lot_id: str, ends_at_ms: int) -> dict:
     """Create standardized timer event data"""
-    import time
     return {
         "lotId": lot_id,
-        "seq": get_next_seq(lot_id),
+        "seq": await get_next_seq(lot_id),
         "endsAt": ends_at_ms,
         "serverNow": int(time.time() * 1000)
     }
@@ -2431,6 +2796,8 @@ async def join_league_by_token(input_data: JoinByTokenInput):
     )
     
     await db.league_participants.insert_one(participant.model_dump())
+    await count_joined_participant(league, participant.model_dump())
+    await socket_sessions.league_joined(participant.userId, league_id)
     
     # Emit socket event for real-time update
     try:
@@ -2490,12 +2857,13 @@ async def join_league(league_id: str, participant_input: LeagueParticipantCreate
         clubsWon=[]
     )
     await db.league_participants.insert_one(participant.model_dump())
+    await count_joined_participant(league, participant.model_dump())
+    await socket_sessions.league_joined(participant.userId, league_id)
     
     # Metrics: Track participant joining
     metrics.increment_participant_joined()
     
-    # Get current room size (Redis-compatible - may return 0 with Redis)
-    room_size = get_room_size(f"league:{league_id}")
+    room_size = await get_room_size(f"league:{league_id}")
     
     # JSON log for debugging
     logger.info(json.dumps({
@@ -2522,7 +2890,7 @@ async def join_league(league_id: str, participant_input: LeagueParticipantCreate
     }, room=f"league:{league_id}")
     
     # Send complete member list to ALL users in league room
-    all_participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(100)
+    all_participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(None)
     members = []
     for p in all_participants:
         members.append({
@@ -2562,7 +2930,7 @@ async def join_league(league_id: str, participant_input: LeagueParticipantCreate
 @api_router.get("/leagues/{league_id}/participants")
 async def get_league_participants(league_id: str):
     """Prompt A: Server-authoritative participants with count - normalized response"""
-    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(100)
+    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(None)
     
     # Normalize participant data with safe defaults
     normalized_participants = []
@@ -2584,7 +2952,7 @@ async def get_league_participants(league_id: str):
 @api_router.get("/leagues/{league_id}/members")
 async def get_league_members(league_id: str):
     """Prompt A: Get ordered league members for real-time updates"""
-    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).sort("joinedAt", 1).to_list(100)
+    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).sort("joinedAt", 1).to_list(None)
     
     # Return simplified member list
     members = []
@@ -2801,7 +3169,7 @@ async def get_league_summary(league_id: str, userId: str):
     user_budget_remaining = participant.get("budgetRemaining", 0) if participant else 0
     
     # Get all managers with their rosters (Everton Bug Fix 5: Roster Visibility)
-    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(100)
+    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(None)
     managers = []
     
     for p in participants:
@@ -2885,7 +3253,7 @@ async def get_league_standings_endpoint(league_id: str):
         raise HTTPException(status_code=404, detail="League not found")
     
     # Always get current participants to ensure standings reflect all members
-    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(100)
+    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(None)
     
     # Check if standings exist
     standing = await db.standings.find_one({"leagueId": league_id}, {"_id": 0})
@@ -3859,6 +4227,7 @@ async def delete_league(league_id: str, commissioner_id: str = None, user_id: st
     # Delete bids
     bid_result = await db.bids.delete_many({"auctionId": {"$in": [existing_auction["id"]] if existing_auction else []}})
     delete_results["bids"] = bid_result.deleted_count
+    await db.sealed_bids.delete_many({"auctionId": {"$in": [existing_auction["id"]] if existing_auction else []}})
     
     # Delete auction
     if existing_auction:
@@ -3866,9 +4235,11 @@ async def delete_league(league_id: str, commissioner_id: str = None, user_id: st
         delete_results["auction"] = auction_result.deleted_count
         
         # Cancel any active timers
-        if existing_auction["id"] in active_timers:
-            active_timers[existing_auction["id"]].cancel()
-            del active_timers[existing_auction["id"]]
+        await cancel_lot_timer(existing_auction["id"])
+        if auction_states:
+            auction_states.drop(existing_auction["id"])
+        await lot_catalogs.delete(existing_auction["id"])
+        auction_events.drop(existing_auction["id"])
     
     # Delete league participants
     participant_result = await db.league_participants.delete_many({"leagueId": league_id})
@@ -3881,6 +4252,7 @@ async def delete_league(league_id: str, commissioner_id: str = None, user_id: st
     # Delete the league itself
     league_result = await db.leagues.delete_one({"id": league_id})
     delete_results["league"] = league_result.deleted_count
+    await socket_sessions.league_deleted(league_id)
     
     logger.info(f"Deleted league {league_id}: {delete_results}")
     
@@ -3953,6 +4325,7 @@ async def bulk_delete_leagues(request: dict, user: dict = Depends(get_current_us
             if auction_ids:
                 bid_result = await db.bids.delete_many({"auctionId": {"$in": auction_ids}})
                 delete_counts["bids"] = bid_result.deleted_count
+                await db.sealed_bids.delete_many({"auctionId": {"$in": auction_ids}})
             
             # 3. Delete auctions
             auction_result = await db.auctions.delete_many({"leagueId": league_id})
@@ -3977,12 +4350,15 @@ async def bulk_delete_leagues(request: dict, user: dict = Depends(get_current_us
             # 8. Delete the league itself
             league_result = await db.leagues.delete_one({"id": league_id})
             delete_counts["league"] = league_result.deleted_count
+            await socket_sessions.league_deleted(league_id)
             
             # Cancel any active timers
             for auction_id in auction_ids:
-                if auction_id in active_timers:
-                    active_timers[auction_id].cancel()
-                    del active_timers[auction_id]
+                await cancel_lot_timer(auction_id)
+                if auction_states:
+                    auction_states.drop(auction_id)
+                await lot_catalogs.delete(auction_id)
+                auction_events.drop(auction_id)
             
             results["deleted"].append({
                 "leagueId": league_id,
@@ -4299,7 +4675,7 @@ async def ingest_cricket_scoring(league_id: str, file: UploadFile = File(...)):
         
         # Update standings table with aggregated stats per manager
         # Get all participants to calculate their total points from owned players
-        participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(100)
+        participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(None)
         
         updated_table = []
         for participant in participants:
@@ -4455,7 +4831,11 @@ async def start_auction(league_id: str):
     auction_create = AuctionCreate(
         leagueId=league_id,
         bidTimer=league.get("timerSeconds", 30),
-        antiSnipeSeconds=league.get("antiSnipeSeconds", 10)
+        antiSnipeSeconds=league.get("antiSnipeSeconds", 10),
+        lotMode=league.get("lotMode", "live"),
+        sealedRoundSize=league.get("sealedRoundSize", 10),
+        sealedRoundSeconds=league.get("sealedRoundSeconds", 60),
+        sealedPricing=league.get("sealedPricing", "second")
     )
     auction_obj = Auction(**auction_create.model_dump())
     
@@ -4485,12 +4865,12 @@ async def start_auction(league_id: str):
     if FEATURE_ASSET_SELECTION and assets_selected and len(assets_selected) > 0:
         # Use commissioner's selected assets (feature flag ON + assets selected)
         if sport_key == "football":
-            all_assets = await db.assets.find({"id": {"$in": assets_selected}}).to_list(100)
+            all_assets = await db.assets.find({"id": {"$in": assets_selected}}).to_list(None)
         else:
             all_assets = await db.assets.find({
                 "id": {"$in": assets_selected}, 
                 "sportKey": sport_key
-            }).to_list(100)
+            }).to_list(None)
         
         # Validation: Ensure selected assets are valid
         if len(all_assets) == 0:
@@ -4526,7 +4906,7 @@ async def start_auction(league_id: str):
                 {"competitions": "Africa Cup of Nations"}
             ]
         
-        all_assets = await db.assets.find(query, {"_id": 0}).to_list(100)
+        all_assets = await db.assets.find(query, {"_id": 0}).to_list(None)
         
         logger.info("auction.seed_queue", extra={
             "leagueId": league_id,
@@ -4538,9 +4918,9 @@ async def start_auction(league_id: str):
     else:
         # Use all available assets for this sport (default behavior or feature flag OFF)
         if sport_key == "football":
-            all_assets = await db.assets.find({"sportKey": "football"}, {"_id": 0}).to_list(100)
+            all_assets = await db.assets.find({"sportKey": "football"}, {"_id": 0}).to_list(None)
         else:
-            all_assets = await db.assets.find({"sportKey": sport_key}, {"_id": 0}).to_list(100)
+            all_assets = await db.assets.find({"sportKey": sport_key}, {"_id": 0}).to_list(None)
         
         logger.info("auction.seed_queue", extra={
             "leagueId": league_id,
@@ -4552,6 +4932,10 @@ async def start_auction(league_id: str):
     
     random.shuffle(all_assets)
     
+    # Snapshot display fields of every queued asset - lot events never read assets again
+    if all_assets:
+        await lot_catalogs.create(auction_obj.id, all_assets, sport_key)
+    
     # Prompt G: Feature flag - determines if auction starts in "waiting" or "active" state
     if FEATURE_WAITING_ROOM:
         # NEW BEHAVIOR: Create auction in "waiting" state (Prompt B)
@@ -4566,8 +4950,9 @@ async def start_auction(league_id: str):
                     "status": "waiting",
                     "currentLot": 0,  # Not started yet
                     "currentClubId": None,
-                    "clubQueue": asset_queue,
+                    "queueLength": len(asset_queue),
                     "unsoldClubs": [],
+                    "soldClubs": [],
                     "timerEndsAt": None,  # No timer yet
                     "currentLotId": None,
                     "minimumBudget": 1000000.0
@@ -4592,7 +4977,7 @@ async def start_auction(league_id: str):
             }, room=f"league:{league_id}")
             
             # Prompt G: Log league status change event
-            league_room_size = get_room_size(f"league:{league_id}")
+            league_room_size = await get_room_size(f"league:{league_id}")
             logger.info("league_status_changed.emitted", extra={
                 "leagueId": league_id,
                 "auctionId": auction_obj.id,
@@ -4610,22 +4995,39 @@ async def start_auction(league_id: str):
     
     else:
         # OLD BEHAVIOR: Start auction immediately in "active" state (pre-waiting room)
-        if all_assets:
+        if all_assets and auction_obj.lotMode == SEALED:
+            await db.auctions.update_one(
+                {"id": auction_obj.id},
+                {"$set": {
+                    "status": "active",
+                    "currentLot": 0,
+                    "queueLength": len(all_assets),
+                    "unsoldClubs": [],
+                    "soldClubs": [],
+                    "minimumBudget": 1000000.0
+                }}
+            )
+            await active_auctions.activate(league_id, auction_obj.id)
+            await sio.emit('league_status_changed', {
+                'leagueId': league_id,
+                'status': 'auction_started',
+                'auctionId': auction_obj.id
+            }, room=f"league:{league_id}")
+            await open_sealed_round(auction_obj.id, expected_round=0)
+            logger.info(f"Created and started sealed-round auction {auction_obj.id} immediately (legacy mode)")
+        elif all_assets:
             # Initialize asset queue
             asset_queue = [asset["id"] for asset in all_assets]
             
             # Get first asset
             first_asset_id = asset_queue[0]
-            if sport_key == "football":
-                first_asset = await db.assets.find_one({"id": first_asset_id}, {"_id": 0})
-            else:
-                first_asset = await db.assets.find_one({"id": first_asset_id, "sportKey": sport_key}, {"_id": 0})
+            lot_id = f"{auction_obj.id}-lot-1"
+            lot_frame = await lot_catalogs.lot_started(auction_obj.id, lot_id, 1, first_asset_id, sport_key)
             
-            if not first_asset:
+            if not lot_frame:
                 raise HTTPException(status_code=404, detail="First asset not found")
             
             # Start first lot immediately
-            lot_id = f"{auction_obj.id}-lot-1"
             timer_end = datetime.now(timezone.utc) + timedelta(seconds=auction_obj.bidTimer)
             
             await db.auctions.update_one(
@@ -4634,13 +5036,15 @@ async def start_auction(league_id: str):
                     "status": "active",
                     "currentClubId": first_asset_id,
                     "currentLot": 1,
-                    "clubQueue": asset_queue,
+                    "queueLength": len(asset_queue),
                     "unsoldClubs": [],
+                    "soldClubs": [],
                     "timerEndsAt": timer_end,
                     "currentLotId": lot_id,
                     "minimumBudget": 1000000.0
                 }}
             )
+            await active_auctions.activate(league_id, auction_obj.id)
             
             # Prompt G: Log legacy immediate start
             logger.info("auction.created", extra={
@@ -4656,15 +5060,7 @@ async def start_auction(league_id: str):
             if timer_end.tzinfo is None:
                 timer_end = timer_end.replace(tzinfo=timezone.utc)
             ends_at_ms = int(timer_end.timestamp() * 1000)
-            timer_data = create_timer_event(lot_id, ends_at_ms)
-            
-            # Prepare asset data for emission
-            if sport_key == "football":
-                asset_data = Club(**first_asset).model_dump()
-            else:
-                asset_data = first_asset.copy()
-                if "_id" in asset_data:
-                    del asset_data["_id"]
+            timer_data = await create_timer_event(lot_id, ends_at_ms)
             
             # Emit auction start and first lot
             await sio.emit('league_status_changed', {
@@ -4673,14 +5069,10 @@ async def start_auction(league_id: str):
                 'auctionId': auction_obj.id
             }, room=f"league:{league_id}")
             
-            await sio.emit('lot_started', {
-                'club': asset_data,
-                'lotNumber': 1,
-                'timer': timer_data
-            }, room=f"auction:{auction_obj.id}")
+            await emit_auction_event(auction_obj.id, 'lot_started', {**lot_frame, 'timer': timer_data})
             
             # Start timer countdown
-            asyncio.create_task(countdown_timer(auction_obj.id, timer_end, lot_id))
+            await schedule_lot_timer(auction_obj.id, lot_id, timer_end)
             
             logger.info(f"Created and started auction {auction_obj.id} immediately (legacy mode) with {len(asset_queue)} assets")
         else:
@@ -4747,7 +5139,7 @@ async def begin_auction(
         raise HTTPException(status_code=403, detail="Only the league commissioner can start the auction. Ask the commissioner to start it.")
     
     # Prompt G: Log begin_auction call
-    auction_room_size = get_room_size(f"auction:{auction_id}")
+    auction_room_size = await get_room_size(f"auction:{auction_id}")
     logger.info("begin_auction.called", extra={
         "auctionId": auction_id,
         "leagueId": auction["leagueId"],
@@ -4759,23 +5151,38 @@ async def begin_auction(
     # Get sport key for asset retrieval
     sport_key = league.get("sportKey", "football")
     
-    # Get the club queue
-    asset_queue = auction.get("clubQueue", [])
+    # First lot of the queue
+    asset_queue = await auction_queue_page(auction, 0, 1)
     if not asset_queue:
         raise HTTPException(status_code=400, detail="No assets in auction queue")
     
-    # Get first asset details
+    if auction.get("lotMode") == SEALED:
+        # Sealed mode opens a round of lots instead of the first live lot
+        await db.auctions.update_one(
+            {"id": auction_id, "status": "waiting"},
+            {"$set": {"status": "active"}}
+        )
+        await active_auctions.activate(league["id"], auction_id)
+        await open_sealed_round(auction_id, expected_round=0)
+        await sio.emit('league_status_changed', {
+            'leagueId': league["id"],
+            'status': 'auction_active',
+            'auctionId': auction_id,
+            'message': 'Auction has begun!'
+        }, room=f"league:{league['id']}")
+        logger.info(f"Commissioner started sealed-round auction {auction_id}")
+        return {"message": "Auction started successfully", "auctionId": auction_id, "round": 1}
+    
+    # Get first asset details from the lot catalog
     first_asset_id = asset_queue[0]
-    if sport_key == "football":
-        first_asset = await db.assets.find_one({"id": first_asset_id}, {"_id": 0})
-    else:
-        first_asset = await db.assets.find_one({"id": first_asset_id, "sportKey": sport_key}, {"_id": 0})
+    lot_id = f"{auction_id}-lot-1"
+    lot_frame = await lot_catalogs.lot_started(auction_id, lot_id, 1, first_asset_id, sport_key)
     
-    if not first_asset:
+    if not lot_frame:
         raise HTTPException(status_code=404, detail="First asset not found")
+    first_asset = lot_frame["club"]
     
     # Start first lot
-    lot_id = f"{auction_id}-lot-1"
     timer_end = datetime.now(timezone.utc) + timedelta(seconds=auction.get("bidTimer", 30))
     
     await db.auctions.update_one(
@@ -4787,31 +5194,19 @@ async def begin_auction(
                 "currentLot": 1,
                 "timerEndsAt": timer_end,
                 "currentLotId": lot_id
-            },
-            "$unset": {"usersInWaitingRoom": ""}  # Clear waiting room tracking when auction begins
+            }
         }
     )
+    await active_auctions.activate(league["id"], auction_id)
     
     # Create timer event
     if timer_end.tzinfo is None:
         timer_end = timer_end.replace(tzinfo=timezone.utc)
     ends_at_ms = int(timer_end.timestamp() * 1000)
-    timer_data = create_timer_event(lot_id, ends_at_ms)
-    
-    # Prepare asset data for emission
-    if sport_key == "football":
-        asset_data = Club(**first_asset).model_dump()
-    else:
-        asset_data = first_asset.copy()
-        if "_id" in asset_data:
-            del asset_data["_id"]
+    timer_data = await create_timer_event(lot_id, ends_at_ms)
     
     # Emit lot start to auction room
-    await sio.emit('lot_started', {
-        'club': asset_data,
-        'lotNumber': 1,
-        'timer': timer_data
-    }, room=f"auction:{auction_id}")
+    await emit_auction_event(auction_id, 'lot_started', {**lot_frame, 'timer': timer_data})
     
     # Prompt G: Log lot_started emission
     logger.info("lot_started.emitted", extra={
@@ -4824,7 +5219,8 @@ async def begin_auction(
     })
     
     # Start timer countdown
-    asyncio.create_task(countdown_timer(auction_id, timer_end, lot_id))
+    await refresh_auction_state(auction_id)
+    await schedule_lot_timer(auction_id, lot_id, timer_end)
     
     logger.info(f"Commissioner started auction {auction_id}, first lot: {first_asset.get('name')}")
     
@@ -4848,19 +5244,21 @@ async def get_league_auction(league_id: str):
     return {"auctionId": auction["id"], "status": auction["status"]}
 
 @api_router.get("/auction/{auction_id}/clubs")
-async def get_auction_clubs(auction_id: str):
-    """Get all clubs in the auction with their status (upcoming/current/sold/unsold)"""
+async def get_auction_clubs(auction_id: str, page: Optional[int] = None, pageSize: int = 200):
+    """
+    Get all clubs in the auction with their status (upcoming/current/sold/unsold).
+    Large catalogs can be fetched a page at a time (page is 1-based, clubs by name, each page read
+    from the lot catalog on its own); summary always covers every club.
+    """
     auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
     if not auction:
         raise HTTPException(status_code=404, detail="Auction not found")
     
-    # Get club queue - these are the ONLY clubs in this auction
-    club_queue = auction.get("clubQueue", [])
-    unsold_clubs = auction.get("unsoldClubs", [])
+    # Prompt 3: Only clubs in the auction queue - respects assetsSelected
+    total_clubs = queue_length(auction)
+    unsold_set = set(auction.get("unsoldClubs", []))
     current_club_id = auction.get("currentClubId")
-    # Prompt 3: Only get clubs that are in the auction queue
-    # This respects assetsSelected - if 9 clubs selected, only those 9 are in queue
-    if not club_queue:
+    if not total_clubs:
         return {
             "clubs": [],
             "summary": {
@@ -4875,66 +5273,88 @@ async def get_auction_clubs(auction_id: str):
     league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
     sport_key = league.get("sportKey", "football") if league else "football"
     
-    # Fetch only clubs that are in the auction queue
-    if sport_key == "football":
-        auction_clubs = await db.assets.find({"id": {"$in": club_queue}}).to_list(len(club_queue))
+    # Sold/unsold come from the sets settlement maintains - a bid alone is not a sale
+    if auction.get("soldClubs") is not None:
+        sold_set = set(auction["soldClubs"])
     else:
-        auction_clubs = await db.assets.find({
-            "id": {"$in": club_queue},
-            "sportKey": sport_key
-        }).to_list(len(club_queue))
-    
-    # Get all bids to determine sold clubs
-    all_bids = await db.bids.find({"auctionId": auction_id}, {"_id": 0}).to_list(1000)
+        participants = await db.league_participants.find(
+            {"leagueId": auction["leagueId"]}, {"_id": 0, "clubsWon": 1}
+        ).to_list(None)
+        sold_set = set(sold_club_ids(auction, participants))
+    
+    if page is not None:
+        page, pageSize = max(page, 1), max(1, min(pageSize, 500))
+    skip, limit = ((page - 1) * pageSize, pageSize) if page is not None else (0, 0)
+    
+    # Display fields come from the lot catalog, with their lot number
+    if auction.get("clubQueue"):
+        # Auctions from before the lot catalog carry their queue on the document
+        auction_clubs = []
+        for index, club_id in enumerate(auction["clubQueue"]):
+            club = await lot_catalogs.asset(auction_id, club_id, sport_key)
+            if club:
+                auction_clubs.append({**club, "lotNumber": index + 1})
+        auction_clubs.sort(key=lambda club: club.get("name") or "")
+        auction_clubs = auction_clubs[skip:skip + limit] if limit else auction_clubs
+    else:
+        auction_clubs = await lot_catalogs.lots_page(auction_id, skip, limit)
     
-    # Group bids by club to find winners
+    # Price and winner of each sold club on this page: its highest bid, grouped in Mongo
     bids_by_club = {}
-    for bid in all_bids:
-        club_id = bid["clubId"]
-        if club_id not in bids_by_club or bid["amount"] > bids_by_club[club_id]["amount"]:
-            bids_by_club[club_id] = bid
+    sold_on_page = [club["id"] for club in auction_clubs if club["id"] in sold_set]
+    if sold_on_page:
+        async for top_bid in db.bids.aggregate([
+            {"$match": {"auctionId": auction_id, "clubId": {"$in": sold_on_page}}},
+            {"$sort": {"amount": -1}},
+            {"$group": {"_id": "$clubId", "amount": {"$first": "$amount"}, "userName": {"$first": "$userName"}}}
+        ]):
+            bids_by_club[top_bid["_id"]] = top_bid
     
     clubs_with_status = []
-    
     for club in auction_clubs:
-        club.pop('_id', None)  # Remove MongoDB ID
-        
         # Determine club status
         club_id = club["id"]
         status = "upcoming"  # Default status
         winner = None
         winning_bid = None
-        lot_number = None
-        
-        # Find lot number if club is in queue
-        try:
-            lot_index = club_queue.index(club_id)
-            lot_number = lot_index + 1
-        except ValueError:
-            lot_number = None
         
         if club_id == current_club_id:
             status = "current"
-        elif club_id in unsold_clubs:
-            status = "unsold"
-        elif club_id in bids_by_club:
-            # Club has bids and lot has passed
-            winning_bid_data = bids_by_club[club_id]
+        elif club_id in sold_set:
+            winning_bid_data = bids_by_club.get(club_id, {})
             winner = winning_bid_data.get("userName", "Unknown")
             winning_bid = winning_bid_data.get("amount", 0)
             status = "sold"
+        elif club_id in unsold_set:
+            status = "unsold"
         # If none of above, status remains "upcoming"
         
-        # Add club with status
-        club_data = Club(**club).model_dump() if sport_key == "football" else club
+        # Add club with status (catalog entries are already in display shape)
         clubs_with_status.append({
-            **club_data,
+            **club,
             "status": status,
-            "lotNumber": lot_number,
             "winner": winner,
             "winningBid": winning_bid
         })
     
+    sold_count = len(sold_set)
+    unsold_count = len(unsold_set - {current_club_id})
+    summary = {
+        "totalClubs": total_clubs,  # Prompt 3: Only clubs in auction queue
+        "soldClubs": sold_count,
+        "unsoldClubs": unsold_count,
+        "remainingClubs": max(total_clubs - sold_count - unsold_count, 0)
+    }
+    if page is not None:
+        # Pages stay in name order - sorting by status would need the whole catalog
+        return {
+            "clubs": clubs_with_status,
+            "summary": summary,
+            "page": page,
+            "pageSize": pageSize,
+            "total": total_clubs
+        }
+    
     # Sort by status first, then alphabetically (hide draw order for strategy)
     def sort_key(club):
         if club["status"] == "current":
@@ -4947,16 +5367,7 @@ async def get_auction_clubs(auction_id: str):
             return (3, club["name"])  # Upcoming alphabetically (hide draw order)
     
     clubs_with_status.sort(key=sort_key)
-    
-    return {
-        "clubs": clubs_with_status,
-        "summary": {
-            "totalClubs": len(auction_clubs),  # Prompt 3: Only clubs in auction queue
-            "soldClubs": len([c for c in clubs_with_status if c["status"] == "sold"]),
-            "unsoldClubs": len([c for c in clubs_with_status if c["status"] == "unsold"]),
-            "remainingClubs": len([c for c in clubs_with_status if c["status"] in ["upcoming", "current"]])
-        }
-    }
+    return {"clubs": clubs_with_status, "summary": summary}
 
 @api_router.get("/auction/{auction_id}")
 async def get_auction(auction_id: str):
@@ -4970,46 +5381,246 @@ async def get_auction(auction_id: str):
         bids = await db.bids.find({
             "auctionId": auction_id,
             "clubId": current_club_id
-        }, {"_id": 0}).to_list(100)
+        }, {"_id": 0}).to_list(None)
     else:
         bids = []
     
     # Get current asset if exists
     current_asset = None
     if auction.get("currentClubId"):
-        # First get the league to determine sport
-        league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
-        sport_key = league.get("sportKey", "football") if league else "football"
-        
-        if sport_key == "football":
-            # Get from clubs collection for football
-            asset = await db.assets.find_one({"id": auction["currentClubId"]}, {"_id": 0})
-            if asset:
-                current_asset = Club(**asset)
-        else:
-            # Get from assets collection for other sports
-            asset = await db.assets.find_one({"id": auction["currentClubId"]}, {"_id": 0})
-            if asset:
-                # Clean up MongoDB fields for JSON serialization
-                if "_id" in asset:
-                    del asset["_id"]
-                current_asset = asset
+        current_asset = await lot_catalogs.asset(auction_id, auction["currentClubId"])
+    
+    # Waiting room = users with a socket in the auction room right now (presence, not stored)
+    waiting_users = await room_presence.user_ids(f"auction:{auction_id}") if auction.get("status") == "waiting" else []
     
+    # The lot order is not sent (clients page GET /auction/{id}/clubs, queueLength gives the size);
+    # auctions from before the lot catalog still carry clubQueue on the document
     return {
-        "auction": Auction(**auction),
+        "auction": Auction(**{
+            **auction,
+            "queueLength": queue_length(auction),
+            "usersInWaitingRoom": waiting_users
+        }),
         "bids": [Bid(**bid) for bid in bids],
         "currentClub": current_asset  # Keep field name for backward compatibility
     }
 
+def _reject_bid(rejection: BidRejected, user_id: str) -> HTTPException:
+    """Turn a BidRejected into the HTTPException the endpoint returns, counting the metric"""
+    if rejection.reason:
+        metrics.increment_bid_rejected(rejection.reason)
+    logger.warning(f"Bid rejected for user {user_id}: {rejection.detail}")
+    return HTTPException(status_code=rejection.status_code, detail=rejection.detail)
+
+
+bid_rate_limiter = (
+    TokenBucketLimiter(BID_RATE_LIMIT_PER_SECOND, BID_RATE_LIMIT_BURST)
+    if ENABLE_RATE_LIMITING and BID_RATE_LIMIT_PER_SECOND > 0 else None
+)
+
+async def _check_bid_rate(auction_id: str, user_id: str) -> None:
+    """Reject a user's bid over their per-auction rate before any DB access (not logged - floods would)"""
+    if bid_rate_limiter and not await bid_rate_limiter.allow(f"{auction_id}:{user_id}"):
+        metrics.increment_bid_rejected("rate_limited")
+        raise HTTPException(
+            status_code=429, detail="Too many bids - slow down",
+            headers={"Retry-After": str(retry_after_seconds(BID_RATE_LIMIT_PER_SECOND))}
+        )
+
+
+async def _broadcast_accepted_bid(auction_id: str, lot_id: Optional[str], bid_obj: Bid,
+                                  current_bidder: dict, bid_sequence: int,
+                                  extended_until: Optional[datetime] = None):
+    """Emit bid_update (+ legacy bid_placed) and, if the bid extended the lot, anti_snipe"""
+    # JSON log for debugging
+    logger.info(json.dumps({
+        "event": "bid_update",
+        "auctionId": auction_id,
+        "lotId": lot_id,
+        "seq": bid_sequence,
+        "amount": bid_obj.amount,
+        "bidderId": bid_obj.userId,
+        "bidderName": current_bidder["displayName"],
+        "roomSize": room_presence.cached_socket_count(f"auction:{auction_id}"),  # No I/O on the bid path
+        "timestamp": datetime.now(timezone.utc).isoformat()
+    }))
+    
+    # One frame for everyone: protocol 2 clients take the bid history entry from it too
+    server_time = datetime.now(timezone.utc).isoformat()
+    bid_data = bid_obj.model_dump(mode='json')
+    bid_data.pop('userEmail', None)  # Privacy
+    await emit_auction_event(auction_id, 'bid_update', {
+        'lotId': lot_id,
+        'amount': bid_obj.amount,
+        'bidder': current_bidder,
+        'seq': bid_sequence,
+        'serverTime': server_time,
+        'bid': bid_data
+    })
+    
+    # Legacy bid_placed only for protocol 1 clients
+    await sio.emit('bid_placed', {
+        'bid': bid_data,
+        'auctionId': auction_id,
+        'clubId': bid_obj.clubId,
+        'serverTime': server_time
+    }, room=legacy_bid_room(auction_id))
+    
+    if extended_until and lot_id:
+        # Push the new deadline straight into the scheduler - no polling picks it up
+        await extend_lot_timer(auction_id, lot_id, extended_until)
+        ends_at_ms = int(extended_until.timestamp() * 1000)
+        timer_data = await create_timer_event(lot_id, ends_at_ms)
+        
+        await emit_auction_event(auction_id, 'anti_snipe', timer_data)
+        
+        logger.info(f"Anti-snipe triggered for lot {lot_id}: seq={timer_data['seq']}, new end={timer_data['endsAt']}")
+
+
+async def _lost_bid_race(auction_id: str, club_id: str, user_id: str) -> HTTPException:
+    """
+    Explain why a guarded bid update matched nothing. Only runs on the losing path,
+    so the extra read never touches accepted bids.
+    """
+    current = await db.auctions.find_one(
+        {"id": auction_id},
+        {"_id": 0, "status": 1, "currentClubId": 1, "currentBid": 1, "currentBidder": 1}
+    )
+    if not current:
+        return HTTPException(status_code=404, detail="Auction not found")
+    if current.get("status") != "active":
+        return HTTPException(status_code=400, detail=f"Auction is not active (status: {current.get('status')})")
+    if current.get("currentClubId") != club_id:
+        metrics.increment_bid_rejected("lot_closed")
+        return HTTPException(status_code=409, detail="This lot has closed. Please bid on the current team.")
+    bidder = current.get("currentBidder") or {}
+    if bidder.get("userId") == user_id:
+        return _reject_bid(BidRejected(400, "You are already the highest bidder", "self_outbid"), user_id)
+    winning_amount = current.get("currentBid") or 0
+    metrics.increment_bid_rejected("outbid_race")
+    logger.warning(f"Bid lost race for user {user_id}: current bid £{winning_amount:,.0f}")
+    return HTTPException(
+        status_code=409,
+        detail=f"Outbid: current bid is now £{winning_amount:,.0f}. Please bid higher."
+    )
+
+
+def _bid_response(bid_obj: Bid) -> dict:
+    return {
+        "message": "Bid placed successfully",
+        "bid": {
+            "userId": bid_obj.userId,
+            "amount": bid_obj.amount,
+            "clubId": bid_obj.clubId,
+            "auctionId": bid_obj.auctionId,
+            "userName": bid_obj.userName
+        }
+    }
+
+
+async def _place_bid_in_memory(state, bid_input: BidCreate, start_time: float) -> dict:
+    """
+    Accept a bid against the in-memory auction state (FEATURE_AUCTION_STATE_CACHE).
+    No Mongo round trips on the happy path - persistence goes through the write-behind queue.
+    """
+    auction_id = state.auction_id
+    
+    if bid_input.userId not in state.participants:
+        # Might have joined after the state was loaded - check once before rejecting
+        if not await auction_states.refresh_participant(auction_id, bid_input.userId):
+            user = await db.users.find_one({"id": bid_input.userId}, {"_id": 0, "id": 1})
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+            raise HTTPException(status_code=403, detail="User is not a participant in this league")
+    
+    try:
+        accepted = state.accept_bid(bid_input.userId, bid_input.amount, datetime.now(timezone.utc))
+    except BidRejected as e:
+        raise _reject_bid(e, bid_input.userId)
+    
+    bid_obj = Bid(
+        auctionId=auction_id,
+        clubId=accepted.club_id,
+        userId=bid_input.userId,
+        amount=bid_input.amount,
+        userName=accepted.participant.userName,
+        userEmail=accepted.participant.userEmail
+    )
+    auction_states.persist_bid(state, accepted, bid_obj.model_dump())
+    
+    # Metrics: Track successful bid
+    metrics.increment_bid_accepted(auction_id)
+    metrics.observe_bid_latency(time.time() - start_time)
+    
+    await _broadcast_accepted_bid(
+        auction_id, accepted.lot_id, bid_obj, state.current_bidder,
+        accepted.bid_sequence, accepted.extended_until
+    )
+    
+    return _bid_response(bid_obj)
+
+
+bid_idempotency = BidIdempotencyStore(
+    ttl_seconds=BID_IDEMPOTENCY_TTL_SECONDS, on_duplicate=metrics.increment_bid_duplicate
+)
+
 @api_router.post("/auction/{auction_id}/bid")
-async def place_bid(auction_id: str, bid_input: BidCreate):
+async def place_bid(auction_id: str, bid_input: BidCreate,
+                    idempotency_key: Optional[str] = Header(None, alias="Idempotency-Key")):
+    """
+    Place a bid. With an Idempotency-Key header (or clientBidId) a retry of the same
+    bid returns the original result - accepted or rejected - without running again.
+    """
+    return await _place_bid(auction_id, bid_input, idempotency_key or bid_input.clientBidId)
+
+async def _place_bid(auction_id: str, bid_input: BidCreate, key: Optional[str], user: Optional[dict] = None) -> dict:
+    """place_bid without the HTTP layer; user (id/name/email) is passed by callers that already know it"""
+    if not key:
+        await _check_bid_rate(auction_id, bid_input.userId)
+        return await _accept_bid(auction_id, bid_input, user=user)
+    if len(key) > MAX_KEY_LENGTH:
+        raise HTTPException(status_code=400, detail=f"Idempotency key longer than {MAX_KEY_LENGTH} characters")
+    
+    async def execute() -> BidOutcome:
+        try:
+            # Inside execute so a retry answered from the store doesn't spend a token
+            await _check_bid_rate(auction_id, bid_input.userId)
+            return BidOutcome(200, await _accept_bid(auction_id, bid_input, user=user))
+        except HTTPException as e:
+            return BidOutcome(e.status_code, e.detail)
+    
+    outcome = await bid_idempotency.run(auction_id, bid_input.userId, key, execute)
+    if outcome.status != 200:
+        raise HTTPException(status_code=outcome.status, detail=outcome.body)
+    return outcome.body
+
+async def _accept_bid(auction_id: str, bid_input: BidCreate, run_proxies: bool = True,
+                      user: Optional[dict] = None) -> dict:
+    """
+    Validate and accept one bid, then let registered proxy maxima answer it.
+    user (id/name/email, e.g. from an authenticated socket session) saves the user lookup.
+    """
     # Metrics: Track bid processing time
     start_time = time.time()
     
+    if FEATURE_AUCTION_STATE_CACHE:
+        try:
+            state = await auction_states.get_or_load(auction_id)
+        except BidRejected as e:
+            raise _reject_bid(e, bid_input.userId)
+        if state:
+            response = await _place_bid_in_memory(state, bid_input, start_time)
+            if run_proxies and state.proxy_bids:
+                await _run_proxy_bids(auction_id, state.current_bid, state.current_bidder, state.proxy_bids)
+            return response
+    
     # OPTIMIZATION: Parallel batch 1 - Get auction and user simultaneously
     auction_task = db.auctions.find_one({"id": auction_id}, {"_id": 0})
-    user_task = db.users.find_one({"id": bid_input.userId}, {"_id": 0})
-    auction, user = await asyncio.gather(auction_task, user_task)
+    if user and user.get("id") == bid_input.userId:
+        auction = await auction_task
+    else:
+        user_task = db.users.find_one({"id": bid_input.userId}, {"_id": 0})
+        auction, user = await asyncio.gather(auction_task, user_task)
     
     # Validate auction
     if not auction:
@@ -5038,75 +5649,56 @@ async def place_bid(auction_id: str, bid_input: BidCreate):
     if not participant:
         raise HTTPException(status_code=403, detail="User is not a participant in this league")
     
-    # Check minimum bid amount
-    minimum_budget = auction.get("minimumBudget", 1000000.0)  # Default £1m
-    if bid_input.amount < minimum_budget:
-        metrics.increment_bid_rejected("minimum_bid")
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Bid must be at least £{minimum_budget:,.0f}"
-        )
-    
-    # Check if user has enough budget
-    if bid_input.amount > participant["budgetRemaining"]:
-        metrics.increment_bid_rejected("insufficient_budget")
-        raise HTTPException(
-            status_code=400, 
-            detail=f"Insufficient budget. You have £{participant['budgetRemaining']:,.0f} remaining"
+    current_club_id = auction.get("currentClubId")
+    current_bidder_info = auction.get("currentBidder")
+    try:
+        validate_bid(
+            user_id=bid_input.userId,
+            amount=bid_input.amount,
+            minimum_budget=auction.get("minimumBudget", 1000000.0),  # Default £1m
+            budget_remaining=participant["budgetRemaining"],
+            clubs_won_count=len(participant.get("clubsWon", [])),
+            club_slots=league.get("clubSlots", 3),
+            current_club_id=current_club_id,
+            current_bid=auction.get("currentBid"),
+            current_bidder_id=current_bidder_info.get("userId") if current_bidder_info else None
         )
+    except BidRejected as e:
+        raise _reject_bid(e, bid_input.userId)
     
-    # Everton Bug Fix: Enforce budget reserve for remaining slots
-    # User must keep £1m per remaining slot (except on final slot)
-    clubs_won_count = len(participant.get("clubsWon", []))
-    max_slots = league.get("clubSlots", 3)
-    slots_remaining = max_slots - clubs_won_count
-    
-    if slots_remaining > 1:  # Not on final slot
-        # Must reserve £1m per remaining slot
-        reserve_needed = (slots_remaining - 1) * 1_000_000
-        max_allowed_bid = participant["budgetRemaining"] - reserve_needed
-        
-        if bid_input.amount > max_allowed_bid:
-            metrics.increment_bid_rejected("insufficient_reserve")
-            raise HTTPException(
-                status_code=400,
-                detail=f"Must reserve £{reserve_needed/1_000_000:.0f}m for {slots_remaining - 1} remaining slot(s). "
-                       f"Max bid: £{max_allowed_bid/1_000_000:.1f}m"
-            )
-    
-    # Check if user has reached roster limit (Prompt C: Roster enforcement)
-    if clubs_won_count >= max_slots:
-        metrics.increment_bid_rejected("roster_full")
-        raise HTTPException(
-            status_code=400,
-            detail=f"Roster full. You already own {clubs_won_count}/{max_slots} teams"
-        )
+    current_bidder = {
+        "userId": bid_input.userId,
+        "displayName": user["name"]
+    }
     
-    # Get current club from auction
-    current_club_id = auction.get("currentClubId")
-    if not current_club_id:
-        raise HTTPException(status_code=400, detail="No club currently on the block. Please wait for commissioner to start a lot.")
+    # Accept with one guarded write: the filter re-checks lot/status/current bid so a bid
+    # that lost a race is rejected cleanly, and anti-snipe is applied in the same update
+    bid_filter, bid_update, extended_until = guarded_bid_update(
+        auction_id=auction_id,
+        club_id=current_club_id,
+        user_id=bid_input.userId,
+        amount=bid_input.amount,
+        current_bidder=current_bidder,
+        anti_snipe_seconds=auction.get("antiSnipeSeconds", 10),
+        now=datetime.now(timezone.utc)
+    )
+    updated_auction = await db.auctions.find_one_and_update(
+        bid_filter,
+        bid_update,
+        return_document=ReturnDocument.AFTER,
+        projection={"_id": 0, "bidSequence": 1, "timerEndsAt": 1}
+    )
     
-    # CRITICAL: Prevent user from outbidding themselves
-    current_bid = auction.get("currentBid") or 0
-    current_bidder_info = auction.get("currentBidder")
-    if current_bidder_info and current_bidder_info.get("userId") == bid_input.userId:
-        logger.warning(f"Bid rejected: User {bid_input.userId} tried to outbid themselves")
-        metrics.increment_bid_rejected("self_outbid")
-        raise HTTPException(
-            status_code=400,
-            detail="You are already the highest bidder"
-        )
+    if not updated_auction:
+        raise await _lost_bid_race(auction_id, current_club_id, bid_input.userId)
     
-    # CRITICAL: Bid must exceed current highest bid
-    if current_bid > 0 and bid_input.amount <= current_bid:
-        logger.warning(f"Bid rejected: {bid_input.amount} <= {current_bid}")
-        raise HTTPException(
-            status_code=400,
-            detail=f"Bid must exceed current bid of £{current_bid:,.0f}. Please bid higher."
-        )
+    new_bid_sequence = updated_auction.get("bidSequence", 1)
+    timer_end = updated_auction.get("timerEndsAt")
+    if timer_end and timer_end.tzinfo is None:
+        timer_end = timer_end.replace(tzinfo=timezone.utc)
+    new_end_time = extended_until if timer_end == extended_until else None
     
-    # Create bid
+    # Create bid (only accepted bids are recorded)
     bid_obj = Bid(
         auctionId=auction_id,
         clubId=current_club_id,
@@ -5115,124 +5707,139 @@ async def place_bid(auction_id: str, bid_input: BidCreate):
         userName=user["name"],
         userEmail=user["email"]
     )
-    await db.bids.insert_one(bid_obj.model_dump())
+    try:
+        await db.bids.insert_one(bid_obj.model_dump())
+    except Exception as e:
+        # complete_lot reads the winner from bids - a leader without a row must not stay on the auction
+        rollback_filter, rollback_update = bid_rollback_update(
+            auction_id, bid_input.userId, bid_input.amount, new_bid_sequence, auction
+        )
+        try:
+            rolled_back = await db.auctions.update_one(rollback_filter, rollback_update)
+            logger.error(f"❌ Bid row for {bid_input.userId} on auction {auction_id} not written, "
+                         f"{'rolled back' if rolled_back.modified_count else 'already outbid'}: {e}")
+        except Exception as rollback_error:
+            logger.error(f"❌ Bid on auction {auction_id} neither recorded nor rolled back: {rollback_error}")
+        raise HTTPException(status_code=503, detail="Bid could not be recorded, please retry")
     
     # Metrics: Track successful bid
     metrics.increment_bid_accepted(auction_id)
     metrics.observe_bid_latency(time.time() - start_time)
     
-    # Update auction with current bid info and increment sequence atomically (Prompt B)
-    current_bidder = {
-        "userId": bid_input.userId,
-        "displayName": user["name"]
-    }
-    
-    # Use atomic find_one_and_update to avoid race conditions and reduce DB calls
-    updated_auction = await db.auctions.find_one_and_update(
-        {"id": auction_id},
-        {
-            "$set": {
-                "currentBid": bid_input.amount,
-                "currentBidder": current_bidder
-            },
-            "$inc": {
-                "bidSequence": 1
-            }
-        },
-        return_document=ReturnDocument.AFTER,
-        projection={"bidSequence": 1}
-    )
-    new_bid_sequence = updated_auction.get("bidSequence", 1)
+    # Get lot ID (older auctions may only have currentLot)
+    lot_id = auction.get("currentLotId")
+    if not lot_id and auction.get("currentLot"):
+        lot_id = f"{auction_id}-lot-{auction['currentLot']}"
     
-    # Get room size for debugging
-    room_sockets = {} if not hasattr(sio.manager, "rooms") else sio.manager.rooms.get(f"auction:{auction_id}", {}).get("/", set())
-    room_size = len(room_sockets)
-    
-    # JSON log for debugging
-    logger.info(json.dumps({
-        "event": "bid_update",
-        "auctionId": auction_id,
-        "lotId": auction.get("currentLotId"),
-        "seq": new_bid_sequence,
-        "amount": bid_input.amount,
-        "bidderId": bid_input.userId,
-        "bidderName": user["name"],
-        "roomSize": room_size,
-        "timestamp": datetime.now(timezone.utc).isoformat()
-    }))
-    
-    # Emit bid update to all users (Everyone sees current bid)
-    await sio.emit('bid_update', {
-        'lotId': auction.get("currentLotId"),
-        'amount': bid_input.amount,
-        'bidder': current_bidder,
-        'seq': new_bid_sequence,
-        'serverTime': datetime.now(timezone.utc).isoformat()
-    }, room=f"auction:{auction_id}")
-    
-    # Also emit legacy bid_placed for backward compatibility (strip userEmail for privacy)
-    bid_data = bid_obj.model_dump(mode='json')
-    bid_data.pop('userEmail', None)
-    await sio.emit('bid_placed', {
-        'bid': bid_data,
-        'auctionId': auction_id,
-        'clubId': current_club_id,
-        'serverTime': datetime.now(timezone.utc).isoformat()
-    }, room=f"auction:{auction_id}")
-    
-    # Check for anti-snipe
-    if auction.get("timerEndsAt"):
-        timer_end = auction["timerEndsAt"]
-        if timer_end.tzinfo is None:
-            timer_end = timer_end.replace(tzinfo=timezone.utc)
-        time_remaining = (timer_end - datetime.now(timezone.utc)).total_seconds()
-        if time_remaining <= auction["antiSnipeSeconds"] and time_remaining > 0:
-            # Extend timer
-            new_end_time = datetime.now(timezone.utc) + timedelta(seconds=auction["antiSnipeSeconds"])
-            await db.auctions.update_one(
-                {"id": auction_id},
-                {"$set": {"timerEndsAt": new_end_time}}
-            )
-            
-            # Get lot ID and create anti-snipe timer data
-            lot_id = auction.get("currentLotId")
-            if not lot_id and auction.get("currentLot"):
-                lot_id = f"{auction_id}-lot-{auction['currentLot']}"
-            
-            if lot_id:
-                ends_at_ms = int(new_end_time.timestamp() * 1000)
-                timer_data = create_timer_event(lot_id, ends_at_ms)
-                
-                await sio.emit('anti_snipe', timer_data, room=f"auction:{auction_id}")
-                
-                logger.info(f"Anti-snipe triggered for lot {lot_id}: seq={timer_data['seq']}, new end={timer_data['endsAt']}")
+    await _broadcast_accepted_bid(auction_id, lot_id, bid_obj, current_bidder, new_bid_sequence, new_end_time)
     
     # DIAGNOSTIC: Check what completion status should be after this bid
     # Only run in debug mode to avoid extra DB queries in production
     if os.environ.get("DEBUG_AUCTION"):
         league_debug = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
-        participants_debug = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(100)
         auction_state = {
-            "lots_sold": sum(1 for p in participants_debug for c in p.get("clubsWon", [])),
             "current_lot": auction.get("currentLot", 0),
-            "total_lots": len(auction.get("clubQueue", [])),
+            "total_lots": queue_length(auction),
             "unsold_count": len(auction.get("unsoldClubs", []))
         }
-        status = compute_auction_status(league_debug, participants_debug, auction_state)
+        counters = await load_completion_counters(auction, league_debug)
+        status = compute_status_from_counters(league_debug, counters, auction_state)
         logger.info(f"🔍 AUCTION_STATUS after bid: {json.dumps(status)}")
     
     # Note: Roster fullness check moved to complete_lot (after clubs are awarded)
     
-    return {
-        "message": "Bid placed successfully",
-        "bid": {
-            "userId": bid_obj.userId,
-            "amount": bid_obj.amount,
-            "clubId": bid_obj.clubId,
-            "auctionId": bid_obj.auctionId,
-            "userName": bid_obj.userName
-        }
-    }
+    proxies = current_proxies(auction)
+    if run_proxies and proxies:
+        await _run_proxy_bids(auction_id, bid_input.amount, current_bidder, proxies)
+    
+    return _bid_response(bid_obj)
+
+async def _run_proxy_bids(auction_id: str, current_bid: Optional[float], current_bidder: Optional[dict],
+                          proxies: dict):
+    """Place the visible bids the registered maxima produce (at most two) through the normal path"""
+    leader_id = current_bidder.get("userId") if current_bidder else None
+    for user_id, amount in resolve_proxy_bids(current_bid, leader_id, proxies):
+        try:
+            await _accept_bid(auction_id, BidCreate(userId=user_id, amount=amount), run_proxies=False)
+            logger.info(f"🤖 Proxy bid placed for {user_id}: £{amount:,.0f} (auction {auction_id})")
+        except HTTPException as e:
+            # Lost a race with a manual bid or the lot ended - the next bid re-resolves
+            logger.info(f"Proxy bid for {user_id} at £{amount:,.0f} not placed: {e.detail}")
+            break
+
+@api_router.post("/auction/{auction_id}/proxy-bid")
+async def set_proxy_bid(auction_id: str, proxy_input: ProxyBidCreate):
+    """
+    Register (or change) a private maximum for the current lot. The maximum is checked
+    against the same budget-reserve and roster rules as a bid, and competing maxima are
+    resolved straight away; only the resulting visible price is broadcast.
+    """
+    user_id = proxy_input.userId
+    await _check_bid_rate(auction_id, user_id)
+    state = None
+    if FEATURE_AUCTION_STATE_CACHE:
+        try:
+            state = await auction_states.get_or_load(auction_id)
+        except BidRejected as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+    
+    if state:
+        if user_id not in state.participants and not await auction_states.refresh_participant(auction_id, user_id):
+            raise HTTPException(status_code=403, detail="User is not a participant in this league")
+        participant = state.participants[user_id]
+        status, lot_id, club_id = state.status, state.current_lot_id, state.current_club_id
+        current_bid, current_bidder = state.current_bid, state.current_bidder
+        minimum_budget, club_slots = state.minimum_budget, state.club_slots
+        budget_remaining, clubs_won_count = participant.budgetRemaining, participant.rosterCount
+        proxies = state.proxy_bids
+    else:
+        auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
+        if not auction:
+            raise HTTPException(status_code=404, detail="Auction not found")
+        league, participant = await asyncio.gather(
+            db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0, "clubSlots": 1}),
+            db.league_participants.find_one({"leagueId": auction["leagueId"], "userId": user_id}, {"_id": 0})
+        )
+        if not participant:
+            raise HTTPException(status_code=403, detail="User is not a participant in this league")
+        status, lot_id, club_id = auction.get("status"), auction.get("currentLotId"), auction.get("currentClubId")
+        current_bid, current_bidder = auction.get("currentBid"), auction.get("currentBidder")
+        minimum_budget, club_slots = auction.get("minimumBudget", 1000000.0), (league or {}).get("clubSlots", 3)
+        budget_remaining, clubs_won_count = participant["budgetRemaining"], len(participant.get("clubsWon", []))
+        proxies = current_proxies(auction)
+    
+    if status != "active":
+        raise HTTPException(status_code=400, detail=f"Auction is not active (status: {status})")
+    if not lot_id:
+        raise HTTPException(status_code=400, detail="No lot is running")
+    
+    # The maximum must be a bid this user could place now (the leader may raise their own maximum)
+    try:
+        validate_bid(
+            user_id=user_id,
+            amount=proxy_input.maxAmount,
+            minimum_budget=minimum_budget,
+            budget_remaining=budget_remaining,
+            clubs_won_count=clubs_won_count,
+            club_slots=club_slots,
+            current_club_id=club_id,
+            current_bid=current_bid,
+            current_bidder_id=None
+        )
+    except BidRejected as e:
+        raise _reject_bid(e, user_id)
+    
+    entry = {"maxAmount": proxy_input.maxAmount, "at": time.time()}
+    for query, update in proxy_set_updates(auction_id, lot_id, user_id, entry):
+        if (await db.auctions.update_one(query, update)).matched_count:
+            break
+    else:
+        raise HTTPException(status_code=409, detail="The lot has changed - proxy bid not registered")
+    proxies[user_id] = entry
+    
+    await _run_proxy_bids(auction_id, current_bid, current_bidder, proxies)
+    
+    return {"message": "Proxy bid registered", "lotId": lot_id, "maxAmount": proxy_input.maxAmount}
 
 @api_router.options("/auction/{auction_id}/bid")
 async def bid_preflight(auction_id: str):
@@ -5250,7 +5857,7 @@ async def bid_preflight(auction_id: str):
     return {
         "message": "Preflight OK",
         "allowed_methods": ["POST", "OPTIONS"],
-        "allowed_headers": ["Authorization", "Content-Type", "Accept", "x-user-id"]
+        "allowed_headers": ["Authorization", "Content-Type", "Accept", "x-user-id", "Idempotency-Key"]
     }
 
 @api_router.post("/auction/{auction_id}/start-lot/{club_id}")
@@ -5260,25 +5867,25 @@ async def start_lot(auction_id: str, club_id: str):
     if not auction:
         raise HTTPException(status_code=404, detail="Auction not found")
     
-    club = await db.assets.find_one({"id": club_id}, {"_id": 0})
-    if not club:
+    # Update auction with current lot
+    new_lot_number = auction["currentLot"] + 1
+    lot_id = f"{auction_id}-lot-{new_lot_number}"
+    lot_frame = await lot_catalogs.lot_started(auction_id, lot_id, new_lot_number, club_id)
+    if not lot_frame:
         raise HTTPException(status_code=404, detail="Club not found")
+    club = lot_frame["club"]
     
     # DIAGNOSTIC: Check completion status before starting next lot
     league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
-    participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(100)
     auction_state = {
-        "lots_sold": sum(1 for p in participants for c in p.get("clubsWon", [])),
         "current_lot": auction.get("currentLot", 0),
-        "total_lots": len(auction.get("clubQueue", [])),
+        "total_lots": queue_length(auction),
         "unsold_count": len(auction.get("unsoldClubs", []))
     }
-    status = compute_auction_status(league, participants, auction_state)
+    counters = await load_completion_counters(auction, league)
+    status = compute_status_from_counters(league, counters, auction_state)
     logger.info(f"🔍 AUCTION_STATUS before starting lot: {json.dumps(status)}")
     
-    # Update auction with current lot
-    new_lot_number = auction["currentLot"] + 1
-    lot_id = f"{auction_id}-lot-{new_lot_number}"
     timer_end = datetime.now(timezone.utc) + timedelta(seconds=auction["bidTimer"])
     
     await db.auctions.update_one(
@@ -5296,33 +5903,42 @@ async def start_lot(auction_id: str, club_id: str):
     if timer_end.tzinfo is None:
         timer_end = timer_end.replace(tzinfo=timezone.utc)
     ends_at_ms = int(timer_end.timestamp() * 1000)
-    timer_data = create_timer_event(lot_id, ends_at_ms)
+    timer_data = await create_timer_event(lot_id, ends_at_ms)
     
     # Emit lot start
-    await sio.emit('lot_started', {
-        'club': Club(**club).model_dump(),
-        'lotNumber': new_lot_number,
-        'timer': timer_data
-    }, room=f"auction:{auction_id}")
+    await emit_auction_event(auction_id, 'lot_started', {**lot_frame, 'timer': timer_data})
     
     logger.info(f"Manual start lot {lot_id}: {club['name']}, seq={timer_data['seq']}")
     
     # Start timer countdown
-    asyncio.create_task(countdown_timer(auction_id, timer_end, lot_id))
+    await refresh_auction_state(auction_id)
+    await schedule_lot_timer(auction_id, lot_id, timer_end)
     
-    return {"message": "Lot started", "club": Club(**club)}
+    return {"message": "Lot started", "club": club}
+
+# One settlement per auction at a time; concurrent triggers await the running one
+settlement_flight = SingleFlight()
 
 @api_router.post("/auction/{auction_id}/complete-lot")
 async def complete_lot(auction_id: str):
+    """Settle the current lot (single-flight per auction)"""
+    return await settlement_flight.run(auction_id, lambda: _complete_lot(auction_id))
+
+async def _complete_lot(auction_id: str):
     logger.info(f"🎬 COMPLETE_LOT START for auction {auction_id}")
     
+    # Bids accepted in memory must be in Mongo before the winner is read
+    await release_auction_state(auction_id)
+    
     auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
     if not auction:
         raise HTTPException(status_code=404, detail="Auction not found")
     
     current_club_id = auction.get("currentClubId")
     current_lot = auction.get("currentLot", 0)
-    club_queue_length = len(auction.get("clubQueue", []))
+    club_queue_length = queue_length(auction)
+    # Get lot ID (older auctions may only have currentLot) - also the settlement guards' lot identity
+    current_lot_id = auction.get("currentLotId") or f"{auction_id}-lot-{current_lot}"
     
     logger.info(f"   Lot {current_lot}/{club_queue_length}, Club: {current_club_id}")
     
@@ -5343,72 +5959,36 @@ async def complete_lot(auction_id: str):
     if winning_bid:
         winning_bid.pop('_id', None)
     
-    # Handle sold vs unsold scenarios
+    league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
+    counters = await load_completion_counters(auction, league)
+    
+    # Settle with one guarded update - a repeated trigger for this lot matches nothing
+    if FEATURE_SETTLEMENT_TRANSACTIONS:
+        async with await client.start_session() as session:
+            async with session.start_transaction():
+                settlement = await settle_lot(db, auction, league, current_club_id, winning_bid, current_lot_id, session=session)
+    else:
+        settlement = await settle_lot(db, auction, league, current_club_id, winning_bid, current_lot_id)
+    counters = settlement.counters or counters
+    outcome = settlement.outcome
+    
+    if outcome == ALREADY_SETTLED:
+        logger.info(f"   ⚠️ Lot for club {current_club_id} already settled, skipping duplicate")
+        await resume_after_settled_lot(auction, league, counters)
+        return
+    if outcome == PARTICIPANT_MISSING:
+        logger.error(f"   ❌ CRITICAL: Participant NOT FOUND for user {winning_bid['userId']}")
     if winning_bid:
-        # CLUB SOLD - Update winner's budget and clubs
-        participant = await db.league_participants.find_one({
-            "leagueId": auction["leagueId"],
-            "userId": winning_bid["userId"]
-        }, {"_id": 0})
-        
-        if participant:
-            user_winning_clubs = participant.get("clubsWon", [])
-            user_total_spent = participant.get("totalSpent", 0.0)
-            
-            logger.info(f"   BEFORE: User {winning_bid['userId']} has {len(user_winning_clubs)} clubs, spent £{user_total_spent:,.0f}")
-            
-            # Idempotency check: Don't add club if already awarded
-            if current_club_id in user_winning_clubs:
-                logger.info(f"   ⚠️ Club {current_club_id} already awarded to {winning_bid['userId']}, skipping duplicate")
-                return
-            
-            # Add this club and amount
-            user_winning_clubs.append(current_club_id)
-            user_total_spent += winning_bid["amount"]
-            
-            # Calculate remaining budget
-            league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
-            budget_remaining = league["budget"] - user_total_spent
-            
-            # Update participant
-            update_result = await db.league_participants.update_one(
-                {"leagueId": auction["leagueId"], "userId": winning_bid["userId"]},
-                {"$set": {
-                    "clubsWon": user_winning_clubs,
-                    "totalSpent": user_total_spent,
-                    "budgetRemaining": budget_remaining
-                }}
-            )
-            
-            logger.info(f"   AFTER: User {winning_bid['userId']} now has {len(user_winning_clubs)} clubs, spent £{user_total_spent:,.0f}")
-            logger.info(f"   DB Update: modified_count={update_result.modified_count}")
-            
-        else:
-            logger.error(f"   ❌ CRITICAL: Participant NOT FOUND for user {winning_bid['userId']}")
-            
         logger.info(f"✅ Club sold - {current_club_id} to {winning_bid['userId']} for £{winning_bid['amount']:,}")
-    
     else:
-        # CLUB UNSOLD - Add to unsold queue for re-offering later
-        current_unsold = auction.get("unsoldClubs", [])
-        if current_club_id not in current_unsold:
-            current_unsold.append(current_club_id)
-            await db.auctions.update_one(
-                {"id": auction_id},
-                {"$set": {"unsoldClubs": current_unsold}}
-            )
-        
         logger.info(f"Club unsold - {current_club_id} moved to end of queue")
     
-    # Get updated participants
-    participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(100)
-    for p in participants:
-        p.pop('_id', None)
+    # Only the winner's record changed - broadcast that delta, not every participant
+    participant_updates = [settlement.participant] if settlement.participant else []
+    participants_version = settlement.participants_version or auction.get("participantsVersion", 0)
     
     # Check if all rosters are now full (after awarding this club)
-    league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
-    max_slots = league.get("clubSlots", 3)
-    all_full = all(len(p.get("clubsWon", [])) >= max_slots for p in participants)
+    all_full = counters["remainingDemand"] == 0
     
     if all_full:
         logger.info("🏁 All rosters full after lot complete - completing auction early")
@@ -5417,43 +5997,36 @@ async def complete_lot(auction_id: str):
             {"id": auction_id},
             {"$set": {"currentClubId": None, "currentLot": auction.get("currentLot", 0)}}
         )
-        await check_auction_completion(auction_id)
+        await check_auction_completion(
+            auction_id,
+            final_club_id=current_club_id,
+            final_winning_bid=winning_bid,
+            participant_updates=participant_updates
+        )
         return  # Don't proceed to next lot
     
     # Get current club/player details for the event
-    current_asset = None
-    league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
     sport_key = league.get("sportKey", "football") if league else "football"
-    
-    if sport_key == "football":
-        current_asset = await db.assets.find_one({"id": current_club_id}, {"_id": 0})
-    else:
-        current_asset = await db.assets.find_one({"id": current_club_id, "sportKey": sport_key}, {"_id": 0})
+    current_asset = await lot_catalogs.asset(auction_id, current_club_id, sport_key)
     
     asset_name = current_asset.get("name") if current_asset else "Unknown"
     
     # Emit sold/unsold event
-    current_lot_id = auction.get("currentLotId")
-    if not current_lot_id and auction.get("currentLot"):
-        current_lot_id = f"{auction_id}-lot-{auction['currentLot']}"
-    
-    sold_data = {}
-    if current_lot_id:
-        sold_timer_data = create_timer_event(current_lot_id, int(datetime.now(timezone.utc).timestamp() * 1000))
-        sold_data['timer'] = sold_timer_data
+    sold_data = {'timer': await create_timer_event(current_lot_id, int(datetime.now(timezone.utc).timestamp() * 1000))}
     
-    await sio.emit('sold', {
+    await emit_auction_event(auction_id, 'sold', {
         'clubId': current_club_id,
         'clubName': asset_name,  # Include player/club name
         'winningBid': Bid(**winning_bid).model_dump(mode='json') if winning_bid else None,
         'unsold': not bool(winning_bid),  # Flag if club went unsold
-        'participants': [LeagueParticipant(**p).model_dump(mode='json') for p in participants],
+        'participantUpdates': participant_updates,
+        'participantsVersion': participants_version,
         **sold_data
-    }, room=f"auction:{auction_id}")
+    })
     
     # Check if there's a next club to auction
-    logger.info(f"🔍 BEFORE get_next_club: currentLot={auction.get('currentLot')}, queueLen={len(auction.get('clubQueue', []))}")
-    next_club_id = await get_next_club_to_auction(auction_id)
+    logger.info(f"🔍 BEFORE get_next_club: currentLot={auction.get('currentLot')}, queueLen={queue_length(auction)}")
+    next_club_id = await get_next_club_to_auction(auction_id, auction=auction, league=league, counters=counters)
     logger.info(f"🔍 AFTER get_next_club: next_club_id={next_club_id}")
     
     logger.info("auction.next_lot_decision", extra={
@@ -5463,116 +6036,160 @@ async def complete_lot(auction_id: str):
     })
     
     if next_club_id:
-        # Three-second pause before next lot to prevent bid bleed and give thinking time
-        logger.info("⏸️  Starting 3-second pause before next lot")
-        
-        # Emit countdown to all clients
-        for countdown in [3, 2, 1]:
-            await sio.emit("next_team_countdown", {
-                "seconds": countdown,
-                "message": f"Next team in {countdown}..."
-            }, room=f"auction:{auction_id}")
-            await asyncio.sleep(1)
-        
-        # Clear countdown overlay
-        await sio.emit("next_team_countdown", {
-            "seconds": 0,
-            "message": "Starting..."
-        }, room=f"auction:{auction_id}")
-        
-        await start_next_lot(auction_id, next_club_id)
+        # Three-second pause before next lot to prevent bid bleed and give thinking time.
+        # Runs as deferred jobs on the timer loop so settlement returns straight away.
+        logger.info("⏸️  Scheduling 3-second pause before next lot")
+        await record_next_club(auction_id, current_lot, next_club_id)
+        schedule_next_lot(auction_id, current_lot, next_club_id)
     else:
         # No more clubs - auction is complete
         # Pass final club info to completion check
         await check_auction_completion(
             auction_id,
             final_club_id=current_club_id,
-            final_winning_bid=winning_bid
+            final_winning_bid=winning_bid,
+            participant_updates=participant_updates
         )
 
 
-async def get_next_club_to_auction(auction_id: str) -> Optional[str]:
-    """Get the next club to auction, considering queue and unsold clubs"""
-    auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
+async def record_next_club(auction_id: str, completed_lot: int, next_club_id: str):
+    """
+    Keep the chosen next club on the auction until its lot starts, so a re-trigger can
+    reschedule it without choosing again (a re-offer pops the unsold queue).
+    """
+    await db.auctions.update_one(
+        {"id": auction_id, "currentLot": completed_lot},
+        {"$set": {"nextClubId": next_club_id}}
+    )
+
+
+async def resume_after_settled_lot(auction: dict, league: dict, counters: dict):
+    """
+    complete_lot re-triggered for a lot that is already settled (a lease takeover re-firing the
+    expired timer, a retry after the next-lot job failed). The next lot start only exists as
+    deferred jobs, so schedule it again while the auction is still on the settled lot - safe,
+    because the jobs are keyed by lot and start_next_lot checks expected_lot.
+    """
+    auction_id = auction["id"]
+    if auction.get("status") != "active":
+        return
+    current_lot = auction.get("currentLot", 0)
+    next_club_id = auction.get("nextClubId")
+    if not next_club_id:
+        # Settled but the next club was never recorded (the settling process stopped in between)
+        if counters["remainingDemand"] > 0:
+            next_club_id = await get_next_club_to_auction(auction_id, auction=auction, league=league, counters=counters)
+        if not next_club_id:
+            await check_auction_completion(auction_id)
+            return
+        await record_next_club(auction_id, current_lot, next_club_id)
+    logger.info(f"Rescheduling lot {current_lot + 1} of auction {auction_id} after a repeated settlement trigger")
+    schedule_next_lot(auction_id, current_lot, next_club_id)
+
+
+NEXT_LOT_COUNTDOWN_SECONDS = 3
+
+def schedule_next_lot(auction_id: str, completed_lot: int, next_club_id: str):
+    """
+    Queue the inter-lot countdown and the next lot start on lot_timers.
+    Jobs are keyed by the completed lot number, so a repeated trigger for the same
+    lot is ignored while pending and start_next_lot re-checks the lot before starting.
+    """
+    async def emit_countdown(countdown: int):
+        await sio.emit("next_team_countdown", {
+            "seconds": countdown,
+            "message": f"Next team in {countdown}..." if countdown else "Starting..."
+        }, room=f"auction:{auction_id}")
+    
+    async def start():
+        await emit_countdown(0)  # Clear countdown overlay
+        await start_next_lot(auction_id, next_club_id, expected_lot=completed_lot)
+    
+    key = f"{auction_id}:after-lot-{completed_lot}"
+    for offset in range(NEXT_LOT_COUNTDOWN_SECONDS):
+        countdown = NEXT_LOT_COUNTDOWN_SECONDS - offset
+        lot_timers.defer(f"{key}:countdown-{countdown}", offset, lambda c=countdown: emit_countdown(c))
+    lot_timers.defer(f"{key}:start", NEXT_LOT_COUNTDOWN_SECONDS, start)
+
+
+async def get_next_club_to_auction(auction_id: str, auction: dict = None, league: dict = None,
+                                   counters: dict = None) -> Optional[str]:
+    """
+    Get the next club to auction, considering queue and unsold clubs.
+    complete_lot passes the documents it already holds to avoid re-reading them;
+    the queue/currentLot are unchanged by settlement so its auction copy is current.
+    """
+    if auction is None:
+        auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
     if not auction:
         return None
     
-    club_queue = auction.get("clubQueue", [])
-    unsold_clubs = auction.get("unsoldClubs", [])
+    club_queue_length = queue_length(auction)
     current_lot = auction.get("currentLot", 0)
     
-    logger.info(f"🔍 get_next_club_to_auction: currentLot={current_lot}, queueLen={len(club_queue)}, check={current_lot < len(club_queue)}")
+    logger.info(f"🔍 get_next_club_to_auction: currentLot={current_lot}, queueLen={club_queue_length}, check={current_lot < club_queue_length}")
     
     # Check if we're still in the initial round
-    if current_lot < len(club_queue):
+    if current_lot < club_queue_length:
         # Return next club in initial queue
-        next_id = club_queue[current_lot]
+        next_id = (await auction_queue_page(auction, current_lot, 1) or [None])[0]
         logger.info(f"🔍 Returning next club from queue: {next_id}")
         return next_id
     
-    # Initial round complete - check for unsold clubs
-    if unsold_clubs:
-        # Check if any participants can still bid (budget + roster slots) - Prompt C
-        participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(100)
-        league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
-        minimum_budget = auction.get("minimumBudget", 1000000.0)
-        max_slots = league.get("clubSlots", 3) if league else 3
-        
-        # Check for eligible bidders (has budget AND roster space)
-        eligible_bidders = []
-        for p in participants:
-            has_budget = p.get("budgetRemaining", 0) >= minimum_budget
-            has_slots = len(p.get("clubsWon", [])) < max_slots
-            if has_budget and has_slots:
-                eligible_bidders.append(p)
-        
-        if eligible_bidders:
-            # Return first unsold club and remove it from unsold list
-            next_unsold = unsold_clubs[0]
-            remaining_unsold = unsold_clubs[1:]
-            
-            await db.auctions.update_one(
-                {"id": auction_id},
-                {"$set": {"unsoldClubs": remaining_unsold}}
-            )
-            
-            logger.info(f"Re-offering unsold club: {next_unsold}")
-            return next_unsold
+    # Initial round complete - check if any participants can still bid (budget + roster slots) - Prompt C
+    if counters is None:
+        if league is None:
+            league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0}) or {}
+        counters = await load_completion_counters(auction, league)
+    if counters["eligibleBidders"] <= 0:
+        return None
     
-    # No more clubs to offer
-    return None
+    # Take the first unsold club off the queue atomically (None when the queue is empty)
+    next_unsold = await pop_unsold_club(db, auction_id)
+    if next_unsold:
+        logger.info(f"Re-offering unsold club: {next_unsold}")
+    return next_unsold
 
 
-async def start_next_lot(auction_id: str, next_club_id: str):
-    """Start the next lot with the given club"""
+async def start_next_lot(auction_id: str, next_club_id: str, expected_lot: Optional[int] = None):
+    """
+    Start the next lot with the given club. With expected_lot set, does nothing unless
+    the auction is still on that lot (guards deferred starts against double triggers).
+    """
     auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
     if not auction:
         return
+    if expected_lot is not None and (auction.get("status") == "completed" or auction.get("currentLot", 0) != expected_lot):
+        logger.info(f"Skipping next lot start for auction {auction_id}: lot {expected_lot} already moved on")
+        return
     
     # Get league to determine sport
-    league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
+    league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0, "sportKey": 1})
     if not league:
         logger.error(f"League not found for auction {auction_id}")
         return
     
     sport_key = league.get("sportKey", "football")
     
-    # Get club/asset details based on sport
-    if sport_key == "football":
-        next_club = await db.assets.find_one({"id": next_club_id}, {"_id": 0})
-    else:
-        next_club = await db.assets.find_one({"id": next_club_id, "sportKey": sport_key}, {"_id": 0})
+    # Lot event payload from the catalog (lots past the initial queue are unsold re-offers)
+    next_lot_number = auction["currentLot"] + 1
+    next_lot_id = f"{auction_id}-lot-{next_lot_number}"
+    lot_frame = await lot_catalogs.lot_started(
+        auction_id, next_lot_id, next_lot_number, next_club_id, sport_key,
+        is_unsold_retry=next_lot_number > queue_length(auction)
+    )
     
-    if not next_club:
+    if not lot_frame:
         logger.error(f"Club/Asset not found: {next_club_id} (sport: {sport_key})")
         return
     
-    next_lot_number = auction["currentLot"] + 1
-    next_lot_id = f"{auction_id}-lot-{next_lot_number}"
     timer_end = datetime.now(timezone.utc) + timedelta(seconds=auction["bidTimer"])
     
-    await db.auctions.update_one(
-        {"id": auction_id},
+    lot_filter = {"id": auction_id}
+    if expected_lot is not None:
+        lot_filter["currentLot"] = expected_lot
+    result = await db.auctions.update_one(
+        lot_filter,
         {"$set": {
             "currentClubId": next_club_id,
             "currentLot": next_lot_number,
@@ -5580,41 +6197,396 @@ async def start_next_lot(auction_id: str, next_club_id: str):
             "timerEndsAt": timer_end,
             "currentBid": None,
             "currentBidder": None
-        }}
+        },
+        "$unset": {"nextClubId": ""}}
     )
-    
-    # Remove _id for serialization
-    next_club.pop('_id', None)
+    if result.matched_count == 0:
+        logger.info(f"Next lot for auction {auction_id} already started by another trigger")
+        return
     
     # Create timer data
     if timer_end.tzinfo is None:
         timer_end = timer_end.replace(tzinfo=timezone.utc)
     ends_at_ms = int(timer_end.timestamp() * 1000)
-    timer_data = create_timer_event(next_lot_id, ends_at_ms)
+    timer_data = await create_timer_event(next_lot_id, ends_at_ms)
     
-    # Emit lot start - send appropriate data based on sport
-    lot_data = {
-        'lotNumber': next_lot_number,
-        'timer': timer_data,
-        'isUnsoldRetry': next_club_id and next_club_id in (auction.get("unsoldClubs", []))
-    }
+    await emit_auction_event(auction_id, 'lot_started', {**lot_frame, 'timer': timer_data})
     
-    if sport_key == "football":
-        lot_data['club'] = Club(**next_club).model_dump()
+    logger.info(f"Started lot {next_lot_number}: {lot_frame['club'].get('name')}")
+    
+    # Start timer countdown
+    await refresh_auction_state(auction_id)
+    await schedule_lot_timer(auction_id, next_lot_id, timer_end)
+
+
+# ===== SEALED ROUNDS =====
+async def schedule_sealed_round_close(auction_id: str, round_number: int, ends_at: datetime):
+    """
+    Close a sealed round at its deadline. The deadline is the auction's lot timer under the
+    round's lot id, so it is leased, kept in the shared deadline hash and taken over like a
+    live lot's when its replica dies; on_lot_timer_expired routes it to close_sealed_round,
+    and emit_lot_tick sends no ticks for it.
+    """
+    await schedule_lot_timer(auction_id, round_lot_id(auction_id, round_number), ends_at)
+
+
+async def open_sealed_round(auction_id: str, expected_round: int) -> bool:
+    """
+    Open the round after expected_round (0 = first round). Guarded on the round number,
+    so a repeated trigger opens nothing. Returns False when there is nothing left to offer.
+    """
+    auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
+    if not auction or auction.get("status") != "active":
+        return True
+    current_round = auction.get("sealedRound") or {}
+    if current_round.get("number", 0) != expected_round:
+        logger.info(f"Sealed round {expected_round + 1} for auction {auction_id} already opened")
+        return True
+    
+    current_lot = auction.get("currentLot", 0)
+    round_size = auction.get("sealedRoundSize", 10)
+    upcoming = await auction_queue_page(auction, current_lot, round_size)
+    club_ids = next_round_clubs(upcoming, auction.get("unsoldClubs", []), round_size)
+    reoffer = not upcoming
+    if not club_ids:
+        return False
+    if reoffer:
+        league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0}) or {}
+        counters = await load_completion_counters(auction, league)
+        if counters["eligibleBidders"] <= 0:
+            return False
+    
+    round_number = expected_round + 1
+    lot_id = round_lot_id(auction_id, round_number)
+    ends_at = datetime.now(timezone.utc) + timedelta(seconds=auction.get("sealedRoundSeconds", 60))
+    update = {"$set": {
+        "sealedRound": {"number": round_number, "clubIds": club_ids, "endsAt": ends_at, "reoffer": reoffer},
+        "currentLot": current_lot if reoffer else current_lot + len(club_ids),
+        "currentLotId": lot_id,
+        "currentClubId": None,
+        "timerEndsAt": ends_at,
+        "currentBid": None,
+        "currentBidder": None
+    }}
+    if reoffer:
+        update["$pull"] = {"unsoldClubs": {"$in": club_ids}}
+    result = await db.auctions.update_one(
+        {"id": auction_id, "status": "active", "sealedRound.number": current_round.get("number")},
+        update
+    )
+    if result.matched_count == 0:
+        logger.info(f"Sealed round {round_number} for auction {auction_id} already opened by another trigger")
+        return True
+    
+    league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0, "sportKey": 1}) or {}
+    sport_key = league.get("sportKey", "football")
+    lots = [await lot_catalogs.asset(auction_id, club_id, sport_key) for club_id in club_ids]
+    
+    await emit_auction_event(auction_id, 'sealed_round_started', {
+        'round': round_number,
+        'lotId': lot_id,
+        'lots': [lot for lot in lots if lot],
+        'reoffer': reoffer,
+        'pricing': auction.get("sealedPricing", "second"),
+        'endsAt': ends_at.isoformat(),
+        'timer': await create_timer_event(lot_id, to_epoch_ms(ends_at))
+    })
+    await schedule_sealed_round_close(auction_id, round_number, ends_at)
+    
+    logger.info(f"Opened sealed round {round_number} for auction {auction_id}: {len(club_ids)} lots (reoffer={reoffer})")
+    return True
+
+
+SEALED_CLAIM_SECONDS = 60  # A settlement claim this old (its replica died mid-settlement) can be taken over
+SEALED_CLOSE_RETRY_SECONDS = 5
+SEALED_INFLIGHT_WAIT_SECONDS = 5
+
+
+async def close_sealed_round(auction_id: str, round_number: int):
+    """
+    Settle every lot of a sealed round in one pass, emit one sealed_round_results event,
+    then open the next round or complete the auction.
+    
+    The round is claimed with sealedRound.settling and marked settled once its lots are; a
+    failed settlement releases the claim and retries, and a close after pause/resume of a
+    settled round only moves the auction on.
+    """
+    auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
+    sealed_round = (auction or {}).get("sealedRound") or {}
+    if not auction or auction.get("status") != "active" or sealed_round.get("number") != round_number:
+        # Paused (resume reschedules the close), completed, deleted or already moved on
+        return
+    league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
+    
+    if sealed_round.get("settled"):
+        sold_count, participant_updates, counters = sealed_round.get("soldCount", 0), [], None
+    else:
+        ends_at = sealed_round.get("endsAt")
+        if ends_at and to_epoch_ms(ends_at) > int(time.time() * 1000):
+            await schedule_sealed_round_close(auction_id, round_number, ends_at)
+            return
+        
+        # Claim the round - a repeated close matches nothing, a stale claim is taken over
+        now = datetime.now(timezone.utc)
+        claimed = await db.auctions.update_one(
+            {"id": auction_id, "status": "active", "sealedRound.number": round_number,
+             "sealedRound.settled": {"$ne": True},
+             "$or": [{"sealedRound.settling": {"$ne": True}},
+                     {"sealedRound.settlingAt": {"$lt": now - timedelta(seconds=SEALED_CLAIM_SECONDS)}}]},
+            {"$set": {"sealedRound.settling": True, "sealedRound.settlingAt": now}}
+        )
+        if claimed.modified_count == 0:
+            settling_at = sealed_round.get("settlingAt")
+            if sealed_round.get("settling") and settling_at:
+                # Held by another close - look again once its claim would be stale, in case its
+                # process died. In-process only: the round's deadline stays in the lease hash, so
+                # if this process dies too the takeover fires the close again.
+                delay = max(0.0, (to_epoch_ms(settling_at) - time.time() * 1000) / 1000) + SEALED_CLAIM_SECONDS
+                lot_timers.defer(f"{auction_id}:sealed-round-{round_number}:claim-{to_epoch_ms(settling_at)}", delay,
+                                 lambda: close_sealed_round(auction_id, round_number))
+            return
+        
+        try:
+            sold_count, participant_updates, counters = await settle_sealed_round(auction, league, sealed_round)
+        except Exception as e:
+            logger.error(f"❌ Sealed round {round_number} settlement failed for auction {auction_id}, retrying: {e}")
+            await db.auctions.update_one(
+                {"id": auction_id, "sealedRound.number": round_number},
+                {"$unset": {"sealedRound.settling": "", "sealedRound.settlingAt": ""}}
+            )
+            await schedule_sealed_round_close(auction_id, round_number, now + timedelta(seconds=SEALED_CLOSE_RETRY_SECONDS))
+            raise
+    
+    if counters is None:
+        counters = await load_completion_counters(auction, league)
+    reoffer_unsold = bool(sealed_round.get("reoffer") and not sold_count)
+    if counters["remainingDemand"] == 0 or reoffer_unsold or not await open_sealed_round(auction_id, round_number):
+        # Rosters full, a round of re-offers drew no sale, or nothing left to offer
+        await check_auction_completion(auction_id, participant_updates=participant_updates, exhausted=reoffer_unsold)
+
+
+async def wait_for_sealed_bids(auction_id: str, round_number: int):
+    """Let bids that took their ticket before the claim finish writing (bounded, in case a bidder died)"""
+    deadline = time.monotonic() + SEALED_INFLIGHT_WAIT_SECONDS
+    while True:
+        auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0, "sealedRound": 1}) or {}
+        sealed_round = auction.get("sealedRound") or {}
+        if sealed_round.get("number") != round_number or sealed_round.get("inflight", 0) <= 0:
+            return
+        if time.monotonic() > deadline:
+            logger.warning(f"⚠️ Sealed round {round_number} of auction {auction_id} closing with "
+                           f"{sealed_round['inflight']} bid writes unconfirmed")
+            return
+        await asyncio.sleep(0.05)
+
+
+async def resolve_sealed_awards(auction: dict, league: dict, sealed_round: dict, participants: list) -> List[SealedAward]:
+    """
+    The round's awards: resolved from its bids once and recorded on sealedRound.awards before
+    anything is settled. A retry or takeover replays the recorded awards - resolving again would
+    see the budgets the first attempt already charged and could award a club twice.
+    """
+    auction_id, round_number = auction["id"], sealed_round["number"]
+    if sealed_round.get("awards") is not None:
+        return [award_from_record(record) for record in sealed_round["awards"]]
+    
+    await wait_for_sealed_bids(auction_id, round_number)
+    bids = await db.sealed_bids.find({"auctionId": auction_id, "round": round_number}, {"_id": 0}).to_list(None)
+    awards = resolve_sealed_round(
+        sealed_round.get("clubIds", []), bids, participants,
+        club_slots=league.get("clubSlots", 3),
+        minimum_budget=auction.get("minimumBudget", 1000000.0),
+        pricing=auction.get("sealedPricing", "second")
+    )
+    recorded = await db.auctions.find_one_and_update(
+        {"id": auction_id, "sealedRound.number": round_number, "sealedRound.awards": {"$exists": False}},
+        {"$set": {"sealedRound.awards": [award_record(award) for award in awards]}},
+        projection={"_id": 0}
+    )
+    if recorded:
+        return awards
+    # Recorded by an earlier claim in the meantime - settle what it recorded
+    current = await db.auctions.find_one({"id": auction_id}, {"_id": 0, "sealedRound": 1}) or {}
+    stored = (current.get("sealedRound") or {}).get("awards")
+    if (current.get("sealedRound") or {}).get("number") != round_number or stored is None:
+        raise RuntimeError(f"Sealed round {round_number} of auction {auction_id} moved on while settling")
+    return [award_from_record(record) for record in stored]
+
+
+async def settle_sealed_round(auction: dict, league: dict, sealed_round: dict):
+    """Award a claimed round's lots and emit its results. Returns (lots sold, participant deltas, counters)."""
+    auction_id, round_number = auction["id"], sealed_round["number"]
+    lot_id = round_lot_id(auction_id, round_number)
+    participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(None)
+    names = {p["userId"]: p.get("userName") for p in participants}
+    awards = await resolve_sealed_awards(auction, league, sealed_round, participants)
+    
+    async def settle_round(session=None):
+        outcomes = []
+        for award in awards:
+            winning_bid = {"userId": award.user_id, "amount": award.amount} if award.user_id else None
+            outcomes.append(await settle_lot(db, auction, league, award.club_id, winning_bid, lot_id, session=session))
+        return outcomes
+    
+    if FEATURE_SETTLEMENT_TRANSACTIONS:
+        async with await client.start_session() as session:
+            async with session.start_transaction():
+                settlements = await settle_round(session)
     else:
-        # For cricket and other sports, send raw asset data
-        lot_data['club'] = next_club
+        settlements = await settle_round()
+    
+    # A replayed award the first attempt already applied comes back ALREADY_SETTLED - still a sale
+    sold = [
+        settlement.outcome == SOLD or (award.user_id is not None and settlement.outcome == ALREADY_SETTLED)
+        for award, settlement in zip(awards, settlements)
+    ]
+    
+    # Sales are recorded as bids at the price paid, as live lots record their winning bid
+    # (one row per club - upserted, so a replay doesn't write a second one)
+    sold_bids = [
+        Bid(auctionId=auction_id, userId=award.user_id, clubId=award.club_id, amount=award.amount,
+            userName=names.get(award.user_id))
+        for award, is_sold in zip(awards, sold) if is_sold
+    ]
+    for bid in sold_bids:
+        await db.bids.update_one(
+            {"auctionId": auction_id, "clubId": bid.clubId},
+            {"$setOnInsert": bid.model_dump()},
+            upsert=True
+        )
+    await db.auctions.update_one(
+        {"id": auction_id, "sealedRound.number": round_number},
+        {"$set": {"sealedRound.settled": True, "sealedRound.soldCount": len(sold_bids)},
+         "$unset": {"sealedRound.settling": "", "sealedRound.settlingAt": ""}}
+    )
+    
+    # One delta per winner - their last award carries their final record
+    participant_updates = {}
+    counters, participants_version = None, auction.get("participantsVersion", 0)
+    for settlement in settlements:
+        if settlement.participant:
+            participant_updates[settlement.participant["userId"]] = settlement.participant
+        counters = settlement.counters or counters
+        participants_version = settlement.participants_version or participants_version
+    replayed = {
+        award.user_id for award, settlement, is_sold in zip(awards, settlements, sold)
+        if is_sold and settlement.outcome == ALREADY_SETTLED and award.user_id not in participant_updates
+    }
+    if replayed:
+        # Winners settled by the earlier attempt - send their current records
+        winners, current = await asyncio.gather(
+            db.league_participants.find(
+                {"leagueId": auction["leagueId"], "userId": {"$in": list(replayed)}}, PUBLIC_PARTICIPANT_FIELDS
+            ).to_list(None),
+            db.auctions.find_one({"id": auction_id}, {"_id": 0, "participantsVersion": 1})
+        )
+        for winner in winners:
+            participant_updates[winner["userId"]] = winner
+        participants_version = max(participants_version, (current or {}).get("participantsVersion", 0))
     
-    await sio.emit('lot_started', lot_data, room=f"auction:{auction_id}")
+    sport_key = league.get("sportKey", "football")
+    results = []
+    for award, is_sold in zip(awards, sold):
+        asset = await lot_catalogs.asset(auction_id, award.club_id, sport_key)
+        results.append({
+            'clubId': award.club_id,
+            'clubName': asset.get("name") if asset else "Unknown",
+            'unsold': not is_sold,
+            'winnerId': award.user_id if is_sold else None,
+            'winnerName': names.get(award.user_id) if is_sold else None,
+            'amount': award.amount if is_sold else None,
+            'bidCount': award.bid_count
+        })
     
-    logger.info(f"Started lot {next_lot_number}: {next_club['name']}")
+    await emit_auction_event(auction_id, 'sealed_round_results', {
+        'round': round_number,
+        'results': results,
+        'participantUpdates': list(participant_updates.values()),
+        'participantsVersion': participants_version
+    })
+    logger.info(f"Sealed round {round_number} settled for auction {auction_id}: "
+                f"{len(sold_bids)}/{len(awards)} sold from {sum(award.bid_count for award in awards)} bids")
+    return len(sold_bids), list(participant_updates.values()), counters
+
+
+@api_router.post("/auction/{auction_id}/sealed-bid")
+async def place_sealed_bid(auction_id: str, bid_input: SealedBidCreate):
+    """
+    Submit (or replace) a private bid on one lot of the open sealed round. Each bid is
+    checked against the bid rules on its own; the round settlement re-checks budget and
+    roster across every lot the user wins. Nothing is broadcast until the round results.
+    """
+    user_id = bid_input.userId
+    await _check_bid_rate(auction_id, user_id)
+    auction = await db.auctions.find_one(
+        {"id": auction_id},
+        {"_id": 0, "leagueId": 1, "status": 1, "lotMode": 1, "sealedRound": 1, "minimumBudget": 1}
+    )
+    if not auction:
+        raise HTTPException(status_code=404, detail="Auction not found")
+    if auction.get("lotMode") != SEALED:
+        raise HTTPException(status_code=400, detail="Auction does not use sealed rounds")
+    if auction.get("status") != "active":
+        raise HTTPException(status_code=400, detail=f"Auction is not active (status: {auction.get('status')})")
+    
+    sealed_round = auction.get("sealedRound") or {}
+    if bid_input.clubId not in sealed_round.get("clubIds", []):
+        raise HTTPException(status_code=400, detail="This lot is not in the open round")
+    ends_at = sealed_round.get("endsAt")
+    if sealed_round.get("settling") or sealed_round.get("settled") or (ends_at and to_epoch_ms(ends_at) <= int(time.time() * 1000)):
+        raise HTTPException(status_code=400, detail="The round has closed")
+    
+    league, participant = await asyncio.gather(
+        db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0, "clubSlots": 1}),
+        db.league_participants.find_one({"leagueId": auction["leagueId"], "userId": user_id}, {"_id": 0})
+    )
+    if not participant:
+        raise HTTPException(status_code=403, detail="User is not a participant in this league")
     
-    # Start timer countdown
-    asyncio.create_task(countdown_timer(auction_id, timer_end, next_lot_id))
+    try:
+        validate_bid(
+            user_id=user_id,
+            amount=bid_input.amount,
+            minimum_budget=auction.get("minimumBudget", 1000000.0),
+            budget_remaining=participant["budgetRemaining"],
+            clubs_won_count=len(participant.get("clubsWon", [])),
+            club_slots=(league or {}).get("clubSlots", 3),
+            current_club_id=bid_input.clubId,
+            current_bid=None,
+            current_bidder_id=None
+        )
+    except BidRejected as e:
+        raise _reject_bid(e, user_id)
+    
+    # Ticket on the still-open round: close claims the round first, then waits for open tickets
+    # before reading sealed_bids, so a bid is either counted or rejected here - never silently dropped
+    round_filter = {"id": auction_id, "sealedRound.number": sealed_round["number"]}
+    ticket = await db.auctions.update_one(
+        {**round_filter, "status": "active", "sealedRound.settling": {"$ne": True},
+         "sealedRound.settled": {"$ne": True}, "sealedRound.endsAt": {"$gt": datetime.now(timezone.utc)}},
+        {"$inc": {"sealedRound.inflight": 1}}
+    )
+    if ticket.modified_count == 0:
+        raise HTTPException(status_code=400, detail="The round has closed")
+    try:
+        await db.sealed_bids.update_one(
+            {"auctionId": auction_id, "round": sealed_round["number"], "clubId": bid_input.clubId, "userId": user_id},
+            {"$set": {"amount": bid_input.amount, "at": time.time()}},
+            upsert=True
+        )
+    finally:
+        await db.auctions.update_one(round_filter, {"$inc": {"sealedRound.inflight": -1}})
+    return {"message": "Sealed bid received", "round": sealed_round["number"],
+            "clubId": bid_input.clubId, "amount": bid_input.amount}
 
 
-async def check_auction_completion(auction_id: str, final_club_id: str = None, final_winning_bid: dict = None):
-    """Check if auction is complete and handle completion (idempotent)"""
+async def check_auction_completion(auction_id: str, final_club_id: str = None, final_winning_bid: dict = None,
+                                   participant_updates: Optional[List[dict]] = None, exhausted: bool = False):
+    """
+    Check if auction is complete and handle completion (idempotent).
+    participant_updates are the records changed by the final lot, sent as a delta with auction_complete.
+    exhausted: the caller has nothing left it will offer (a sealed re-offer round sold nothing).
+    """
     logger.info(f"🔍 check_auction_completion CALLED for {auction_id}")
     
     auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
@@ -5634,43 +6606,34 @@ async def check_auction_completion(auction_id: str, final_club_id: str = None, f
         return
     
     unsold_clubs = auction.get("unsoldClubs", [])
-    club_queue = auction.get("clubQueue", [])
+    club_queue_length = queue_length(auction)
     current_lot = auction.get("currentLot", 0)
-    participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(100)
-    minimum_budget = auction.get("minimumBudget", 1000000.0)
-    max_slots = league.get("clubSlots", 3)
     
-    # Calculate remaining demand (sum of max(0, slots - clubsWon) per manager)
-    remaining_demand = 0
-    all_managers_full = True
-    eligible_bidders = []
+    # Remaining demand / eligible bidders come from counters maintained at settlement - no scan
+    counters = await load_completion_counters(auction, league)
+    remaining_demand = counters["remainingDemand"]
+    eligible_bidders = counters["eligibleBidders"]
+    all_managers_full = eligible_bidders == 0
     
-    for participant in participants:
-        clubs_won = len(participant.get("clubsWon", []))
-        has_budget = participant.get("budgetRemaining", 0) >= minimum_budget
-        has_slots = clubs_won < max_slots
-        
-        # Calculate demand for this manager
-        demand = max(0, max_slots - clubs_won)
-        remaining_demand += demand
-        
-        if has_slots and has_budget:
-            eligible_bidders.append(participant)
-            all_managers_full = False
+    if AUCTION_COMPLETION_VERIFY:
+        scanned_participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(None)
+        mismatches = verify_counters(league, scanned_participants, counters, auction.get("minimumBudget", 1000000.0))
+        if mismatches:
+            logger.warning(f"⚠️ Completion counters drifted for auction {auction_id}: {mismatches}")
     
     # Check if there are more clubs to auction (either in queue or unsold to retry)
     # NOTE: currentLot is 1-based. Use < to check if more lots exist AFTER current one
-    clubs_remaining = (current_lot < len(club_queue)) or len(unsold_clubs) > 0
+    clubs_remaining = (current_lot < club_queue_length) or len(unsold_clubs) > 0
     
     # Auction should end if: no clubs remaining, no eligible bidders, or all managers are full
-    should_complete = not clubs_remaining or not eligible_bidders or all_managers_full
+    should_complete = exhausted or not clubs_remaining or not eligible_bidders or all_managers_full
     
     # DEFENSIVE LOGGING: Track exact values for debugging
     logger.info(f"🔍 COMPLETION_CHECK [Auction: {auction_id}]:")
-    logger.info(f"   currentLot={current_lot}, clubQueue_length={len(club_queue)}, unsold={len(unsold_clubs)}")
-    logger.info(f"   Logic: ({current_lot} <= {len(club_queue)}) = {current_lot <= len(club_queue)}")
+    logger.info(f"   currentLot={current_lot}, clubQueue_length={club_queue_length}, unsold={len(unsold_clubs)}")
+    logger.info(f"   Logic: ({current_lot} <= {club_queue_length}) = {current_lot <= club_queue_length}")
     logger.info(f"   clubs_remaining={clubs_remaining}, should_complete={should_complete}")
-    logger.info(f"   eligible_bidders={len(eligible_bidders)}, all_managers_full={all_managers_full}")
+    logger.info(f"   eligible_bidders={eligible_bidders}, all_managers_full={all_managers_full}")
     
     # Structured logging
     logger.info("auction.completion_check", extra={
@@ -5678,11 +6641,11 @@ async def check_auction_completion(auction_id: str, final_club_id: str = None, f
         "remaining_demand": remaining_demand,
         "status": auction.get("status"),
         "all_managers_full": all_managers_full,
-        "eligible_bidders": len(eligible_bidders),
+        "eligible_bidders": eligible_bidders,
         "clubs_remaining": clubs_remaining,
         "should_complete": should_complete,
         "current_lot": current_lot,
-        "club_queue_length": len(club_queue)
+        "club_queue_length": club_queue_length
     })
     
     if should_complete:
@@ -5700,6 +6663,12 @@ async def check_auction_completion(auction_id: str, final_club_id: str = None, f
             logger.info(f"⚠️ Auction {auction_id} was not updated (already completed or not active)")
             return
         
+        await active_auctions.deactivate(auction["leagueId"], auction_id)
+        await release_auction_state(auction_id, final=True)
+        await cancel_lot_timer(auction_id)
+        lot_catalogs.drop(auction_id)
+        auction_events.drop(auction_id)
+        
         # Update league status
         await db.leagues.update_one(
             {"id": auction["leagueId"]},
@@ -5707,12 +6676,9 @@ async def check_auction_completion(auction_id: str, final_club_id: str = None, f
         )
         
         # Calculate final statistics
-        total_clubs_sold = 0
+        total_clubs_sold = counters["lotsSold"]
         total_unsold = len(unsold_clubs)
         
-        for p in participants:
-            total_clubs_sold += len(p.get("clubsWon", []))
-        
         # Determine completion reason for better user feedback
         completion_reason = "completed"
         if all_managers_full:
@@ -5721,23 +6687,24 @@ async def check_auction_completion(auction_id: str, final_club_id: str = None, f
             completion_reason = "No managers can afford minimum bid"
         elif not clubs_remaining:
             completion_reason = "All available teams have been sold"
+        elif exhausted:
+            completion_reason = "No bids on the remaining teams"
         
-        await sio.emit('auction_complete', {
+        await emit_auction_event(auction_id, 'auction_complete', {
             'message': f'Auction completed! {total_clubs_sold} teams sold, {total_unsold} unsold.',
             'reason': completion_reason,
             'clubsSold': total_clubs_sold,
             'clubsUnsold': total_unsold,
             'finalClubId': final_club_id,  # Include final club sold
             'finalWinningBid': Bid(**final_winning_bid).model_dump(mode='json') if final_winning_bid else None,
-            'participants': [LeagueParticipant(**p).model_dump(mode='json') for p in participants]
-        }, room=f"auction:{auction_id}")
+            'participantUpdates': participant_updates or [],
+            'participantsVersion': auction.get("participantsVersion", 0)
+        })
         
         # Emit league status changed event
         league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
         if league:
-            # Get room size for debugging
-            room_sockets = {} if not hasattr(sio.manager, "rooms") else sio.manager.rooms.get(f"league:{auction['leagueId']}", {}).get("/", set())
-            room_size = len(room_sockets)
+            room_size = await get_room_size(f"league:{auction['leagueId']}")
             
             # JSON log for debugging
             logger.info(json.dumps({
@@ -5757,6 +6724,9 @@ async def check_auction_completion(auction_id: str, final_club_id: str = None, f
             # Create initial standings if not exists
             existing_standing = await db.standings.find_one({"leagueId": auction["leagueId"]}, {"_id": 0})
             if not existing_standing:
+                participants = await db.league_participants.find(
+                    {"leagueId": auction["leagueId"]}, PUBLIC_PARTICIPANT_FIELDS
+                ).to_list(None)
                 table = []
                 for participant in participants:
                     table.append({
@@ -5798,30 +6768,40 @@ async def generate_auction_report(auction_id: str):
             logger.error(f"Cannot generate report: League not found for auction {auction_id}")
             return
         
-        # Get all bids for this auction
-        all_bids = await db.bids.find({"auctionId": auction_id}, {"_id": 0}).to_list(10000)
+        # Stream the auction's bids once into per-lot and per-user aggregates
+        club_bid_counts, winning_bids, user_bid_counts, user_club_max = {}, {}, {}, {}
+        total_bids, highest_bid = 0, 0
+        async for bid in db.bids.find({"auctionId": auction_id}, {"_id": 0, "clubId": 1, "userId": 1, "amount": 1}):
+            club_id, user_id, amount = bid.get("clubId"), bid.get("userId"), bid.get("amount", 0)
+            total_bids += 1
+            highest_bid = max(highest_bid, amount)
+            club_bid_counts[club_id] = club_bid_counts.get(club_id, 0) + 1
+            user_bid_counts[user_id] = user_bid_counts.get(user_id, 0) + 1
+            if club_id not in winning_bids or amount > winning_bids[club_id].get("amount", 0):
+                winning_bids[club_id] = bid
+            user_club_max[(club_id, user_id)] = max(user_club_max.get((club_id, user_id), 0), amount)
         
         # Get participants
-        participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(100)
+        participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(None)
         
         # Get clubs/assets
-        club_ids = auction.get("clubQueue", [])
-        clubs = await db.assets.find({"id": {"$in": club_ids}}, {"_id": 0}).to_list(100)
-        clubs_map = {c["id"]: c for c in clubs}
+        club_ids = await auction_club_queue(auction)
+        clubs_map = {}
+        async for club in db.assets.find({"id": {"$in": club_ids}}, {"_id": 0, "id": 1, "name": 1}):
+            clubs_map[club["id"]] = club
         
         # Get users for display names
         user_ids = [p["userId"] for p in participants]
-        users = await db.users.find({"id": {"$in": user_ids}}, {"_id": 0}).to_list(100)
+        users = await db.users.find({"id": {"$in": user_ids}}, {"_id": 0}).to_list(None)
         users_map = {u["id"]: u for u in users}
         
         # Build per-lot breakdown
         lots_breakdown = []
         for idx, club_id in enumerate(club_ids):
             club = clubs_map.get(club_id, {})
-            club_bids = [b for b in all_bids if b.get("clubId") == club_id]
             
-            # Find winning bid (highest amount for this club)
-            winning_bid = max(club_bids, key=lambda x: x.get("amount", 0)) if club_bids else None
+            # Winning bid = highest amount for this club
+            winning_bid = winning_bids.get(club_id)
             
             # Get winner name with fallbacks: displayName → userName → email prefix → Unknown
             winner_name = None
@@ -5838,7 +6818,7 @@ async def generate_auction_report(auction_id: str):
                 "queuePosition": idx + 1,
                 "clubId": club_id,
                 "clubName": club.get("name", "Unknown"),
-                "totalBids": len(club_bids),
+                "totalBids": club_bid_counts.get(club_id, 0),
                 "winningBid": winning_bid.get("amount", 0) if winning_bid else 0,
                 "winnerId": winning_bid.get("userId") if winning_bid else None,
                 "winnerName": winner_name,
@@ -5851,16 +6831,11 @@ async def generate_auction_report(auction_id: str):
         for participant in participants:
             user_id = participant["userId"]
             user = users_map.get(user_id, {})
-            user_bids = [b for b in all_bids if b.get("userId") == user_id]
+            user_bid_count = user_bid_counts.get(user_id, 0)
             clubs_won = participant.get("clubsWon", [])
             
             # Calculate total spent (sum of winning bids)
-            total_spent = 0
-            for club_id in clubs_won:
-                club_bids = [b for b in all_bids if b.get("clubId") == club_id and b.get("userId") == user_id]
-                if club_bids:
-                    max_bid = max(b.get("amount", 0) for b in club_bids)
-                    total_spent += max_bid
+            total_spent = sum(user_club_max.get((club_id, user_id), 0) for club_id in clubs_won)
             
             # Get user name with fallbacks: displayName → userName → email prefix → Unknown
             user_display_name = (
@@ -5876,10 +6851,10 @@ async def generate_auction_report(auction_id: str):
                 "userName": user_display_name,
                 "teamsWon": len(clubs_won),
                 "teamsWonNames": [clubs_map.get(cid, {}).get("name", "Unknown") for cid in clubs_won],
-                "totalBidsPlaced": len(user_bids),
+                "totalBidsPlaced": user_bid_count,
                 "totalSpent": total_spent,
                 "budgetRemaining": participant.get("budgetRemaining", 0),
-                "winRate": round(len(clubs_won) / len(user_bids) * 100, 1) if user_bids else 0
+                "winRate": round(len(clubs_won) / user_bid_count * 100, 1) if user_bid_count else 0
             }
             user_summaries.append(user_summary)
         
@@ -5925,11 +6900,11 @@ async def generate_auction_report(auction_id: str):
                 "totalLots": len(club_ids),
                 "totalClubsSold": total_clubs_sold,
                 "totalUnsold": len(club_ids) - total_clubs_sold,
-                "totalBids": len(all_bids),
+                "totalBids": total_bids,
                 "totalRevenue": total_revenue,
-                "avgBidsPerLot": round(len(all_bids) / len(club_ids), 1) if club_ids else 0,
+                "avgBidsPerLot": round(total_bids / len(club_ids), 1) if club_ids else 0,
                 "avgPricePerClub": round(total_revenue / total_clubs_sold, 0) if total_clubs_sold else 0,
-                "highestBid": max((b.get("amount", 0) for b in all_bids), default=0)
+                "highestBid": highest_bid
             },
             "lotsBreakdown": lots_breakdown,
             "userSummaries": user_summaries
@@ -6058,9 +7033,11 @@ async def pause_auction(auction_id: str, commissioner_id: str = None):
         raise HTTPException(status_code=400, detail="Can only pause active auctions")
     
     # Cancel active timer
-    if auction_id in active_timers:
-        active_timers[auction_id].cancel()
-        del active_timers[auction_id]
+    await cancel_lot_timer(auction_id)
+    
+    # Flush queued bids so timerEndsAt below reflects any anti-snipe extension
+    await release_auction_state(auction_id)
+    auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0}) or auction
     
     # Store remaining time when paused
     remaining_time = 0
@@ -6079,12 +7056,15 @@ async def pause_auction(auction_id: str, commissioner_id: str = None):
             "pausedAt": datetime.now(timezone.utc)
         }}
     )
+    await active_auctions.deactivate(auction["leagueId"], auction_id)
     
     # Notify all participants
-    await sio.emit('auction_paused', {
+    await emit_auction_event(auction_id, 'auction_paused', {
         'message': 'Auction has been paused by the commissioner',
         'remainingTime': remaining_time
-    }, room=f"auction:{auction_id}")
+    })
+    
+    await refresh_auction_state(auction_id)
     
     logger.info(f"Auction {auction_id} paused with {remaining_time}s remaining")
     
@@ -6123,24 +7103,26 @@ async def reset_auction(league_id: str, commissioner_id: str = Query(...)):
         )
     
     auction_id = auction["id"]
+    await release_auction_state(auction_id, final=True)
+    await lot_catalogs.delete(auction_id)
+    auction_events.drop(auction_id)
     
     try:
         # 1. Delete all bids for this auction
         bids_result = await db.bids.delete_many({"auctionId": auction_id})
+        await db.sealed_bids.delete_many({"auctionId": auction_id})
         logger.info(f"Deleted {bids_result.deleted_count} bids for auction {auction_id}")
         
         # 2. Reset all participants
-        participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(100)
-        for participant in participants:
-            await db.league_participants.update_one(
-                {"leagueId": league_id, "userId": participant["userId"]},
-                {"$set": {
-                    "clubsWon": [],
-                    "budgetRemaining": league.get("budget", 500000000),
-                    "totalSpent": 0
-                }}
-            )
-        logger.info(f"Reset {len(participants)} participants")
+        reset_result = await db.league_participants.update_many(
+            {"leagueId": league_id},
+            {"$set": {
+                "clubsWon": [],
+                "budgetRemaining": league.get("budget", 500000000),
+                "totalSpent": 0
+            }}
+        )
+        logger.info(f"Reset {reset_result.matched_count} participants")
         
         # 3. Delete league_points for this league
         points_result = await db.league_points.delete_many({"leagueId": league_id})
@@ -6164,7 +7146,7 @@ async def reset_auction(league_id: str, commissioner_id: str = Query(...)):
         return {
             "message": "Auction reset successfully",
             "bidsDeleted": bids_result.deleted_count,
-            "participantsReset": len(participants)
+            "participantsReset": reset_result.matched_count
         }
         
     except Exception as e:
@@ -6207,20 +7189,28 @@ async def resume_auction(auction_id: str, commissioner_id: str = None):
             "pausedAt": ""
         }}
     )
+    await active_auctions.activate(auction["leagueId"], auction_id)
     
     # Restart timer
     current_lot_id = auction.get("currentLotId")
     if not current_lot_id:
         current_lot_id = f"{auction_id}-lot-{auction.get('currentLot', 1)}"
     
-    asyncio.create_task(countdown_timer(auction_id, new_end_time, current_lot_id))
+    sealed_round = auction.get("sealedRound")
+    if auction.get("lotMode") == SEALED and sealed_round:
+        await db.auctions.update_one({"id": auction_id}, {"$set": {"sealedRound.endsAt": new_end_time}})
+        await schedule_sealed_round_close(auction_id, sealed_round["number"], new_end_time)
+    else:
+        await refresh_auction_state(auction_id)
+        await schedule_lot_timer(auction_id, current_lot_id, new_end_time)
     
-    # Notify all participants
-    await sio.emit('auction_resumed', {
+    # Notify all participants (timer carries the new deadline for deadline-mode clients)
+    await emit_auction_event(auction_id, 'auction_resumed', {
         'message': 'Auction has been resumed by the commissioner',
         'newEndTime': new_end_time.isoformat(),
-        'remainingTime': remaining_time
-    }, room=f"auction:{auction_id}")
+        'remainingTime': remaining_time,
+        'timer': await create_timer_event(current_lot_id, to_epoch_ms(new_end_time))
+    })
     
     logger.info(f"Auction {auction_id} resumed with {remaining_time}s remaining")
     
@@ -6244,27 +7234,28 @@ async def delete_auction(auction_id: str, commissioner_id: str = None):
     #     raise HTTPException(status_code=403, detail="Only the commissioner can delete this auction")
     
     # Cancel any active timers
-    if auction_id in active_timers:
-        active_timers[auction_id].cancel()
-        del active_timers[auction_id]
+    await cancel_lot_timer(auction_id)
+    await release_auction_state(auction_id, final=True)
+    await lot_catalogs.delete(auction_id)
+    auction_events.drop(auction_id)
     
     # Delete all bids for this auction
     bid_result = await db.bids.delete_many({"auctionId": auction_id})
+    await db.sealed_bids.delete_many({"auctionId": auction_id})
     
     # Reset participant budgets and clubs won (since auction is being deleted)
-    participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(100)
-    for participant in participants:
-        await db.league_participants.update_one(
-            {"id": participant["id"]},
-            {"$set": {
-                "budgetRemaining": league["budget"],  # Reset to full budget
-                "totalSpent": 0.0,
-                "clubsWon": []
-            }}
-        )
+    reset_result = await db.league_participants.update_many(
+        {"leagueId": auction["leagueId"]},
+        {"$set": {
+            "budgetRemaining": league["budget"],  # Reset to full budget
+            "totalSpent": 0.0,
+            "clubsWon": []
+        }}
+    )
     
     # Delete auction
     auction_result = await db.auctions.delete_one({"id": auction_id})
+    await active_auctions.deactivate(auction["leagueId"], auction_id)
     
     # Update league status back to 'active' (ready for new auction)
     await db.leagues.update_one(
@@ -6275,7 +7266,7 @@ async def delete_auction(auction_id: str, commissioner_id: str = None):
     delete_results = {
         "auction": auction_result.deleted_count,
         "bids": bid_result.deleted_count,
-        "participants_reset": len(participants)
+        "participants_reset": reset_result.matched_count
     }
     
     logger.info(f"Deleted auction {auction_id}: {delete_results}")
@@ -6295,168 +7286,248 @@ async def delete_auction(auction_id: str, commissioner_id: str = None):
     }
 
 # ===== TIMER COUNTDOWN =====
-async def countdown_timer(auction_id: str, end_time: datetime, lot_id: str):
-    """Countdown timer with standardized events"""
+timer_heartbeats = {}  # auction_id -> epoch ms of the last timer_heartbeat
+
+async def emit_lot_tick(timer: LotTimer):
+    """
+    Called by lot_timers every 500ms for a running lot. Legacy clients get a tick each
+    time; the whole room gets a timer_heartbeat every TIMER_HEARTBEAT_SECONDS so
+    deadline-mode clients can resync without per-tick traffic.
+    """
+    if is_round_lot_id(timer.lot_id):
+        return  # Sealed rounds only carry their deadline in the round events
+    timer_data = await create_timer_event(timer.lot_id, timer.ends_at_ms)
     
-    # Store this timer to prevent duplicates
-    if auction_id in active_timers:
-        # Cancel existing timer
-        active_timers[auction_id].cancel()
+    # Metrics: Track timer ticks
+    metrics.increment_timer_tick(timer.auction_id)
     
-    # Create current task handle
-    current_task = asyncio.current_task()
-    active_timers[auction_id] = current_task
+    await emit_encoded('tick', timer_data, tick_room(timer.auction_id))
     
-    try:
-        logger.info(f"Starting countdown timer for auction {auction_id}, lot {lot_id}")
-        
-        # Convert end_time to epoch milliseconds
-        if end_time.tzinfo is None:
-            end_time = end_time.replace(tzinfo=timezone.utc)
-        ends_at_ms = int(end_time.timestamp() * 1000)
-        
-        while True:
-            await asyncio.sleep(0.5)  # 500ms tick interval
-            
-            # Check if we should stop (cancelled or auction ended)
-            if auction_id not in active_timers or active_timers[auction_id] != current_task:
-                logger.info(f"Timer for auction {auction_id} was cancelled")
-                break
-            
-            # Check if auction still exists and is active
-            auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
-            if not auction or auction["status"] != "active":
-                logger.info(f"Auction {auction_id} no longer active, stopping timer")
-                break
-            
-            # Get updated end time (in case of anti-snipe)
-            current_end_time = auction.get("timerEndsAt")
-            if not current_end_time:
-                logger.info(f"No timer end time for auction {auction_id}, stopping timer")
-                break
-            
-            # Update ends_at_ms if it changed (anti-snipe)
-            if current_end_time.tzinfo is None:
-                current_end_time = current_end_time.replace(tzinfo=timezone.utc)
-            new_ends_at_ms = int(current_end_time.timestamp() * 1000)
-            
-            if new_ends_at_ms != ends_at_ms:
-                # Anti-snipe occurred, update end time
-                ends_at_ms = new_ends_at_ms
-                logger.info(f"Anti-snipe detected for auction {auction_id}, new end time: {ends_at_ms}")
-            
-            # Check if timer expired
-            now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
-            if now_ms >= ends_at_ms:
-                # Timer expired, complete the lot
-                logger.info(f"Timer expired for auction {auction_id}, completing lot")
-                await complete_lot(auction_id)
-                break
-            
-            # Emit timer tick
-            timer_data = create_timer_event(lot_id, ends_at_ms)
-            logger.debug(f"Emitting tick for lot {lot_id}: seq={timer_data['seq']}")
-            
-            # Metrics: Track timer ticks
-            metrics.increment_timer_tick(auction_id)
-            
-            await sio.emit('tick', timer_data, room=f"auction:{auction_id}")  # Broadcast to auction room only
+    last_heartbeat = timer_heartbeats.get(timer.auction_id, 0)
+    if timer_data["serverNow"] - last_heartbeat >= TIMER_HEARTBEAT_SECONDS * 1000:
+        timer_heartbeats[timer.auction_id] = timer_data["serverNow"]
+        await emit_encoded('timer_heartbeat', timer_data, f"auction:{timer.auction_id}")
+
+async def on_lot_timer_expired(timer: LotTimer):
+    """
+    Deadline reached for a lot. One read confirms the lot is still running and that no
+    extension was written by another process before the lot is settled.
+    """
+    timer_heartbeats.pop(timer.auction_id, None)
+    auction = await db.auctions.find_one(
+        {"id": timer.auction_id},
+        {"_id": 0, "status": 1, "currentLotId": 1, "timerEndsAt": 1, "lotMode": 1, "sealedRound.number": 1}
+    )
+    if not auction or auction.get("status") != "active":
+        logger.info(f"Auction {timer.auction_id} no longer active, dropping lot timer")
+        await cancel_lot_timer(timer.auction_id)
+        return
+    if auction.get("currentLotId") and auction["currentLotId"] != timer.lot_id:
+        logger.info(f"Lot {timer.lot_id} already replaced by {auction['currentLotId']}, dropping lot timer")
+        return
     
-    except asyncio.CancelledError:
-        logger.info(f"Timer for auction {auction_id} was cancelled")
-    except Exception as e:
-        logger.error(f"Timer error for auction {auction_id}: {str(e)}")
-    finally:
-        # Clean up timer reference
-        if auction_id in active_timers and active_timers[auction_id] == current_task:
-            del active_timers[auction_id]
-        logger.info(f"Timer cleanup completed for auction {auction_id}")
+    ends_at_ms = timer.ends_at_ms
+    if auction.get("timerEndsAt"):
+        ends_at_ms = max(ends_at_ms, to_epoch_ms(auction["timerEndsAt"]))
+    state = auction_states.get(timer.auction_id) if FEATURE_AUCTION_STATE_CACHE and auction_states else None
+    if state and state.current_lot_id == timer.lot_id and state.timer_ends_at:
+        ends_at_ms = max(ends_at_ms, to_epoch_ms(state.timer_ends_at))
+    
+    if ends_at_ms > int(time.time() * 1000):
+        # Extended elsewhere - keep counting down
+        await schedule_lot_timer(timer.auction_id, timer.lot_id, datetime.fromtimestamp(ends_at_ms / 1000, tz=timezone.utc))
+        return
+    
+    if auction.get("lotMode") == SEALED and auction.get("sealedRound"):
+        logger.info(f"Timer expired for auction {timer.auction_id}, closing sealed round")
+        await close_sealed_round(timer.auction_id, auction["sealedRound"]["number"])
+        return
+    logger.info(f"Timer expired for auction {timer.auction_id}, completing lot")
+    await complete_lot(timer.auction_id)
+
+# Single scheduler for every lot deadline in this process (replaces per-auction polling tasks)
+lot_timers = LotTimerScheduler(on_tick=emit_lot_tick, on_expire=on_lot_timer_expired, tick_interval=0.5)
 
 # ===== SOCKET.IO EVENTS =====
 @sio.event
-async def connect(sid, environ):
+async def connect(sid, environ, auth=None):
     logger.info(f"🟢 Client connected: {sid}")
     
-    # Send connection confirmation
-    await sio.emit('connected', {'sid': sid}, room=sid)
+    # Wire encoding is fixed for the connection: auth {encoding: "msgpack"} opts into binary frames
+    auth = auth or {}
+    encoding = negotiate_encoding(auth.get('encoding'), SOCKET_MSGPACK_ENABLED)
+    session = {'encoding': encoding}
+    
+    # Verify the JWT once; handlers read identity and memberships from the session afterwards
+    claims = None
+    if auth.get('token'):
+        try:
+            claims = decode_token(auth['token'])
+        except HTTPException as e:
+            logger.warning(f"Socket {sid} sent an invalid token: {e.detail}")
+        if claims and claims.get('type') != 'access':
+            claims = None
+    if claims and claims.get('sub'):
+        user_id = claims['sub']
+        memberships = await db.league_participants.find(
+            {"userId": user_id}, {"_id": 0, "leagueId": 1}
+        ).to_list(None)
+        league_ids = sorted({m["leagueId"] for m in memberships})
+        session.update({
+            'userId': user_id,
+            'displayName': claims.get('name'),
+            'email': claims.get('email'),
+            'leagueIds': league_ids
+        })
+        socket_sessions.track(sid, user_id, league_ids)
+    elif SOCKET_AUTH_REQUIRED:
+        raise SocketConnectionRefused('authentication required')
+    await sio.save_session(sid, session)
+    
+    # Send connection confirmation (msgpack clients get the key table to expand compact frames)
+    connected = {'sid': sid, 'encoding': encoding, 'authenticated': 'userId' in session}
+    if encoding == MSGPACK:
+        connected['keys'] = COMPACT_KEYS
+    await sio.emit('connected', connected, room=sid)
     
     # NOTE: Client will emit 'rejoin_rooms' with user context to rejoin their active rooms
 
 @sio.event
 async def rejoin_rooms(sid, data):
-    """Handle reconnection - rejoin user's active rooms"""
-    user_id = data.get('userId')
+    """
+    Handle reconnection - rejoin user's active rooms.
+    Leagues come from the session and auctions from the active auction index, so an
+    authenticated rejoin makes no Mongo query; all rooms are then entered in one fan-out.
+    """
+    data = data or {}
+    session = await socket_session(sid)
+    user_id = await socket_user_id(sid, data.get('userId'))
     if not user_id:
         return
     
-    logger.info(f"🔄 Rejoining rooms for user {user_id} (socket {sid})")
-    
-    # Find all leagues this user participates in
-    participants = await db.league_participants.find({"userId": user_id}, {"_id": 0}).to_list(100)
-    
-    for participant in participants:
-        league_id = participant["leagueId"]
-        room_name = f"league:{league_id}"
-        await sio.enter_room(sid, room_name)
-        logger.info(f"  ✅ Rejoined league room: {room_name}")
+    # Leagues this user participates in: from the verified session, else one lookup (legacy sockets)
+    if session.get('userId'):
+        league_ids = session.get('leagueIds', [])
+    else:
+        participants = await db.league_participants.find({"userId": user_id}, {"_id": 0, "leagueId": 1}).to_list(None)
+        league_ids = [p["leagueId"] for p in participants]
     
-    # Find all active auctions for user's leagues
-    league_ids = [p["leagueId"] for p in participants]
-    if league_ids:
+    auction_ids = await active_auctions.lookup(league_ids)
+    if auction_ids is None:
+        # Shared index unreachable - fall back to the query it replaces
         auctions = await db.auctions.find({
             "leagueId": {"$in": league_ids},
             "status": "active"
-        }).to_list(100)
-        
-        for auction in auctions:
-            auction_id = auction["id"]
-            room_name = f"auction:{auction_id}"
-            await sio.enter_room(sid, room_name)
-            logger.info(f"  ✅ Rejoined auction room: {room_name}")
+        }, {"_id": 0, "id": 1}).to_list(None)
+        auction_ids = [auction["id"] for auction in auctions]
     
-    logger.info(f"🔄 Rejoin complete for user {user_id}")
+    timer_mode = 'deadline' if data.get('timerMode') == 'deadline' else 'tick'
+    protocol = negotiate_protocol(data.get('protocol'))
+    encoding = session.get('encoding', JSON)
+    league_rooms = [f"league:{league_id}" for league_id in league_ids]
+    auction_rooms = [f"auction:{auction_id}" for auction_id in auction_ids]
+    rooms = league_rooms + [
+        room for auction_id in auction_ids
+        for room in auction_stream_rooms(auction_id, timer_mode, protocol, encoding)
+    ]
+    await asyncio.gather(*(sio.enter_room(sid, room) for room in rooms))
+    
+    changes = await room_presence.join_many(league_rooms + auction_rooms, sid, user_id)
+    await broadcast_presence_changes(changes)
+    
+    logger.info(f"🔄 Rejoined {len(league_rooms)} league and {len(auction_rooms)} auction rooms for user {user_id} (socket {sid})")
 
 @sio.event
 async def disconnect(sid):
     logger.info(f"🔴 Client disconnected: {sid}")
     metrics.increment_socket_disconnection()
+    socket_sessions.untrack(sid)
+    await broadcast_presence_changes(await room_presence.leave_all(sid))
+
+def sealed_round_view(auction: dict) -> Optional[dict]:
+    """Open sealed round for snapshots (bids stay private)"""
+    sealed_round = auction.get("sealedRound")
+    if auction.get("lotMode") != SEALED or not sealed_round:
+        return None
+    ends_at = sealed_round.get("endsAt")
+    return {
+        'round': sealed_round.get("number"),
+        'clubIds': sealed_round.get("clubIds", []),
+        'reoffer': sealed_round.get("reoffer", False),
+        'pricing': auction.get("sealedPricing", "second"),
+        'endsAt': ends_at.isoformat() if ends_at else None
+    }
+
+async def build_auction_snapshot(auction: dict) -> dict:
+    """
+    Prompt D: auction_snapshot body for late joiners: status, currentLot, currentClubId,
+    currentBid, timerEndsAt, sold/unsold lists. The per-socket timer event is added by the caller.
+    """
+    auction_id = auction["id"]
+    current_club_id = auction.get("currentClubId")
+    
+    current_club = None
+    current_bids = []
+    if current_club_id:
+        current_club = await lot_catalogs.asset(auction_id, current_club_id)
+        bids = await db.bids.find({
+            "auctionId": auction_id,
+            "clubId": current_club_id
+        }, {"_id": 0}).to_list(None)
+        current_bids = [Bid(**b).model_dump(mode='json') for b in bids]
+    
+    participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(None)
+    
+    return {
+        'status': auction.get("status"),
+        'currentLot': auction.get("currentLot", 0),
+        'currentClubId': current_club_id,
+        'currentClub': current_club,
+        'currentBid': auction.get("currentBid"),
+        'currentBidder': auction.get("currentBidder"),
+        'timerEndsAt': auction.get("timerEndsAt").isoformat() if auction.get("timerEndsAt") else None,
+        'soldClubs': sold_club_ids(auction, participants),
+        'unsoldClubs': auction.get("unsoldClubs", []),
+        'seq': auction.get("bidSequence", 0),
+        'participants': [LeagueParticipant(**p).model_dump(mode='json') for p in participants],
+        'participantsVersion': auction.get("participantsVersion", 0),
+        'currentBids': current_bids,
+        'sealedRound': sealed_round_view(auction)
+    }
 
 @sio.event
 async def join_auction(sid, data):
     """
     Prompt D: Join an auction room - used by AuctionRoom page
     Sends one-shot auction_snapshot to late joiners
-    Returns ack with {ok:true, room, roomSize}
+    Returns ack with {ok:true, room, roomSize, timerMode, serverNow, clientTime}
+    
+    timerMode "deadline" opts out of 500ms ticks; clientTime (epoch ms) is echoed back
+    with serverNow so the client can estimate its clock offset from the round trip.
+    protocol (default 1) is negotiated down to AUCTION_PROTOCOL_VERSION and returned in the ack.
+    
+    resume {streamId, streamSeq} (last event seen before a disconnect) replays only the
+    missed events; the snapshot is sent when the gap is no longer in the replay buffer.
     """
     auction_id = data.get('auctionId')
     if not auction_id:
         return {'ok': False, 'error': 'auctionId required'}
     
-    # Get user ID from data (passed by frontend)
-    user_id = data.get('userId')
+    # Verified session user, or the userId passed by legacy clients
+    user_id = await socket_user_id(sid, data.get('userId'))
+    timer_mode = data.get('timerMode') if data.get('timerMode') in TIMER_MODES else 'tick'
+    protocol = negotiate_protocol(data.get('protocol'))
     
     room_name = f"auction:{auction_id}"
-    await sio.enter_room(sid, room_name)
+    encoding = await socket_encoding(sid)
+    await enter_auction_stream(sid, auction_id, timer_mode, protocol, encoding)
     
-    # Track user in waiting room (for waiting room participant display)
-    if user_id:
-        await db.auctions.update_one(
-            {"id": auction_id},
-            {"$addToSet": {"usersInWaitingRoom": user_id}}
-        )
-        logger.info(f"✅ Added user {user_id} to waiting room tracking for auction {auction_id}")
-        
-        # Broadcast updated waiting room list to all clients in the auction room
-        updated_auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
-        if updated_auction:
-            await sio.emit('waiting_room_updated', {
-                'usersInWaitingRoom': updated_auction.get('usersInWaitingRoom', [])
-            }, room=room_name)
-            logger.info(f"📢 Broadcast waiting room update: {len(updated_auction.get('usersInWaitingRoom', []))} users")
+    # Track user in waiting room (for waiting room participant display); only arrivals are broadcast
+    change = await room_presence.join(room_name, sid, user_id)
+    if change:
+        await broadcast_presence_changes([change])
     
-    # Get room size after join
-    room_sockets = {} if not hasattr(sio.manager, "rooms") else sio.manager.rooms.get(f"auction:{auction_id}", {}).get("/", set())
-    room_size = len(room_sockets)
+    room_size = await get_room_size(room_name)
     
     # JSON log for debugging
     logger.info(json.dumps({
@@ -6468,37 +7539,26 @@ async def join_auction(sid, data):
         "timestamp": datetime.now(timezone.utc).isoformat()
     }))
     
+    # Resuming client: replay the missed deltas instead of the full snapshot
+    resume = data.get('resume') or {}
+    missed = auction_events.since(auction_id, resume.get('streamId'), resume.get('streamSeq')) if FEATURE_EVENT_REPLAY else None
+    if missed is not None:
+        for event, payload in missed:
+            await emit_to_socket(sid, event, payload, encoding)
+        logger.info(f"Replayed {len(missed)} events to {sid} for auction {auction_id} from seq {resume.get('streamSeq')}")
+    
     # Prompt D: Send auction_snapshot for late joiners (one-shot, read-only)
-    auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0})
+    auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0}) if missed is None else None
     if auction:
-        
-        # Get league to determine sport
-        league = await db.leagues.find_one({"id": auction["leagueId"]}, {"_id": 0})
-        sport_key = league.get("sportKey", "football") if league else "football"
-        
-        # Get current club if exists
-        current_club = None
-        if auction.get("currentClubId"):
-            if sport_key == "football":
-                club = await db.assets.find_one({"id": auction["currentClubId"]}, {"_id": 0})
-            else:
-                club = await db.assets.find_one({"id": auction["currentClubId"], "sportKey": sport_key}, {"_id": 0})
-            
-            if club:
-                club.pop('_id', None)
-                current_club = Club(**club).model_dump() if sport_key == "football" else club
-        
-        # Get all bids for current club
-        current_bids = []
-        if auction.get("currentClubId"):
-            bids = await db.bids.find({
-                "auctionId": auction_id,
-                "clubId": auction["currentClubId"]
-            }, {"_id": 0}).to_list(100)
-            current_bids = [Bid(**b).model_dump(mode='json') for b in bids]
+        # Taken before the snapshot so events emitted while it is sent are newer
+        stream_position = auction_events.position(auction_id) if FEATURE_EVENT_REPLAY else {}
+        # Shared by every joiner until the auction changes
+        snapshot = await auction_snapshots.get(
+            auction_id, snapshot_version(auction), lambda: build_auction_snapshot(auction)
+        )
+        snapshot_data = {**snapshot, **stream_position}
         
         # Create timer data if timer is active
-        timer_data = None
         if auction.get("timerEndsAt") and auction.get("status") == "active":
             timer_end = auction["timerEndsAt"]
             if timer_end.tzinfo is None:
@@ -6511,60 +7571,131 @@ async def join_auction(sid, data):
                 lot_id = f"{auction_id}-lot-{auction['currentLot']}"
             
             if lot_id:
-                timer_data = create_timer_event(lot_id, ends_at_ms)
-                logger.info(f"Auction snapshot timer data - seq: {timer_data['seq']}, endsAt: {timer_data['endsAt']}")
-        
-        # Get participants
-        participants = await db.league_participants.find({"leagueId": auction["leagueId"]}, {"_id": 0}).to_list(100)
-        
-        # Remove MongoDB _id field
-        for p in participants:
-            p.pop('_id', None)
-        
-        # Get sold/unsold lists for snapshot
-        sold_clubs = []
-        unsold_clubs = auction.get("unsoldClubs", [])
-        
-        # Calculate sold clubs (all bids with winners)
-        all_bids = await db.bids.find({"auctionId": auction_id}, {"_id": 0}).to_list(1000)
-        sold_club_ids = set()
-        for bid in all_bids:
-            if bid.get("clubId"):
-                sold_club_ids.add(bid["clubId"])
-        sold_clubs = list(sold_club_ids)
-        
-        # Prompt D: Send auction_snapshot with: status, currentLot, currentClubId, currentBid, timerEndsAt, sold/unsold lists
-        snapshot_data = {
-            'status': auction.get("status"),
-            'currentLot': auction.get("currentLot", 0),
-            'currentClubId': auction.get("currentClubId"),
-            'currentClub': current_club,
-            'currentBid': auction.get("currentBid"),
-            'currentBidder': auction.get("currentBidder"),
-            'timerEndsAt': auction.get("timerEndsAt").isoformat() if auction.get("timerEndsAt") else None,
-            'soldClubs': sold_clubs,
-            'unsoldClubs': unsold_clubs,
-            'seq': auction.get("bidSequence", 0),
-            'participants': [LeagueParticipant(**p).model_dump(mode='json') for p in participants],
-            'currentBids': current_bids
-        }
-        
-        # Add timer data if available
-        if timer_data:
-            snapshot_data['timer'] = timer_data
+                snapshot_data['timer'] = await create_timer_event(lot_id, ends_at_ms)
+                logger.info(f"Auction snapshot timer data - seq: {snapshot_data['timer']['seq']}, endsAt: {snapshot_data['timer']['endsAt']}")
         
         # Send one-shot snapshot to this client only
-        await sio.emit('auction_snapshot', snapshot_data, room=sid)
+        await emit_to_socket(sid, 'auction_snapshot', snapshot_data, encoding)
         logger.info(f"Sent auction_snapshot to {sid} - status: {auction.get('status')}, lot: {auction.get('currentLot')}")
     
-    # Prompt D: Return ack
-    return {'ok': True, 'room': room_name, 'roomSize': room_size}
+    # Prompt D: Return ack (doubles as the clock-offset handshake)
+    return {
+        'ok': True,
+        'room': room_name,
+        'roomSize': room_size,
+        'timerMode': timer_mode,
+        'protocol': protocol,
+        'encoding': encoding,
+        'resumed': missed is not None,
+        'heartbeatMs': int(TIMER_HEARTBEAT_SECONDS * 1000),
+        'clientTime': data.get('clientTime'),
+        'serverNow': int(time.time() * 1000)
+    }
+
+@sio.on('place_bid')
+async def place_bid_socket(sid, data):
+    """
+    Bid over the auction socket - same validation and acceptance as POST /auction/{id}/bid
+    without the HTTP round trip. Ack: {ok:true, message, bid} or {ok:false, status, detail}.
+    """
+    data = data or {}
+    auction_id = data.get('auctionId')
+    user_id, user, error = await socket_bidder(sid, data.get('userId'))
+    if error:
+        return error
+    try:
+        bid_input = BidCreate(userId=user_id, amount=data.get('amount'), clientBidId=data.get('clientBidId'))
+    except ValueError:
+        return {'ok': False, 'status': 422, 'detail': 'userId and amount are required'}
+    if not auction_id:
+        return {'ok': False, 'status': 422, 'detail': 'auctionId required'}
+    
+    try:
+        result = await _place_bid(auction_id, bid_input, bid_input.clientBidId, user=user)
+    except HTTPException as e:
+        return {'ok': False, 'status': e.status_code, 'detail': e.detail}
+    except Exception as e:
+        logger.error(f"❌ Socket bid failed for auction {auction_id}: {e}")
+        return {'ok': False, 'status': 500, 'detail': 'Failed to place bid'}
+    return {'ok': True, **result}
+
+@sio.on('set_proxy_bid')
+async def set_proxy_bid_socket(sid, data):
+    """Proxy maximum over the auction socket - same as POST /auction/{id}/proxy-bid, result via ack"""
+    data = data or {}
+    auction_id = data.get('auctionId')
+    user_id, _, error = await socket_bidder(sid, data.get('userId'))
+    if error:
+        return error
+    try:
+        proxy_input = ProxyBidCreate(userId=user_id, maxAmount=data.get('maxAmount'))
+    except ValueError:
+        return {'ok': False, 'status': 422, 'detail': 'userId and maxAmount are required'}
+    if not auction_id:
+        return {'ok': False, 'status': 422, 'detail': 'auctionId required'}
+    
+    try:
+        result = await set_proxy_bid(auction_id, proxy_input)
+    except HTTPException as e:
+        return {'ok': False, 'status': e.status_code, 'detail': e.detail}
+    except Exception as e:
+        logger.error(f"❌ Socket proxy bid failed for auction {auction_id}: {e}")
+        return {'ok': False, 'status': 500, 'detail': 'Failed to register proxy bid'}
+    return {'ok': True, **result}
+
+@sio.on('place_sealed_bid')
+async def place_sealed_bid_socket(sid, data):
+    """Sealed round bid over the auction socket - same as POST /auction/{id}/sealed-bid, result via ack"""
+    data = data or {}
+    auction_id = data.get('auctionId')
+    user_id, _, error = await socket_bidder(sid, data.get('userId'))
+    if error:
+        return error
+    try:
+        bid_input = SealedBidCreate(userId=user_id, clubId=data.get('clubId'), amount=data.get('amount'))
+    except ValueError:
+        return {'ok': False, 'status': 422, 'detail': 'userId, clubId and amount are required'}
+    if not auction_id:
+        return {'ok': False, 'status': 422, 'detail': 'auctionId required'}
+    
+    try:
+        result = await place_sealed_bid(auction_id, bid_input)
+    except HTTPException as e:
+        return {'ok': False, 'status': e.status_code, 'detail': e.detail}
+    except Exception as e:
+        logger.error(f"❌ Socket sealed bid failed for auction {auction_id}: {e}")
+        return {'ok': False, 'status': 500, 'detail': 'Failed to place sealed bid'}
+    return {'ok': True, **result}
+
+@sio.event
+async def fetch_participants(sid, data):
+    """Full participant state for clients that missed a participantsVersion (delta gap)"""
+    auction_id = (data or {}).get('auctionId')
+    auction = await db.auctions.find_one({"id": auction_id}, {"_id": 0, "leagueId": 1, "participantsVersion": 1}) if auction_id else None
+    if not auction:
+        return {'ok': False, 'error': 'Auction not found'}
+    participants = await db.league_participants.find(
+        {"leagueId": auction["leagueId"]}, PUBLIC_PARTICIPANT_FIELDS
+    ).to_list(None)
+    return {
+        'ok': True,
+        'participants': participants,
+        'participantsVersion': auction.get("participantsVersion", 0)
+    }
+
+@sio.event
+async def clock_sync(sid, data):
+    """Clock-offset probe: echo the client's send time with the server clock"""
+    return {'clientTime': (data or {}).get('clientTime'), 'serverNow': int(time.time() * 1000)}
 
 @sio.event
 async def leave_auction(sid, data):
     auction_id = data.get('auctionId')
     if auction_id:
-        await sio.leave_room(sid, f"auction:{auction_id}")
+        await leave_auction_stream(sid, auction_id)
+        change = await room_presence.leave(f"auction:{auction_id}", sid)
+        if change:
+            await broadcast_presence_changes([change])
         logger.info(f"Client {sid} left auction:{auction_id}")
 
 @sio.event
@@ -6577,19 +7708,12 @@ async def join_league_room(sid, data):
     if not league_id:
         return {'ok': False, 'error': 'leagueId required'}
     
-    # Get user ID from session if available
-    try:
-        session = await sio.get_session(sid)
-        user_id = session.get('userId') if session else None
-    except Exception:
-        user_id = None
+    user_id = await socket_user_id(sid, data.get('userId'))
     
     room_name = f"league:{league_id}"
     await sio.enter_room(sid, room_name)
-    
-    # Get room size after join
-    room_sockets = {} if not hasattr(sio.manager, "rooms") else sio.manager.rooms.get(f"league:{league_id}", {}).get("/", set())
-    room_size = len(room_sockets)
+    await room_presence.join(room_name, sid, user_id)
+    room_size = await get_room_size(room_name)
     
     # JSON log for debugging
     logger.info(json.dumps({
@@ -6601,8 +7725,10 @@ async def join_league_room(sid, data):
         "timestamp": datetime.now(timezone.utc).isoformat()
     }))
     
-    # Get all participants for sync
-    participants = await db.league_participants.find({"leagueId": league_id}, {"_id": 0}).to_list(100)
+    # Get all participants for sync (every member - leagues run to hundreds of managers)
+    participants = await db.league_participants.find(
+        {"leagueId": league_id}, {"_id": 0, "userId": 1, "userName": 1, "joinedAt": 1}
+    ).sort("joinedAt", 1).to_list(None)
     members = []
     for p in participants:
         members.append({
@@ -6635,8 +7761,113 @@ async def leave_league(sid, data):
     
     room_name = f"league:{league_id}"
     await sio.leave_room(sid, room_name)
+    await room_presence.leave(room_name, sid)
     logger.info(f"🟦 Socket {sid} left league room: {room_name}")
 
+# ===== SPECTATORS (read-only /spectate namespace) =====
+SPECTATOR_AUCTION_FIELDS = {
+    "_id": 0, "id": 1, "leagueId": 1, "status": 1, "lotMode": 1, "sealedRound": 1, "currentLot": 1,
+    "currentClubId": 1, "currentBid": 1, "currentBidder": 1, "timerEndsAt": 1, "bidSequence": 1,
+    "soldClubs": 1, "unsoldClubs": 1, "participantsVersion": 1
+}
+
+async def probe_spectator_auction(auction_id: str):
+    """(version, auction) for the spectator feed - one projected read per watched auction per interval"""
+    auction = await db.auctions.find_one({"id": auction_id}, SPECTATOR_AUCTION_FIELDS)
+    if not auction:
+        return None
+    return snapshot_version(auction) + (auction.get("participantsVersion", 0),), auction
+
+async def build_spectator_view(auction: dict, previous: Optional[dict]) -> dict:
+    """
+    Spectator frame body: current lot, leading bid, deadline and standings. No bid history or
+    full participant documents; standings are reused until a settlement changes them.
+    """
+    auction_id = auction["id"]
+    current_club_id = auction.get("currentClubId")
+    current_club = await lot_catalogs.asset(auction_id, current_club_id) if current_club_id else None
+    
+    participants_version = auction.get("participantsVersion", 0)
+    sold_count = len(auction.get("soldClubs") or [])
+    if previous and (previous["participantsVersion"], previous["soldCount"]) == (participants_version, sold_count):
+        standings = previous["standings"]
+    else:
+        participants = await db.league_participants.find(
+            {"leagueId": auction["leagueId"]},
+            {"_id": 0, "userId": 1, "userName": 1, "budgetRemaining": 1, "totalSpent": 1, "clubsWon": 1}
+        ).to_list(None)
+        standings = [{
+            'userId': p["userId"],
+            'userName': p.get("userName"),
+            'budgetRemaining': p.get("budgetRemaining"),
+            'totalSpent': p.get("totalSpent", 0.0),
+            'clubsWon': len(p.get("clubsWon") or [])
+        } for p in participants]
+    
+    return {
+        'auctionId': auction_id,
+        'status': auction.get("status"),
+        'currentLot': auction.get("currentLot", 0),
+        'currentClub': {'id': current_club["id"], 'name': current_club.get("name")} if current_club else None,
+        'currentBid': auction.get("currentBid"),
+        'currentBidder': auction.get("currentBidder"),
+        'endsAt': to_epoch_ms(auction["timerEndsAt"]) if auction.get("timerEndsAt") and auction.get("status") == "active" else None,
+        'seq': auction.get("bidSequence", 0),
+        'soldCount': sold_count,
+        'unsoldCount': len(auction.get("unsoldClubs") or []),
+        'sealedRound': sealed_round_view(auction),
+        'participantsVersion': participants_version,
+        'standings': standings,
+        'builtAt': int(time.time() * 1000)
+    }
+
+async def emit_spectator_frame(auction_id: str, frame: bytes):
+    # Every replica's feed serves its own watchers, so the frame skips the Socket.IO Redis queue
+    await sio.emit(SPECTATOR_FRAME_EVENT, frame, room=spectator_room(auction_id),
+                   namespace=SPECTATOR_NAMESPACE, ignore_queue=True)
+
+spectator_feed = SpectatorFeed(probe_spectator_auction, build_spectator_view, SPECTATOR_UPDATE_SECONDS)
+
+@sio.on('watch_auction', namespace=SPECTATOR_NAMESPACE)
+async def spectator_watch_auction(sid, data):
+    """
+    Watch an auction read-only. The current frame is sent right away as spectator_frame (UTF-8
+    JSON bytes), then again whenever the auction changes, at most every SPECTATOR_UPDATE_SECONDS.
+    Ack: {ok:true, auctionId, intervalMs, serverNow}
+    """
+    auction_id = (data or {}).get('auctionId')
+    if not auction_id:
+        return {'ok': False, 'error': 'auctionId required'}
+    
+    previous = spectator_feed.watch(sid, auction_id)
+    if previous:
+        await sio.leave_room(sid, spectator_room(previous), namespace=SPECTATOR_NAMESPACE)
+    # Enter before reading the frame so no update published in between is missed
+    await sio.enter_room(sid, spectator_room(auction_id), namespace=SPECTATOR_NAMESPACE)
+    frame = await spectator_feed.frame(auction_id)
+    if frame is None:
+        spectator_feed.unwatch(sid)
+        await sio.leave_room(sid, spectator_room(auction_id), namespace=SPECTATOR_NAMESPACE)
+        return {'ok': False, 'error': 'Auction not found'}
+    await sio.emit(SPECTATOR_FRAME_EVENT, frame, room=sid, namespace=SPECTATOR_NAMESPACE)
+    
+    return {
+        'ok': True,
+        'auctionId': auction_id,
+        'intervalMs': int(SPECTATOR_UPDATE_SECONDS * 1000),
+        'serverNow': int(time.time() * 1000)
+    }
+
+@sio.on('unwatch_auction', namespace=SPECTATOR_NAMESPACE)
+async def spectator_unwatch_auction(sid, data):
+    auction_id = spectator_feed.unwatch(sid)
+    if auction_id:
+        await sio.leave_room(sid, spectator_room(auction_id), namespace=SPECTATOR_NAMESPACE)
+
+@sio.on('disconnect', namespace=SPECTATOR_NAMESPACE)
+async def spectator_disconnect(sid):
+    spectator_feed.unwatch(sid)
+
 # ===== ROOT ENDPOINT =====
 @api_router.get("/")
 async def root():
@@ -6664,31 +7895,18 @@ async def debug_room_membership(scope: str, room_id: str):
     
     room_name = f"{scope}:{room_id}"
     
-    # Get all sockets in the room
-    room_sockets = {} if not hasattr(sio.manager, "rooms") else sio.manager.rooms.get(room_name, {}).get("/", set())
-    socket_ids = list(room_sockets)
-    
-    # Try to get user info for each socket (if session data is available)
-    socket_info = []
-    for sid in socket_ids:
-        user_id = None
-        if hasattr(sio, 'get_session'):
-            try:
-                session = await sio.get_session(sid)
-                user_id = session.get('userId') if session else None
-            except Exception:
-                pass
-        
-        socket_info.append({
-            "sid": sid,
-            "userId": user_id
-        })
+    # Socket ids are only known for this replica; memberCount covers every replica
+    socket_info = [
+        {"sid": sid, "userId": user_id or None}
+        for sid, user_id in room_presence.local_members(room_name).items()
+    ]
     
     return {
         "room": room_name,
         "scope": scope,
         "id": room_id,
-        "memberCount": len(socket_ids),
+        "memberCount": await get_room_size(room_name),
+        "replicaId": REPLICA_ID,
         "sockets": socket_info,
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "environment": env
@@ -6799,7 +8017,7 @@ async def get_auction_state(auction_id: str):
             ).to_list(100)
         
         # Build club status map from auction
-        club_queue = auction.get("clubQueue", [])
+        club_queue = await auction_club_queue(auction)
         current_lot = auction.get("currentLot", 0)
         
         club_status = []
@@ -7117,7 +8335,7 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
     allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-    allow_headers=["Authorization", "Content-Type", "Accept", "x-user-id"],
+    allow_headers=["Authorization", "Content-Type", "Accept", "x-user-id", "Idempotency-Key"],
     allow_credentials=True,
     max_age=600,  # Cache preflight for 10 minutes
 )
@@ -3,6 +3,8 @@ import os
 import socketio
 import logging
 
+from auction.wire import FastJson
+
 logger = logging.getLogger(__name__)
 
 FRONTEND_ORIGIN = os.getenv("FRONTEND_ORIGIN", "*")
@@ -57,7 +59,7 @@ sio = socketio.AsyncServer(
     ping_interval=20,
     ping_timeout=25,
     client_manager=mgr,            # Redis pub/sub for multi-pod or in-memory for single pod
-    json=None,                     # default
+    json=FastJson,                 # orjson when installed (stdlib json otherwise)
     logger=False,                  # Disable verbose Socket.IO logging
     engineio_logger=False,         # Disable verbose EngineIO logging (heartbeats)
     allow_upgrades=True,
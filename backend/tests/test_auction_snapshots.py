@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the versioned auction_snapshot cache.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.snapshots import AuctionSnapshotCache, snapshot_version, sold_club_ids
+
+
+def test_concurrent_joiners_share_one_build():
+    cache = AuctionSnapshotCache()
+    builds = []
+
+    async def build():
+        builds.append(1)
+        await asyncio.sleep(0.01)
+        return {"seq": 3}
+
+    async def scenario():
+        version = snapshot_version({"bidSequence": 3, "currentLot": 1, "status": "active"})
+        results = await asyncio.gather(*[cache.get("a1", version, build) for _ in range(20)])
+        again = await cache.get("a1", version, build)
+        return results, again
+
+    results, again = asyncio.run(scenario())
+    assert len(builds) == 1
+    assert all(r is results[0] for r in results) and again is results[0]
+
+
+def test_new_version_rebuilds():
+    cache = AuctionSnapshotCache()
+    seqs = iter([1, 2])
+
+    async def build():
+        return {"seq": next(seqs)}
+
+    async def scenario():
+        first = await cache.get("a1", snapshot_version({"bidSequence": 1}), build)
+        second = await cache.get("a1", snapshot_version({"bidSequence": 2}), build)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first["seq"] == 1 and second["seq"] == 2
+
+
+def test_settlement_changes_version_without_a_bid():
+    before = {"bidSequence": 5, "currentLot": 2, "status": "active", "soldClubs": [], "unsoldClubs": []}
+    after = {**before, "soldClubs": ["club-1"]}
+    assert snapshot_version(before) != snapshot_version(after)
+
+
+def test_sold_clubs_come_from_awards_not_bids():
+    participants = [{"clubsWon": ["c1", "c2"]}, {"clubsWon": ["c3"]}, {}]
+    assert sold_club_ids({"soldClubs": ["c9"]}, participants) == ["c9"]
+    assert sold_club_ids({}, participants) == ["c1", "c2", "c3"]
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the in-memory auction state and shared bid validation.
+No database needed - exercises the pure accept/validate logic only.
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.bidding import BidRejected, validate_bid, anti_snipe_deadline, bid_rollback_update, guarded_bid_update
+from auction import state as state_module
+from auction.state import SETTLING, AuctionState, AuctionStateStore
+
+NOW = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_state(**overrides):
+    auction = {
+        "id": "auction-1",
+        "leagueId": "league-1",
+        "status": "active",
+        "currentLot": 1,
+        "currentLotId": "auction-1-lot-1",
+        "currentClubId": "club-1",
+        "currentBid": None,
+        "currentBidder": None,
+        "bidSequence": 0,
+        "timerEndsAt": (NOW + timedelta(seconds=30)).replace(tzinfo=None),
+        "antiSnipeSeconds": 10,
+        "minimumBudget": 1_000_000.0,
+    }
+    auction.update(overrides)
+    league = {"clubSlots": 3}
+    participants = [
+        {"userId": "alice", "userName": "Alice", "userEmail": "a@test.com", "budgetRemaining": 100_000_000, "clubsWon": []},
+        {"userId": "bob", "userName": "Bob", "userEmail": "b@test.com", "budgetRemaining": 5_000_000, "clubsWon": ["x", "y"]},
+    ]
+    return AuctionState.from_documents(auction, league, participants)
+
+
+def test_accept_bid_updates_state():
+    state = make_state()
+    accepted = state.accept_bid("alice", 5_000_000, NOW)
+
+    assert accepted.bid_sequence == 1
+    assert accepted.club_id == "club-1"
+    assert accepted.extended_until is None
+    assert state.current_bid == 5_000_000
+    assert state.current_bidder == {"userId": "alice", "displayName": "Alice"}
+
+
+def test_rejects_self_outbid_and_low_bid():
+    state = make_state()
+    state.accept_bid("alice", 5_000_000, NOW)
+
+    with pytest.raises(BidRejected) as exc:
+        state.accept_bid("alice", 6_000_000, NOW)
+    assert exc.value.reason == "self_outbid"
+
+    with pytest.raises(BidRejected) as exc:
+        state.accept_bid("bob", 5_000_000, NOW)
+    assert "must exceed" in exc.value.detail
+    assert state.bid_sequence == 1
+
+
+def test_rejects_when_not_active():
+    state = make_state(status="paused")
+    with pytest.raises(BidRejected) as exc:
+        state.accept_bid("alice", 5_000_000, NOW)
+    assert exc.value.detail == "Auction is not active (status: paused)"
+
+
+def test_anti_snipe_extends_deadline():
+    state = make_state(timerEndsAt=(NOW + timedelta(seconds=4)).replace(tzinfo=None))
+    accepted = state.accept_bid("alice", 5_000_000, NOW)
+
+    assert accepted.extended_until == NOW + timedelta(seconds=10)
+    assert state.timer_ends_at == NOW + timedelta(seconds=10)
+
+
+def test_validate_bid_reserve_and_roster():
+    # 3 slots, none won: must keep £2m back
+    with pytest.raises(BidRejected) as exc:
+        validate_bid("u", 9_500_000, 1_000_000, 10_000_000, 0, 3, "club-1", None, None)
+    assert exc.value.reason == "insufficient_reserve"
+
+    with pytest.raises(BidRejected) as exc:
+        validate_bid("u", 1_000_000, 1_000_000, 10_000_000, 3, 3, "club-1", None, None)
+    assert exc.value.reason == "roster_full"
+
+    # Final slot can spend everything
+    validate_bid("u", 10_000_000, 1_000_000, 10_000_000, 2, 3, "club-1", None, None)
+
+
+def test_anti_snipe_deadline_outside_window():
+    assert anti_snipe_deadline(NOW + timedelta(seconds=20), 10, NOW) is None
+    assert anti_snipe_deadline(NOW - timedelta(seconds=1), 10, NOW) is None
+    assert anti_snipe_deadline(None, 10, NOW) is None
+
+
+def test_guarded_bid_update_filters_race_conditions():
+    query, pipeline, extended_until = guarded_bid_update(
+        "auction-1", "club-1", "alice", 5_000_000, {"userId": "alice", "displayName": "$Alice"}, 10, NOW
+    )
+
+    assert query["status"] == "active"
+    assert query["currentClubId"] == "club-1"
+    assert query["currentBidder.userId"] == {"$ne": "alice"}
+    assert {"currentBid": {"$lt": 5_000_000}} in query["$or"]
+    # Display names are user input - must not be evaluated as field paths
+    assert pipeline[0]["$set"]["currentBidder"] == {"$literal": {"userId": "alice", "displayName": "$Alice"}}
+    assert extended_until == NOW + timedelta(seconds=10)
+
+
+def test_bid_rollback_only_undoes_the_latest_write():
+    before = {"currentBid": 4_000_000, "currentBidder": {"userId": "bob", "displayName": "Bob"}, "timerEndsAt": NOW}
+    query, update = bid_rollback_update("auction-1", "alice", 5_000_000, 7, before)
+
+    assert query == {"id": "auction-1", "bidSequence": 7, "currentBid": 5_000_000, "currentBidder.userId": "alice"}
+    assert update["$set"] == before
+    assert update["$inc"] == {"bidSequence": 1}
+
+
+class FlakyBids:
+    """bids collection that inserts the first row of a batch, then fails `failures` times"""
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.rows = []
+
+    async def insert_many(self, docs, ordered=True):
+        if self.failures:
+            self.failures -= 1
+            self.rows.append(docs[0])  # Partial write before the error
+            raise ConnectionError("primary stepped down")
+        self.rows.extend(docs)
+
+    async def distinct(self, field, query):
+        ids = set(query["id"]["$in"])
+        return [row["id"] for row in self.rows if row["id"] in ids]
+
+
+class FakeAuctions:
+    def __init__(self):
+        self.updates = []
+
+    async def update_one(self, query, update):
+        self.updates.append((query, update))
+
+
+class FakeDb:
+    def __init__(self, failures=0):
+        self.bids = FlakyBids(failures)
+        self.auctions = FakeAuctions()
+
+
+def queue_bid(store, state, user_id, amount):
+    accepted = state.accept_bid(user_id, amount, NOW)
+    store.persist_bid(state, accepted, {"id": f"{user_id}-{amount}", "amount": amount})
+
+
+def test_failed_write_behind_batch_is_retried_until_persisted(monkeypatch):
+    monkeypatch.setattr(state_module, "RETRY_INITIAL_SECONDS", 0.001)
+    db = FakeDb(failures=2)
+    store = AuctionStateStore(db)
+    state = make_state()
+
+    async def run():
+        queue_bid(store, state, "alice", 2_000_000)
+        queue_bid(store, state, "bob", 3_000_000)
+        for _ in range(10):
+            await asyncio.sleep(0)  # Let the first attempt fail
+        failing = store.failing
+        await store.flush()
+        return failing
+
+    assert asyncio.run(run()) is True
+    # Retried without duplicating the row the failed attempt had written
+    assert [row["amount"] for row in db.bids.rows] == [2_000_000, 3_000_000]
+    assert store.failing is False
+    assert db.auctions.updates[-1][1]["$set"]["currentBid"] == 3_000_000
+
+
+def test_failing_store_refuses_new_bids():
+    store = AuctionStateStore(FakeDb())
+    store.failing = True
+    with pytest.raises(BidRejected) as exc:
+        asyncio.run(store.get_or_load("auction-1"))
+    assert exc.value.status_code == 503
+
+
+def test_closed_state_rejects_bids_until_reloaded():
+    store = AuctionStateStore(FakeDb())
+    state = make_state()
+    store._states[state.auction_id] = state
+
+    store.close(state.auction_id)
+    assert store.get(state.auction_id) is None
+    with pytest.raises(BidRejected):
+        state.accept_bid("alice", 5_000_000, NOW)  # A handler still holding the object
+    with pytest.raises(BidRejected) as exc:
+        asyncio.run(store.get_or_load(state.auction_id))  # No reload of the lot being settled
+    assert exc.value.detail == f"Auction is not active (status: {SETTLING})"
+
+    store.drop(state.auction_id)
+    store.failing = True
+    with pytest.raises(BidRejected) as exc:
+        asyncio.run(store.get_or_load(state.auction_id))
+    assert exc.value.status_code == 503
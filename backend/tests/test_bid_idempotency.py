@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Unit tests for bid idempotency keys.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.idempotency import BidIdempotencyStore, BidOutcome
+
+
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+def make_bid(calls, outcome):
+    async def execute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return outcome
+    return execute
+
+
+def test_retry_returns_original_outcome_without_running_again():
+    duplicates = []
+    store = BidIdempotencyStore(on_duplicate=duplicates.append)
+    calls = []
+    accepted = BidOutcome(200, {"message": "Bid placed successfully"})
+
+    async def run():
+        first = await store.run("a1", "alice", "k1", make_bid(calls, accepted))
+        retry = await store.run("a1", "alice", "k1", make_bid(calls, BidOutcome(400, "already highest")))
+        return first, retry
+
+    first, retry = asyncio.run(run())
+    assert first == retry == accepted
+    assert len(calls) == 1
+    assert duplicates == ["memory"]
+
+
+def test_concurrent_retry_awaits_the_running_bid():
+    duplicates = []
+    store = BidIdempotencyStore(on_duplicate=duplicates.append)
+    calls = []
+    outcome = BidOutcome(200, {"ok": True})
+
+    async def run():
+        return await asyncio.gather(
+            store.run("a1", "alice", "k1", make_bid(calls, outcome)),
+            store.run("a1", "alice", "k1", make_bid(calls, outcome)),
+        )
+
+    assert asyncio.run(run()) == [outcome, outcome]
+    assert len(calls) == 1
+    assert duplicates == ["inflight"]
+
+
+def test_keys_are_scoped_per_user_and_auction():
+    store = BidIdempotencyStore()
+    calls = []
+    outcome = BidOutcome(200, {"ok": True})
+
+    async def run():
+        await store.run("a1", "alice", "k1", make_bid(calls, outcome))
+        await store.run("a1", "bob", "k1", make_bid(calls, outcome))
+        await store.run("a2", "alice", "k1", make_bid(calls, outcome))
+
+    asyncio.run(run())
+    assert len(calls) == 3
+
+
+def test_rejections_are_remembered_but_server_errors_are_not():
+    store = BidIdempotencyStore()
+    calls = []
+
+    async def run():
+        rejected = await store.run("a1", "alice", "k1", make_bid(calls, BidOutcome(400, "Bid too low")))
+        await store.run("a1", "alice", "k1", make_bid(calls, BidOutcome(200, {})))
+        await store.run("a1", "alice", "k2", make_bid(calls, BidOutcome(500, "boom")))
+        retried = await store.run("a1", "alice", "k2", make_bid(calls, BidOutcome(200, {"ok": True})))
+        return rejected, retried
+
+    rejected, retried = asyncio.run(run())
+    assert rejected == BidOutcome(400, "Bid too low")
+    assert retried == BidOutcome(200, {"ok": True})
+    assert len(calls) == 3
+
+
+def test_rate_limited_bids_are_not_remembered():
+    store = BidIdempotencyStore()
+    calls = []
+
+    async def run():
+        await store.run("a1", "alice", "k1", make_bid(calls, BidOutcome(429, "Too many bids - slow down")))
+        return await store.run("a1", "alice", "k1", make_bid(calls, BidOutcome(200, {"ok": True})))
+
+    assert asyncio.run(run()) == BidOutcome(200, {"ok": True})
+    assert len(calls) == 2
+
+
+def test_retry_on_another_replica_is_answered_from_redis():
+    redis = FakeRedis()
+    duplicates = []
+    replica_a = BidIdempotencyStore(redis=redis)
+    replica_b = BidIdempotencyStore(redis=redis, on_duplicate=duplicates.append)
+    calls = []
+    outcome = BidOutcome(200, {"bid": {"amount": 5000000}})
+
+    async def run():
+        await replica_a.run("a1", "alice", "k1", make_bid(calls, outcome))
+        return await replica_b.run("a1", "alice", "k1", make_bid(calls, outcome))
+
+    assert asyncio.run(run()) == outcome
+    assert len(calls) == 1
+    assert duplicates == ["redis"]
+
+
+def test_expired_and_excess_outcomes_are_dropped():
+    store = BidIdempotencyStore(ttl_seconds=0.01, max_entries=2)
+    calls = []
+
+    async def run():
+        for key in ("k1", "k2", "k3"):
+            await store.run("a1", "alice", key, make_bid(calls, BidOutcome(200, {})))
+        assert len(store) <= 2
+        await asyncio.sleep(0.02)
+        await store.run("a1", "alice", "k3", make_bid(calls, BidOutcome(200, {})))
+
+    asyncio.run(run())
+    assert len(calls) == 4
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the per-bidder token bucket.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.ratelimit import TokenBucketLimiter, retry_after_seconds
+
+
+class FakeRedis:
+    def __init__(self, allowed=True, fail=False):
+        self.allowed = allowed
+        self.fail = fail
+        self.calls = []
+
+    async def eval(self, script, numkeys, key, rate, burst):
+        self.calls.append(key)
+        if self.fail:
+            raise ConnectionError("redis down")
+        return 1 if self.allowed else 0
+
+
+def test_burst_then_refill():
+    limiter = TokenBucketLimiter(rate=2, burst=3)
+    assert [limiter.take_local("a1:alice", 0.0) for _ in range(4)] == [True, True, True, False]
+    assert limiter.take_local("a1:alice", 0.5)  # one token back after 1/rate seconds
+    assert not limiter.take_local("a1:alice", 0.5)
+
+
+def test_buckets_are_per_key():
+    limiter = TokenBucketLimiter(rate=1, burst=1)
+    assert limiter.take_local("a1:alice", 0.0)
+    assert not limiter.take_local("a1:alice", 0.0)
+    assert limiter.take_local("a1:bob", 0.0)
+    assert limiter.take_local("a2:alice", 0.0)
+
+
+def test_refilled_buckets_are_dropped():
+    limiter = TokenBucketLimiter(rate=1, burst=2)
+    for i in range(100):
+        limiter.take_local(f"a1:user{i}", 0.0)
+    assert len(limiter) == 100
+    limiter.take_local("a1:late", 2.0)
+    assert len(limiter) == 1
+
+
+def test_shared_bucket_decides_after_local_allows():
+    redis = FakeRedis(allowed=False)
+    limiter = TokenBucketLimiter(rate=1, burst=1, redis=redis)
+
+    async def run():
+        return [await limiter.allow("a1:alice"), await limiter.allow("a1:alice")]
+
+    assert asyncio.run(run()) == [False, False]
+    # The second bid was rejected locally without a Redis round trip
+    assert redis.calls == ["bid-rate:a1:alice"]
+
+
+def test_redis_errors_fall_back_to_local_bucket():
+    limiter = TokenBucketLimiter(rate=1, burst=1, redis=FakeRedis(fail=True))
+
+    async def run():
+        return [await limiter.allow("a1:alice"), await limiter.allow("a1:alice")]
+
+    assert asyncio.run(run()) == [True, False]
+
+
+def test_retry_after_is_whole_seconds():
+    assert retry_after_seconds(5) == 1
+    assert retry_after_seconds(0.25) == 4
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Incremental completion counters checked against the full-scan computation.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.completion import (
+    award_counter_increments,
+    compute_auction_status,
+    compute_status_from_counters,
+    count_completion,
+    join_counter_increments,
+    verify_counters,
+)
+
+MINIMUM = 1_000_000
+LEAGUE = {"clubSlots": 2}
+
+
+def award(participant, counters, amount):
+    """Mirror of the settlement updates: $push/$inc on the winner, $inc on the auction"""
+    participant["clubsWon"].append(f"club-{len(participant['clubsWon'])}")
+    participant["totalSpent"] += amount
+    participant["budgetRemaining"] -= amount
+    for field, value in award_counter_increments(participant, LEAGUE["clubSlots"], MINIMUM).items():
+        counters[field] += value
+
+
+def test_counters_track_full_scan_through_an_auction():
+    participants = [
+        {"userId": "alice", "clubsWon": [], "totalSpent": 0, "budgetRemaining": 10_000_000},
+        {"userId": "bob", "clubsWon": [], "totalSpent": 0, "budgetRemaining": 3_000_000},
+    ]
+    counters = count_completion(LEAGUE, participants, MINIMUM)
+    assert counters == {"managerCount": 2, "remainingDemand": 4, "eligibleBidders": 2, "lotsSold": 0}
+
+    state = {"current_lot": 1, "total_lots": 6, "unsold_count": 0}
+    # Bob spends down below the minimum with a slot left; Alice fills her roster
+    for participant, amount in [(participants[1], 2_500_000), (participants[0], 4_000_000), (participants[0], 5_000_000)]:
+        award(participant, counters, amount)
+        assert verify_counters(LEAGUE, participants, counters, MINIMUM) == {}
+        assert (compute_status_from_counters(LEAGUE, counters, state)["should_complete"]
+                == compute_auction_status(LEAGUE, participants, state)["should_complete"])
+
+    assert counters == {"managerCount": 2, "remainingDemand": 1, "eligibleBidders": 0, "lotsSold": 3}
+
+
+def test_verify_counters_reports_drift():
+    participants = [{"userId": "alice", "clubsWon": ["a", "b"], "budgetRemaining": 0}]
+    counters = {"managerCount": 1, "remainingDemand": 1, "eligibleBidders": 0, "lotsSold": 2}
+
+    assert verify_counters(LEAGUE, participants, counters, MINIMUM) == {"remainingDemand": (1, 0)}
+    assert compute_status_from_counters(LEAGUE, {**counters, "remainingDemand": 0}, {})["reasons"][0] == "ALL_ROSTERS_FILLED"
+
+
+def test_manager_joining_mid_auction_reopens_demand():
+    participants = [{"userId": "alice", "clubsWon": ["a", "b"], "totalSpent": 9_000_000, "budgetRemaining": 1_000_000}]
+    counters = count_completion(LEAGUE, participants, MINIMUM)
+    assert compute_status_from_counters(LEAGUE, counters, {})["should_complete"]
+
+    newcomer = {"userId": "bob", "clubsWon": [], "totalSpent": 0, "budgetRemaining": 10_000_000}
+    participants.append(newcomer)
+    for field, value in join_counter_increments(newcomer, LEAGUE["clubSlots"], MINIMUM).items():
+        counters[field] += value
+
+    assert verify_counters(LEAGUE, participants, counters, MINIMUM) == {}
+    assert counters["eligibleBidders"] == 1
+    assert not compute_status_from_counters(LEAGUE, counters, {"current_lot": 2, "total_lots": 6})["should_complete"]
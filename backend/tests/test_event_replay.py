@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the per-auction event replay buffer.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.replay import AuctionEventLog
+
+
+def test_resume_returns_only_missed_events():
+    log = AuctionEventLog(buffer_size=10)
+    first = log.record("a1", "lot_started", {"lotNumber": 1})
+    log.record("a1", "bid_update", {"seq": 1})
+    log.record("a1", "bid_update", {"seq": 2})
+
+    missed = log.since("a1", first["streamId"], first["streamSeq"])
+    assert [event for event, _ in missed] == ["bid_update", "bid_update"]
+    assert [payload["seq"] for _, payload in missed] == [1, 2]
+    assert missed[-1][1]["streamSeq"] == 3 and missed[-1][1]["auctionId"] == "a1"
+
+
+def test_up_to_date_client_gets_nothing():
+    log = AuctionEventLog()
+    log.record("a1", "bid_update", {"seq": 1})
+    position = log.position("a1")
+
+    assert log.since("a1", position["streamId"], position["streamSeq"]) == []
+
+
+def test_gap_beyond_buffer_falls_back_to_snapshot():
+    log = AuctionEventLog(buffer_size=3)
+    stream_id = log.position("a1")["streamId"]
+    for seq in range(1, 6):
+        log.record("a1", "bid_update", {"seq": seq})
+
+    assert log.since("a1", stream_id, 1) is None  # events 2..5 needed, only 3..5 kept
+    assert [p["seq"] for _, p in log.since("a1", stream_id, 2)] == [3, 4, 5]
+
+
+def test_unknown_or_restarted_stream_falls_back_to_snapshot():
+    log = AuctionEventLog()
+    old_stream = log.record("a1", "bid_update", {"seq": 1})["streamId"]
+
+    assert log.since("a1", "not-a-stream", 0) is None
+    assert log.since("a2", old_stream, 0) is None
+    log.drop("a1")
+    log.record("a1", "lot_started", {"lotNumber": 2})
+    assert log.since("a1", old_stream, 1) is None
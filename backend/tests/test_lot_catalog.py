@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the pre-materialised lot catalog payloads.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.catalog import LotCatalogStore, lot_display
+
+
+def test_football_assets_use_club_shape():
+    asset = {"_id": "mongo-id", "id": "club-1", "name": "Arsenal", "country": "England", "sportKey": "football"}
+    display = lot_display(asset, "football")
+
+    assert display["id"] == "club-1"
+    assert display["name"] == "Arsenal"
+    assert "_id" not in display and "sportKey" not in display
+    assert "competitionShort" in display
+
+
+def test_other_sports_keep_raw_fields():
+    asset = {"_id": "mongo-id", "id": "player-1", "name": "Root", "sportKey": "cricket", "meta": {"role": "bat"}}
+    display = lot_display(asset, "cricket")
+
+    assert display == {"id": "player-1", "name": "Root", "sportKey": "cricket", "meta": {"role": "bat"}}
+    assert "_id" in asset  # source document untouched
+
+
+def test_invalid_football_asset_falls_back_to_raw_fields():
+    display = lot_display({"id": "club-2", "name": "No Country"}, "football")
+    assert display == {"id": "club-2", "name": "No Country"}
+
+
+def matches(doc, query):
+    for field, condition in query.items():
+        value = doc.get(field)
+        if isinstance(condition, dict):
+            if "$exists" in condition and (field in doc) != condition["$exists"]:
+                return False
+            if "$gte" in condition and (value is None or value < condition["$gte"]):
+                return False
+            if "$lt" in condition and (value is None or value >= condition["$lt"]):
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+class FakeCursor:
+    def __init__(self, docs):
+        self.docs = docs
+
+    def sort(self, key, direction=1):
+        keys = [(key, direction)] if isinstance(key, str) else key
+        for field, direction in reversed(keys):
+            self.docs.sort(key=lambda doc: doc.get(field), reverse=direction < 0)
+        return self
+
+    def skip(self, count):
+        self.docs = self.docs[count:]
+        return self
+
+    def limit(self, count):
+        if count:
+            self.docs = self.docs[:count]
+        return self
+
+    def __aiter__(self):
+        self._iter = iter(self.docs)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._iter)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class FakeCollection:
+    def __init__(self):
+        self.docs = []
+
+    async def insert_many(self, docs, ordered=True):
+        self.docs.extend(dict(doc) for doc in docs)
+
+    async def delete_many(self, query):
+        self.docs = [doc for doc in self.docs if not matches(doc, query)]
+
+    async def delete_one(self, query):
+        await self.delete_many(query)
+
+    async def find_one(self, query, projection=None):
+        return next((doc for doc in self.docs if matches(doc, query)), None)
+
+    def find(self, query, projection=None):
+        return FakeCursor([doc for doc in self.docs if matches(doc, query)])
+
+
+class FakeDb:
+    def __init__(self):
+        self.auction_lots = FakeCollection()
+        self.auction_lot_catalogs = FakeCollection()
+
+
+def cricket_players(*numbers):
+    return [{"id": f"player-{i}", "name": f"P{i}", "sportKey": "cricket"} for i in numbers]
+
+
+def test_queue_keeps_lot_order_and_survives_reload():
+    db = FakeDb()
+
+    async def scenario():
+        await LotCatalogStore(db).create("auction-1", cricket_players(3, 1, 2), "cricket")
+        reloaded = LotCatalogStore(db)  # e.g. after a restart
+        return (await reloaded.queue_page("auction-1"), await reloaded.queue_page("auction-1", 1, 1),
+                await reloaded.lot_at("auction-1", 3), await reloaded.queue_page("auction-missing"))
+
+    queue, window, past_end, missing = asyncio.run(scenario())
+    assert queue == ["player-3", "player-1", "player-2"]
+    assert window == ["player-1"]
+    assert past_end is None
+    assert missing == []
+    assert len(db.auction_lots.docs) == 3  # One document per lot
+
+
+def test_lots_page_reads_one_page_by_name_with_lot_numbers():
+    db = FakeDb()
+
+    async def scenario():
+        store = LotCatalogStore(db)
+        await store.create("auction-1", cricket_players(3, 1, 2), "cricket")
+        return await store.lots_page("auction-1", skip=1, limit=1)
+
+    (lot,) = asyncio.run(scenario())
+    assert (lot["id"], lot["lotNumber"]) == ("player-2", 3)
+
+
+def test_single_document_catalog_moves_to_per_lot_documents():
+    db = FakeDb()
+    db.auction_lot_catalogs.docs.append({
+        "auctionId": "auction-1", "sportKey": "cricket",
+        "lots": cricket_players(2, 1, 9), "queue": ["player-2", "player-1"]
+    })
+
+    async def scenario():
+        store = LotCatalogStore(db)
+        return await store.queue_page("auction-1"), await store.asset("auction-1", "player-9")
+
+    queue, manual = asyncio.run(scenario())
+    assert queue == ["player-2", "player-1"]
+    assert manual["name"] == "P9"  # Looked up outside the queue - kept, without an order
+    assert db.auction_lot_catalogs.docs == []
+    assert sorted(doc.get("order", -1) for doc in db.auction_lots.docs) == [-1, 0, 1]
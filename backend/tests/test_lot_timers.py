@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the centralised lot timer scheduler.
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.timers import LotTimerScheduler
+
+
+def soon(seconds):
+    return datetime.now(timezone.utc) + timedelta(seconds=seconds)
+
+
+def test_expiry_fires_once_per_lot():
+    async def run():
+        expired, ticks = [], []
+
+        async def on_tick(timer):
+            ticks.append(timer.auction_id)
+
+        async def on_expire(timer):
+            expired.append((timer.auction_id, timer.lot_id))
+
+        scheduler = LotTimerScheduler(on_tick, on_expire, tick_interval=0.05)
+        scheduler.schedule("a1", "a1-lot-1", soon(0.2))
+        scheduler.schedule("a2", "a2-lot-1", soon(0.1))
+        await asyncio.sleep(0.35)
+        await scheduler.stop()
+        return expired, ticks, scheduler
+
+    expired, ticks, scheduler = asyncio.run(run())
+    assert expired == [("a2", "a2-lot-1"), ("a1", "a1-lot-1")]
+    assert "a1" in ticks and "a2" in ticks
+    assert len(scheduler) == 0
+    assert scheduler.stats()["expiredTotal"] == 2
+
+
+def test_extend_and_cancel():
+    async def run():
+        expired = []
+
+        async def on_expire(timer):
+            expired.append((timer.auction_id, timer.ends_at_ms))
+
+        scheduler = LotTimerScheduler(None, on_expire)
+        scheduler.schedule("a1", "a1-lot-1", soon(0.1))
+        scheduler.schedule("a2", "a2-lot-1", soon(0.1))
+        # Anti-snipe on a stale lot is ignored, on the live lot it moves the deadline
+        assert not scheduler.extend("a1", "a1-lot-0", soon(0.3))
+        assert scheduler.extend("a1", "a1-lot-1", soon(0.3))
+        scheduler.cancel("a2")
+        await asyncio.sleep(0.2)
+        early = list(expired)
+        await asyncio.sleep(0.2)
+        await scheduler.stop()
+        return early, expired
+
+    early, expired = asyncio.run(run())
+    assert early == []
+    assert [auction_id for auction_id, _ in expired] == ["a1"]
+
+
+def test_deferred_jobs_run_once_per_key():
+    async def run():
+        ran = []
+
+        async def job(name):
+            ran.append(name)
+
+        scheduler = LotTimerScheduler(None, None)
+        assert scheduler.defer("a1:after-lot-1:start", 0.1, lambda: job("first"))
+        # A second trigger for the same lot while pending is ignored
+        assert not scheduler.defer("a1:after-lot-1:start", 0.1, lambda: job("second"))
+        scheduler.defer("a1:after-lot-1:countdown-3", 0, lambda: job("countdown"))
+        await asyncio.sleep(0.05)
+        early = list(ran)
+        await asyncio.sleep(0.1)
+        pending = scheduler.stats()["jobsPending"]
+        await scheduler.stop()
+        return early, ran, pending
+
+    early, ran, pending = asyncio.run(run())
+    assert early == ["countdown"]
+    assert ran == ["countdown", "first"]
+    assert pending == 0
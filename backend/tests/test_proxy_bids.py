@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Unit tests for proxy (maximum) bid resolution.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.proxy import current_proxies, proxy_set_updates, resolve_proxy_bids
+
+M = 1_000_000
+
+
+def test_single_proxy_beats_current_price_by_one_increment():
+    steps = resolve_proxy_bids(5 * M, "bob", {"alice": {"maxAmount": 20 * M, "at": 1}})
+    assert steps == [("alice", 6 * M)]
+
+
+def test_competing_maxima_collapse_to_one_bid():
+    proxies = {"alice": {"maxAmount": 20 * M, "at": 1}, "carol": {"maxAmount": 12 * M, "at": 2}}
+    # A ten-round war between alice and carol is one visible bid at carol's max + increment
+    assert resolve_proxy_bids(5 * M, "bob", proxies) == [("alice", 13 * M)]
+
+
+def test_winner_pays_at_most_their_maximum():
+    proxies = {"alice": {"maxAmount": 12.5 * M, "at": 1}, "carol": {"maxAmount": 12 * M, "at": 2}}
+    assert resolve_proxy_bids(5 * M, None, proxies) == [("alice", 12.5 * M)]
+
+
+def test_tie_goes_to_earlier_registration():
+    proxies = {"alice": {"maxAmount": 10 * M, "at": 2}, "carol": {"maxAmount": 10 * M, "at": 1}}
+    assert resolve_proxy_bids(5 * M, None, proxies) == [("carol", 10 * M)]
+
+
+def test_leader_defends_with_challenger_bid_first():
+    proxies = {"alice": {"maxAmount": 20 * M, "at": 1}, "carol": {"maxAmount": 12 * M, "at": 2}}
+    assert resolve_proxy_bids(6 * M, "alice", proxies) == [("carol", 12 * M), ("alice", 13 * M)]
+
+
+def test_leader_keeps_lead_on_equal_maximum():
+    proxies = {"alice": {"maxAmount": 12 * M, "at": 1}, "carol": {"maxAmount": 12 * M, "at": 2}}
+    assert resolve_proxy_bids(6 * M, "alice", proxies) == [("carol", 11 * M), ("alice", 12 * M)]
+
+
+def test_nothing_happens_when_maxima_cannot_beat_price():
+    assert resolve_proxy_bids(15 * M, "bob", {"alice": {"maxAmount": 15 * M, "at": 1}}) == []
+    assert resolve_proxy_bids(15 * M, "alice", {"alice": {"maxAmount": 30 * M, "at": 1}}) == []
+    assert resolve_proxy_bids(None, None, {}) == []
+
+
+def test_only_current_lot_proxies_count():
+    auction = {"currentLotId": "lot-2", "proxyBids": {"lotId": "lot-1", "bids": {"alice": {"maxAmount": M}}}}
+    assert current_proxies(auction) == {}
+    auction["proxyBids"]["lotId"] = "lot-2"
+    assert current_proxies(auction) == {"alice": {"maxAmount": M}}
+
+
+def test_registration_is_guarded_on_the_running_lot():
+    (same_lot_q, same_lot_u), (new_lot_q, new_lot_u) = proxy_set_updates("a1", "lot-2", "alice", {"maxAmount": M})
+
+    assert same_lot_q["currentLotId"] == new_lot_q["currentLotId"] == "lot-2"
+    assert same_lot_u == {"$set": {"proxyBids.bids.alice": {"maxAmount": M}}}
+    assert new_lot_q["proxyBids.lotId"] == {"$ne": "lot-2"}
+    assert new_lot_u == {"$set": {"proxyBids": {"lotId": "lot-2", "bids": {"alice": {"maxAmount": M}}}}}
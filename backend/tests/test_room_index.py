@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the league -> active auction index used by rejoin_rooms.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.rooms import ACTIVE_AUCTIONS_KEY, DEACTIVATE_SCRIPT, ActiveAuctionIndex
+
+
+class FakeRedis:
+    """One hash is all the index uses; DEACTIVATE_SCRIPT is emulated in Python"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.fail = False
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hsetnx(self, key, field, value):
+        self.hashes.setdefault(key, {}).setdefault(field, value)
+
+    async def hmget(self, key, fields):
+        if self.fail:
+            raise ConnectionError("redis down")
+        values = self.hashes.get(key, {})
+        return [values.get(field) for field in fields]
+
+    async def eval(self, script, numkeys, key, league_id, auction_id):
+        assert script == DEACTIVATE_SCRIPT
+        values = self.hashes.get(key, {})
+        if values.get(league_id) == auction_id:
+            del values[league_id]
+            return 1
+        return 0
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def hsetnx(self, *args):
+        self.calls.append(args)
+
+    async def execute(self):
+        return [await self.redis.hsetnx(*args) for args in self.calls]
+
+
+def test_lifecycle_in_process():
+    index = ActiveAuctionIndex()
+
+    async def run():
+        await index.seed([("l1", "a1")])
+        await index.activate("l2", "a2")
+        both = await index.lookup(["l1", "l2", "l3"])
+        await index.deactivate("l1", "a1")  # Completed
+        await index.deactivate("l2", "a2")  # Paused
+        after = await index.lookup(["l1", "l2"])
+        await index.activate("l2", "a2")  # Resumed
+        return both, after, await index.lookup(["l2"]), await index.lookup([])
+
+    assert asyncio.run(run()) == (["a1", "a2"], [], ["a2"], [])
+
+
+def test_stale_deactivate_keeps_the_replacement_auction():
+    index = ActiveAuctionIndex()
+
+    async def run():
+        await index.activate("l1", "old")
+        await index.activate("l1", "new")
+        await index.deactivate("l1", "old")
+        return await index.lookup(["l1"])
+
+    assert asyncio.run(run()) == ["new"]
+
+
+def test_index_is_shared_across_replicas():
+    redis = FakeRedis()
+    replica_a = ActiveAuctionIndex(redis=redis)
+    replica_b = ActiveAuctionIndex(redis=redis)
+
+    async def run():
+        await replica_a.activate("l1", "a1")
+        seen_by_b = await replica_b.lookup(["l1", "l2"])
+        await replica_b.deactivate("l1", "other")
+        await replica_b.deactivate("l1", "a1")
+        return seen_by_b, await replica_a.lookup(["l1"])
+
+    assert asyncio.run(run()) == (["a1"], [])
+
+
+def test_seed_does_not_overwrite_live_entries():
+    redis = FakeRedis()
+    index = ActiveAuctionIndex(redis=redis)
+
+    async def run():
+        await index.activate("l1", "resumed")
+        await index.seed([("l1", "stale"), ("l2", "a2")])
+
+    asyncio.run(run())
+    assert redis.hashes[ACTIVE_AUCTIONS_KEY] == {"l1": "resumed", "l2": "a2"}
+
+
+def test_unreachable_index_asks_for_the_fallback_query():
+    redis = FakeRedis()
+    redis.fail = True
+    index = ActiveAuctionIndex(redis=redis)
+    assert asyncio.run(index.lookup(["l1"])) is None
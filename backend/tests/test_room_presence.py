@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Unit tests for room presence (socket and distinct-user tracking per room).
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.presence import JOIN_SCRIPT, LEAVE_SCRIPT, PresenceChange, RoomPresence
+
+ROOM = "auction:a1"
+
+
+class FakeRedis:
+    """Shared store for several replicas; the two Lua scripts are emulated in Python"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.sets = {}
+        self.strings = {}
+
+    async def eval(self, script, numkeys, *args):
+        sockets_key, users_key, members_key = args[:numkeys]
+        sockets = self.hashes.setdefault(sockets_key, {})
+        users = self.hashes.setdefault(users_key, {})
+        members = self.sets.setdefault(members_key, set())
+        if script == JOIN_SCRIPT:
+            sid, user, member = args[numkeys:]
+            if sid in sockets:
+                return [0, len(sockets)]
+            sockets[sid] = user
+            members.add(member)
+            count = 0
+            if user:
+                users[user] = users.get(user, 0) + 1
+                count = users[user]
+            return [count, len(sockets)]
+        assert script == LEAVE_SCRIPT
+        sid, member = args[numkeys:]
+        members.discard(member)
+        if sid not in sockets:
+            return ["", -1, len(sockets)]
+        user = sockets.pop(sid)
+        left = 0
+        if user:
+            users[user] -= 1
+            left = max(users[user], 0)
+            if left == 0:
+                del users[user]
+        return [user, left, len(sockets)]
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def hlen(self, key):
+        return len(self.hashes.get(key, {}))
+
+    async def hkeys(self, key):
+        return list(self.hashes.get(key, {}))
+
+    async def set(self, key, value, ex=None):
+        self.strings[key] = value
+
+    async def exists(self, key):
+        return int(key in self.strings)
+
+    async def sadd(self, key, *values):
+        self.sets.setdefault(key, set()).update(values)
+
+    async def srem(self, key, *values):
+        self.sets.setdefault(key, set()).difference_update(values)
+
+    async def smembers(self, key):
+        return set(self.sets.get(key, set()))
+
+    async def delete(self, key):
+        self.sets.pop(key, None)
+        self.strings.pop(key, None)
+
+
+class FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.calls = []
+
+    def eval(self, *args):
+        self.calls.append(args)
+
+    async def execute(self):
+        self.redis.round_trips = getattr(self.redis, "round_trips", 0) + 1
+        return [await self.redis.eval(*args) for args in self.calls]
+
+
+def test_changes_only_for_first_and_last_socket_of_a_user():
+    presence = RoomPresence("r1")
+
+    async def run():
+        return [
+            await presence.join(ROOM, "s1", "alice"),
+            await presence.join(ROOM, "s2", "alice"),
+            await presence.join(ROOM, "s2", "alice"),  # Re-join of the same socket
+            await presence.leave(ROOM, "s1"),
+            await presence.leave(ROOM, "s2"),
+        ]
+
+    assert asyncio.run(run()) == [
+        PresenceChange(ROOM, "alice", True), None, None, None, PresenceChange(ROOM, "alice", False)
+    ]
+
+
+def test_sizes_count_sockets_and_distinct_users():
+    presence = RoomPresence("r1")
+
+    async def run():
+        await presence.join(ROOM, "s1", "alice")
+        await presence.join(ROOM, "s2", "alice")
+        await presence.join(ROOM, "s3", "bob")
+        await presence.join(ROOM, "s4")  # Anonymous sockets count as sockets only
+        return (await presence.socket_count(ROOM), await presence.user_count(ROOM),
+                await presence.user_ids(ROOM), presence.cached_socket_count(ROOM))
+
+    assert asyncio.run(run()) == (4, 2, ["alice", "bob"], 4)
+
+
+def test_disconnect_leaves_every_room():
+    presence = RoomPresence("r1")
+
+    async def run():
+        await presence.join(ROOM, "s1", "alice")
+        await presence.join("league:l1", "s1", "alice")
+        await presence.join("league:l1", "s2", "alice")
+        changes = await presence.leave_all("s1")
+        return changes, await presence.socket_count("league:l1")
+
+    changes, league_size = asyncio.run(run())
+    assert changes == [PresenceChange(ROOM, "alice", False)]
+    assert league_size == 1
+
+
+def test_sizes_are_shared_across_replicas():
+    redis = FakeRedis()
+    replica_a = RoomPresence("a", redis=redis)
+    replica_b = RoomPresence("b", redis=redis)
+
+    async def run():
+        joined_a = await replica_a.join(ROOM, "s1", "alice")
+        joined_b = await replica_b.join(ROOM, "s2", "alice")  # Same user on another pod
+        sizes = (await replica_a.socket_count(ROOM), await replica_b.user_count(ROOM))
+        left_a = await replica_a.leave(ROOM, "s1")
+        left_b = await replica_b.leave(ROOM, "s2")
+        return joined_a, joined_b, sizes, left_a, left_b
+
+    joined_a, joined_b, sizes, left_a, left_b = asyncio.run(run())
+    assert joined_a == PresenceChange(ROOM, "alice", True)
+    assert joined_b is None
+    assert sizes == (2, 1)
+    assert left_a is None
+    assert left_b == PresenceChange(ROOM, "alice", False)
+
+
+def test_sweep_removes_sockets_of_a_lapsed_replica():
+    redis = FakeRedis()
+    dead = RoomPresence("dead", redis=redis)
+    live = RoomPresence("live", redis=redis)
+
+    async def run():
+        await dead.heartbeat()
+        await dead.join(ROOM, "s1", "alice")
+        await live.join(ROOM, "s2", "bob")
+        redis.strings.pop("presence:replica:dead")  # Heartbeat key expired
+        changes = await live.heartbeat()
+        return changes, await live.user_ids(ROOM), await live.heartbeat()
+
+    changes, users, second_sweep = asyncio.run(run())
+    assert changes == [PresenceChange(ROOM, "alice", False)]
+    assert users == ["bob"]
+    assert second_sweep == []
+
+
+def test_join_many_matches_single_joins_in_one_round_trip():
+    redis = FakeRedis()
+    replica_a = RoomPresence("a", redis=redis)
+    replica_b = RoomPresence("b", redis=redis)
+    rooms = [ROOM, "league:l1", "league:l2"]
+
+    async def run():
+        await replica_a.join("league:l1", "s1", "alice")  # Alice is already in l1 on another pod
+        changes = await replica_b.join_many(rooms, "s2", "alice")
+        again = await replica_b.join_many(rooms, "s2", "alice")
+        sizes = [await replica_b.socket_count(room) for room in rooms]
+        return changes, again, sizes
+
+    changes, again, sizes = asyncio.run(run())
+    assert changes == [PresenceChange(ROOM, "alice", True), PresenceChange("league:l2", "alice", True)]
+    assert again == []
+    assert sizes == [1, 2, 1]
+    assert redis.round_trips == 1
+
+
+def test_join_many_in_process():
+    presence = RoomPresence("r1")
+
+    async def run():
+        changes = await presence.join_many([ROOM, "league:l1"], "s1", "alice")
+        return changes, await presence.leave_all("s1")
+
+    joined, left = asyncio.run(run())
+    assert [change.room for change in joined] == [ROOM, "league:l1"]
+    assert sorted(change.room for change in left) == ["auction:a1", "league:l1"]
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Unit tests for sealed-bid batch round resolution.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.sealed import (
+    FIRST_PRICE, SECOND_PRICE, award_from_record, award_record, next_round_clubs, resolve_sealed_round
+)
+
+M = 1_000_000
+
+
+def manager(user_id, budget=100 * M, clubs_won=()):
+    return {"userId": user_id, "budgetRemaining": budget, "clubsWon": list(clubs_won)}
+
+
+def bid(club_id, user_id, amount, at=0):
+    return {"clubId": club_id, "userId": user_id, "amount": amount, "at": at}
+
+
+def resolve(club_ids, bids, participants, club_slots=3, pricing=SECOND_PRICE):
+    awards = resolve_sealed_round(club_ids, bids, participants, club_slots, 1 * M, pricing)
+    return {award.club_id: (award.user_id, award.amount) for award in awards}
+
+
+def test_second_price_pays_best_competing_bid():
+    result = resolve(["a"], [bid("a", "alice", 30 * M), bid("a", "bob", 20 * M)],
+                     [manager("alice"), manager("bob")])
+    assert result == {"a": ("alice", 20 * M)}
+
+
+def test_first_price_pays_own_bid():
+    result = resolve(["a"], [bid("a", "alice", 30 * M), bid("a", "bob", 20 * M)],
+                     [manager("alice"), manager("bob")], pricing=FIRST_PRICE)
+    assert result == {"a": ("alice", 30 * M)}
+
+
+def test_lone_bidder_pays_minimum_under_second_price():
+    assert resolve(["a"], [bid("a", "alice", 30 * M)], [manager("alice")]) == {"a": ("alice", 1 * M)}
+
+
+def test_lot_without_bids_is_unsold():
+    assert resolve(["a", "b"], [bid("a", "alice", 5 * M)], [manager("alice")])["b"] == (None, None)
+
+
+def test_earlier_bid_breaks_ties():
+    result = resolve(["a"], [bid("a", "bob", 10 * M, at=2), bid("a", "alice", 10 * M, at=1)],
+                     [manager("alice"), manager("bob")])
+    assert result["a"] == ("alice", 10 * M)
+
+
+def test_roster_limit_applies_across_the_round():
+    # alice has one slot left: she keeps her strongest bid and bob takes the other lot
+    bids = [bid("a", "alice", 40 * M), bid("b", "alice", 30 * M), bid("b", "bob", 10 * M)]
+    result = resolve(["a", "b"], bids, [manager("alice", clubs_won=["x", "y"]), manager("bob")])
+    assert result == {"a": ("alice", 1 * M), "b": ("bob", 1 * M)}
+
+
+def test_budget_reserve_applies_across_the_round():
+    # 20m budget, 3 slots: winning "a" at 18m leaves 2m, too little for an 18m bid on "b"
+    bids = [bid("a", "alice", 18 * M), bid("a", "bob", 18 * M, at=1), bid("b", "alice", 18 * M)]
+    result = resolve(["a", "b"], bids, [manager("alice", budget=20 * M), manager("bob")], pricing=FIRST_PRICE)
+    assert result["a"] == ("alice", 18 * M)
+    assert result["b"] == (None, None)
+
+
+def test_bids_from_non_participants_and_other_lots_are_ignored():
+    bids = [bid("a", "mallory", 90 * M), bid("z", "alice", 50 * M), bid("a", "alice", 5 * M)]
+    awards = resolve_sealed_round(["a"], bids, [manager("alice")], 3, 1 * M)
+    assert (awards[0].user_id, awards[0].bid_count) == ("alice", 1)
+
+
+def test_rounds_take_the_queue_before_reoffers():
+    assert next_round_clubs(["a", "b", "c", "d", "e"], [], 2) == ["a", "b"]
+    assert next_round_clubs(["e"], ["b"], 2) == ["e"]
+    assert next_round_clubs([], ["b", "d", "e"], 2) == ["b", "d"]
+    assert next_round_clubs([], [], 2) == []
+
+
+def test_award_records_round_trip():
+    awards = resolve_sealed_round(["a", "b"], [bid("a", "alice", 5 * M)], [manager("alice")], 3, 1 * M)
+    replayed = [award_from_record(award_record(award)) for award in awards]
+    assert replayed == awards
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the atomic lot settlement updates.
+"""
+
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.settlement import award_club_update, unsold_push_update
+
+
+def test_award_is_guarded_and_incremental():
+    query, update = award_club_update("league-1", "alice", "club-1", 5_000_000)
+
+    # Second settlement of the same lot matches nothing
+    assert query == {"leagueId": "league-1", "userId": "alice", "clubsWon": {"$ne": "club-1"}}
+    assert update["$push"] == {"clubsWon": "club-1"}
+    assert update["$inc"] == {"totalSpent": 5_000_000, "budgetRemaining": -5_000_000}
+    assert "$set" not in update
+
+
+def test_unsold_push_is_guarded_by_lot():
+    query, update = unsold_push_update("auction-1", "auction-1-lot-7", "club-2")
+
+    # Not by unsoldClubs membership - a re-offered club has already been popped from it
+    assert query == {"id": "auction-1", "unsoldLotKeys": {"$ne": "auction-1-lot-7:club-2"}}
+    assert update["$push"]["unsoldClubs"] == "club-2"
+    assert update["$push"]["unsoldLotKeys"]["$each"] == ["auction-1-lot-7:club-2"]
+    assert update["$push"]["unsoldLotKeys"]["$slice"] < 0  # Bounded
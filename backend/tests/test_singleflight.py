@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the per-auction settlement single-flight guard.
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.singleflight import SingleFlight
+
+
+def test_concurrent_calls_share_one_settlement():
+    async def run():
+        flight = SingleFlight()
+        calls = []
+
+        async def settle(auction_id):
+            calls.append(auction_id)
+            await asyncio.sleep(0.05)
+            return f"settled {auction_id}"
+
+        results = await asyncio.gather(
+            flight.run("a1", lambda: settle("a1")),
+            flight.run("a1", lambda: settle("a1")),
+            flight.run("a2", lambda: settle("a2")),
+        )
+        # Once finished, the next lot's settlement runs again
+        again = await flight.run("a1", lambda: settle("a1"))
+        return calls, results, again
+
+    calls, results, again = asyncio.run(run())
+    assert calls == ["a1", "a2", "a1"]
+    assert results == ["settled a1", "settled a1", "settled a2"]
+    assert again == "settled a1"
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the authenticated socket session index.
+"""
+
+import asyncio
+import json
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.sessions import EVENTS_CHANNEL, SocketSessionIndex
+
+
+class FakeSio:
+    def __init__(self):
+        self.sessions = {}
+
+    @asynccontextmanager
+    async def session(self, sid):
+        if sid not in self.sessions:
+            raise KeyError("Session is disconnected")
+        yield self.sessions[sid]
+
+
+class FakeRedis:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, channel, message):
+        self.published.append((channel, json.loads(message)))
+
+
+def connect(sio, index, sid, user_id, league_ids):
+    sio.sessions[sid] = {"userId": user_id, "leagueIds": sorted(league_ids)}
+    index.track(sid, user_id, league_ids)
+
+
+def test_join_league_reaches_every_socket_of_the_user():
+    sio = FakeSio()
+    index = SocketSessionIndex(sio, "r1")
+    connect(sio, index, "s1", "alice", ["l1"])
+    connect(sio, index, "s2", "alice", ["l1"])
+    connect(sio, index, "s3", "bob", ["l1"])
+
+    asyncio.run(index.league_joined("alice", "l2"))
+    assert sio.sessions["s1"]["leagueIds"] == ["l1", "l2"]
+    assert sio.sessions["s2"]["leagueIds"] == ["l1", "l2"]
+    assert sio.sessions["s3"]["leagueIds"] == ["l1"]
+
+
+def test_league_deletion_is_removed_from_member_sessions():
+    sio = FakeSio()
+    index = SocketSessionIndex(sio, "r1")
+    connect(sio, index, "s1", "alice", ["l1", "l2"])
+    connect(sio, index, "s2", "bob", ["l2"])
+
+    asyncio.run(index.league_deleted("l2"))
+    assert sio.sessions["s1"]["leagueIds"] == ["l1"]
+    assert sio.sessions["s2"]["leagueIds"] == []
+
+
+def test_disconnected_sockets_are_forgotten():
+    sio = FakeSio()
+    index = SocketSessionIndex(sio, "r1")
+    connect(sio, index, "s1", "alice", ["l1"])
+    connect(sio, index, "s2", "alice", ["l1"])
+    index.untrack("s1")
+    del sio.sessions["s2"]  # Gone before the index heard about it
+
+    asyncio.run(index.league_joined("alice", "l2"))
+    assert index.sids_for_user("alice") == set()
+    assert len(index) == 0
+
+
+def test_changes_are_published_for_other_replicas():
+    redis = FakeRedis()
+    sio_a, sio_b = FakeSio(), FakeSio()
+    replica_a = SocketSessionIndex(sio_a, "a", redis=redis)
+    replica_b = SocketSessionIndex(sio_b, "b")
+    connect(sio_b, replica_b, "s1", "alice", [])
+
+    async def run():
+        await replica_a.league_joined("alice", "l1")
+        channel, event = redis.published[0]
+        assert channel == EVENTS_CHANNEL and event["origin"] == "a"
+        await replica_b._apply(event)
+
+    asyncio.run(run())
+    assert sio_b.sessions["s1"]["leagueIds"] == ["l1"]
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the read-only spectator feed (coalesced, pre-serialized frames).
+"""
+
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction.spectators import SpectatorFeed, spectator_room
+
+
+class FakeAuctions:
+    """Auction docs with counters for how often the feed reads and builds"""
+
+    def __init__(self):
+        self.docs = {"a1": {"id": "a1", "bidSequence": 1, "participantsVersion": 0}}
+        self.probes = 0
+        self.builds = 0
+
+    async def probe(self, auction_id):
+        self.probes += 1
+        await asyncio.sleep(0)
+        auction = self.docs.get(auction_id)
+        if not auction:
+            return None
+        return (auction["bidSequence"], auction["participantsVersion"]), dict(auction)
+
+    async def build(self, auction, previous):
+        self.builds += 1
+        standings = previous["standings"] if previous and previous["pv"] == auction["participantsVersion"] else [self.builds]
+        return {"auctionId": auction["id"], "seq": auction["bidSequence"], "pv": auction["participantsVersion"],
+                "standings": standings}
+
+
+def make_feed(interval_seconds=60.0):
+    auctions = FakeAuctions()
+    return auctions, SpectatorFeed(auctions.probe, auctions.build, interval_seconds)
+
+
+def test_join_wave_shares_one_read_and_one_frame():
+    auctions, feed = make_feed()
+
+    async def run():
+        for i in range(500):
+            feed.watch(f"s{i}", "a1")
+        return await asyncio.gather(*(feed.frame("a1") for _ in range(500)))
+
+    frames = asyncio.run(run())
+    assert auctions.probes == 1
+    assert auctions.builds == 1
+    assert all(frame is frames[0] for frame in frames)
+    assert json.loads(frames[0]) == {"auctionId": "a1", "seq": 1, "pv": 0, "standings": [1]}
+
+
+def test_publish_sends_only_changed_versions():
+    auctions, feed = make_feed()
+    sent = []
+
+    async def emit(auction_id, frame):
+        sent.append((auction_id, json.loads(frame)["seq"]))
+
+    async def run():
+        feed.watch("s1", "a1")
+        await feed.publish(emit)
+        await feed.publish(emit)  # Unchanged - nothing sent, nothing rebuilt
+        auctions.docs["a1"]["bidSequence"] = 2
+        await feed.publish(emit)
+
+    asyncio.run(run())
+    assert sent == [("a1", 1), ("a1", 2)]
+    assert auctions.builds == 2
+    assert auctions.probes == 3
+
+
+def test_build_gets_the_previous_view_to_reuse_standings():
+    auctions, feed = make_feed()
+
+    async def run():
+        feed.watch("s1", "a1")
+        first = await feed.refresh("a1")
+        auctions.docs["a1"]["bidSequence"] = 2
+        second = await feed.refresh("a1")
+        auctions.docs["a1"]["participantsVersion"] = 1
+        third = await feed.refresh("a1")
+        return first.view["standings"], second.view["standings"], third.view["standings"]
+
+    assert asyncio.run(run()) == ([1], [1], [3])
+
+
+def test_unwatched_auctions_are_no_longer_read():
+    auctions, feed = make_feed()
+    sent = []
+
+    async def emit(auction_id, frame):
+        sent.append(auction_id)
+
+    async def run():
+        feed.watch("s1", "a1")
+        assert feed.watch("s1", "a2") == "a1"  # Switching auctions leaves the old one
+        auctions.docs["a2"] = {"id": "a2", "bidSequence": 5, "participantsVersion": 0}
+        await feed.publish(emit)
+        feed.unwatch("s1")
+        await feed.publish(emit)
+
+    asyncio.run(run())
+    assert sent == ["a2"]
+    assert feed.watcher_count("a1") == feed.watcher_count("a2") == 0
+    assert auctions.probes == 1
+
+
+def test_missing_auction_has_no_frame():
+    _, feed = make_feed()
+    feed.watch("s1", "gone")
+    assert asyncio.run(feed.frame("gone")) is None
+    assert spectator_room("a1") == "spectate:a1"
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Timer lease tests against a local Redis.
+Skipped when no Redis is reachable at REDIS_TEST_URL (default redis://localhost:6379/15).
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+import redis.asyncio as aioredis
+
+from auction.leases import TimerLeaseCoordinator
+from auction.timers import LotTimerScheduler
+
+REDIS_TEST_URL = os.environ.get("REDIS_TEST_URL", "redis://localhost:6379/15")
+
+
+async def connect_or_skip():
+    client = aioredis.from_url(REDIS_TEST_URL, decode_responses=True)
+    try:
+        await client.ping()
+    except Exception:
+        pytest.skip(f"No Redis at {REDIS_TEST_URL}")
+    await client.flushdb()
+    return client
+
+
+def make_replica(client, name, expired):
+    async def on_expire(timer):
+        expired.append((name, timer.auction_id))
+
+    scheduler = LotTimerScheduler(None, on_expire)
+    return TimerLeaseCoordinator(client, scheduler, name, lease_ttl=0.6)
+
+
+def test_single_owner_and_takeover():
+    async def run():
+        client = await connect_or_skip()
+        expired = []
+        a = make_replica(client, "replica-a", expired)
+        b = make_replica(client, "replica-b", expired)
+        await a.start()
+        await b.start()
+
+        ends_at = datetime.now(timezone.utc) + timedelta(seconds=2)
+        await a.schedule("auction-1", "auction-1-lot-1", ends_at)
+        # Scheduling the same auction from the other replica must not create a second timer
+        await b.schedule("auction-1", "auction-1-lot-1", ends_at)
+        await asyncio.sleep(0.1)
+        owners = ("auction-1" in a.scheduler, "auction-1" in b.scheduler)
+
+        # Replica A dies without releasing its lease
+        for task in a._tasks:
+            task.cancel()
+        await a.scheduler.stop()
+        a.scheduler.cancel("auction-1")
+        await asyncio.sleep(1.2)
+        taken_over = "auction-1" in b.scheduler
+
+        await asyncio.sleep(1.0)
+        await b.stop()
+        seqs = [await b.next_seq("auction-1-lot-1") for _ in range(3)]
+        await client.flushdb()
+        await client.aclose()
+        return owners, taken_over, expired, seqs
+
+    owners, taken_over, expired, seqs = asyncio.run(run())
+    assert owners == (True, False)
+    assert taken_over
+    assert expired == [("replica-b", "auction-1")]
+    assert seqs == [1, 2, 3]
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Socket.IO payload encodings.
+"""
+
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+# Add backend directory to path
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+from auction import wire
+from auction.wire import COMPACT_KEYS, JSON, MSGPACK, FastJson, compact, negotiate_encoding, wire_room
+
+BID_UPDATE = {
+    "lotId": "a1-lot-3",
+    "amount": 12_000_000.0,
+    "bidder": {"userId": "u1", "displayName": "Alice"},
+    "seq": 7,
+    "serverTime": "2026-05-01T12:00:00.250000+00:00",
+    "bid": {"id": "b1", "userId": "u1", "clubId": "c9", "amount": 12_000_000.0,
+            "timestamp": "2026-05-01T12:00:00.200000+00:00", "userName": "Alice"},
+}
+
+
+def test_fast_json_matches_stdlib_output():
+    payload = {"lotId": "a1-lot-3", "seq": 7, "nested": [1, 2.5, None, True], "name": "Müller"}
+    text = FastJson.dumps(payload, separators=(",", ":"))
+    assert json.loads(text) == payload
+    assert FastJson.loads(text) == payload
+
+
+def test_msgpack_is_only_negotiated_when_enabled_and_installed():
+    assert negotiate_encoding(None) == JSON
+    assert negotiate_encoding("xml") == JSON
+    assert negotiate_encoding(MSGPACK, binary_enabled=False) == JSON
+    expected = MSGPACK if wire.msgpack is not None else JSON
+    assert negotiate_encoding(MSGPACK) == expected
+
+
+def test_compact_shortens_keys_and_converts_timestamps():
+    frame = compact(BID_UPDATE)
+    assert frame["l"] == "a1-lot-3"
+    assert frame["b"] == {"u": "u1", "dn": "Alice"}
+    assert frame["t"] == 1777636800250
+    assert frame["bd"]["ts"] == 1777636800200
+    assert compact({"timestamp": datetime(2026, 5, 1, 12, tzinfo=timezone.utc)}) == {"ts": 1777636800000}
+
+
+def test_compact_keys_are_unambiguous():
+    shorts = list(COMPACT_KEYS.values())
+    assert len(shorts) == len(set(shorts))
+    assert not set(shorts) & set(COMPACT_KEYS)
+
+
+def test_non_timestamp_strings_are_untouched():
+    assert compact({"endsAt": "soon", "clubName": "2026-05-01"}) == {"e": "soon", "cn": "2026-05-01"}
+
+
+def test_binary_frame_round_trip_is_smaller_than_json():
+    pytest.importorskip("msgpack")
+    frame = wire.pack(BID_UPDATE)
+    decoded = wire.unpack(frame)
+    assert decoded["bidder"] == BID_UPDATE["bidder"]
+    assert decoded["serverTime"] == 1777636800250
+    assert len(frame) < len(FastJson.dumps(BID_UPDATE))
+
+
+def test_wire_rooms_split_by_encoding():
+    assert wire_room("auction:a1", JSON) == "auction:a1:json"
+    assert wire_room("auction:a1:ticks", MSGPACK) == "auction:a1:ticks:msgpack"
@@ -5,14 +5,16 @@ export function useAuctionClock(socket, lotId, auctionStatus) {
   const [endsAt, setEndsAt] = useState(null);
   const seqRef = useRef(0);
   const skewRef = useRef(0); // serverNow - clientNow
+  const syncedRef = useRef(false); // skew measured by round trip, don't overwrite from one-way events
   const rafRef = useRef(null);
 
   const apply = useCallback((t) => {
     if (!t || (lotId && t.lotId !== lotId)) return;
     if (t.seq < seqRef.current) return; // ignore stale
     seqRef.current = t.seq;
-    const clientNow = Date.now();
-    skewRef.current = t.serverNow - clientNow;
+    if (!syncedRef.current) {
+      skewRef.current = t.serverNow - Date.now();
+    }
     setEndsAt(t.endsAt);
   }, [lotId]);
 
@@ -22,6 +24,19 @@ export function useAuctionClock(socket, lotId, auctionStatus) {
     }
   }, [apply]);
 
+  // lot_started / auction_snapshot define the current lot, so they are taken even before
+  // the page has caught up with the new lotId (there is no following tick to catch up from)
+  const onLotTimer = useCallback((data) => {
+    const t = data && data.timer;
+    if (!t) return;
+    seqRef.current = t.seq;
+    if (!syncedRef.current) {
+      skewRef.current = t.serverNow - Date.now();
+    }
+    setEndsAt(t.endsAt);
+  }, []);
+
+  // Deadline-mode timer: the server only sends endsAt when it changes, plus a slow heartbeat
   const onTick = useCallback((t) => apply(t), [apply]);
   const onAnti = useCallback((t) => apply(t), [apply]);
   const onSold = useCallback(() => { 
@@ -32,25 +47,45 @@ export function useAuctionClock(socket, lotId, auctionStatus) {
 
   const onResumed = useCallback((data) => {
     // When auction resumes, immediately update endsAt with new timer
-    if (data.newEndTime) {
+    if (data.timer) {
+      apply(data.timer);
+    } else if (data.newEndTime) {
       const newEndsAt = new Date(data.newEndTime).getTime();
       setEndsAt(newEndsAt);
       seqRef.current++; // Increment to prevent old timer events from overriding
     }
-  }, []);
+  }, [apply]);
+
+  // Clock-offset handshake: offset = serverNow - midpoint of the round trip
+  useEffect(() => {
+    if (!socket) return;
+    const clientTime = Date.now();
+    socket.emit("clock_sync", { clientTime }, (ack) => {
+      if (!ack || ack.clientTime !== clientTime) return;
+      const receivedAt = Date.now();
+      skewRef.current = ack.serverNow - (clientTime + receivedAt) / 2;
+      syncedRef.current = true;
+    });
+  }, [socket]);
 
   useEffect(() => {
     if (socket) {
       // Remove existing listeners before adding new ones (prevent duplicates)
       socket.off("sync_state", onSync);
+      socket.off("auction_snapshot", onLotTimer);
+      socket.off("lot_started", onLotTimer);
       socket.off("tick", onTick);
+      socket.off("timer_heartbeat", onTick);
       socket.off("anti_snipe", onAnti);
       socket.off("sold", onSold);
       socket.off("auction_resumed", onResumed);
 
       // Add listeners
       socket.on("sync_state", onSync);
+      socket.on("auction_snapshot", onLotTimer);
+      socket.on("lot_started", onLotTimer);
       socket.on("tick", onTick);
+      socket.on("timer_heartbeat", onTick);
       socket.on("anti_snipe", onAnti);
       socket.on("sold", onSold);
       socket.on("auction_resumed", onResumed);
@@ -74,7 +109,10 @@ export function useAuctionClock(socket, lotId, auctionStatus) {
 
       return () => {
         socket.off("sync_state", onSync);
+        socket.off("auction_snapshot", onLotTimer);
+        socket.off("lot_started", onLotTimer);
         socket.off("tick", onTick);
+        socket.off("timer_heartbeat", onTick);
         socket.off("anti_snipe", onAnti);
         socket.off("sold", onSold);
         socket.off("auction_resumed", onResumed);
@@ -86,7 +124,7 @@ export function useAuctionClock(socket, lotId, auctionStatus) {
         if (rafRef.current) cancelAnimationFrame(rafRef.current);
       };
     }
-  }, [socket, lotId, endsAt, auctionStatus, onSync, onTick, onAnti, onSold, onResumed]);
+  }, [socket, lotId, endsAt, auctionStatus, onSync, onLotTimer, onTick, onAnti, onSold, onResumed]);
 
   return { remainingMs };
 }
\ No newline at end of file
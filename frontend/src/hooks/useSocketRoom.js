@@ -1,5 +1,5 @@
 import { useEffect, useState, useRef } from 'react';
-import { getSocket, setSocketUser } from '../utils/socket';
+import { getSocket, setSocketUser, getAuctionResume, forgetAuctionStream, AUCTION_PROTOCOL } from '../utils/socket';
 
 // Track active listeners globally for debugging
 const activeListeners = new Map();
@@ -49,14 +49,36 @@ export function useSocketRoom(roomType, roomId, options = {}) {
     console.log(`📊 [useSocketRoom] Active listeners for ${roomKey}: ${activeCount}`);
     listenerCountRef.current = activeCount;
 
+    // Fresh mount always starts from a full snapshot; reconnects resume the stream
+    if (roomType === 'auction') {
+      forgetAuctionStream(roomId);
+    }
+
     // Join room
     const joinRoom = () => {
       if (roomType === 'league') {
         socket.emit('join_league', { leagueId: roomId });
       } else if (roomType === 'auction') {
-        socket.emit('join_auction', { auctionId: roomId });
-        // Request sync_state for auctions
-        socket.emit('sync_state', { auctionId: roomId });
+        const resume = getAuctionResume(roomId);
+        socket.emit('join_auction', { auctionId: roomId, timerMode: 'deadline', protocol: AUCTION_PROTOCOL, resume }, (ack) => {
+          // Missed events were replayed - no snapshot is coming
+          if (ack && ack.resumed) {
+            console.log(`⏩ [useSocketRoom] Resumed ${roomKey} from seq ${resume.streamSeq}`);
+            markReady();
+          }
+        });
+        if (!resume) {
+          // Request sync_state for auctions
+          socket.emit('sync_state', { auctionId: roomId });
+        }
+      }
+    };
+
+    const markReady = () => {
+      setReady(true);
+      if (readyResolveRef.current) {
+        readyResolveRef.current();
+        readyResolveRef.current = null; // Only resolve once
       }
     };
 
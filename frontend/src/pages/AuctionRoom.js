@@ -7,6 +7,8 @@ import { useSocketRoom } from "../hooks/useSocketRoom";
 import { formatCurrency, parseCurrencyInput, isValidCurrencyInput } from "../utils/currency";
 import { debounceSocketEvent } from "../utils/performance";
 import { debugLogger } from "../utils/debugLogger";
+import { applyParticipantDelta } from "../utils/participants";
+import { AUCTION_PROTOCOL, prependBid, submitBid } from "../utils/socket";
 import TeamCrest from "../components/TeamCrest";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
@@ -40,6 +42,7 @@ function AuctionRoom() {
   const [selectedClubForLot, setSelectedClubForLot] = useState(null);
   const [league, setLeague] = useState(null);
   const [participants, setParticipants] = useState([]);
+  const participantsVersionRef = useRef(null); // Last participantsVersion applied (sold / auction_complete deltas)
   const [participantCount, setParticipantCount] = useState(0); // Prompt A: Server-authoritative count
   const [currentLotId, setCurrentLotId] = useState(null);
   const [sport, setSport] = useState(null);
@@ -103,7 +106,7 @@ function AuctionRoom() {
     console.log(`🎧 [AuctionRoom] Setting up socket listeners (Count: ${listenerCount})`);
     
     // Prompt D: Join auction room on connect
-    socket.emit('join_auction', { auctionId, userId: user.id }, (ack) => {
+    socket.emit('join_auction', { auctionId, userId: user.id, timerMode: 'deadline', protocol: AUCTION_PROTOCOL }, (ack) => {
       if (ack && ack.ok) {
         console.log(`✅ Joined auction room: ${ack.room}, size: ${ack.roomSize}`);
       }
@@ -121,6 +124,7 @@ function AuctionRoom() {
       if (data.currentBidder) setCurrentBidder(data.currentBidder);
       if (data.seq !== undefined) setBidSequence(data.seq);
       if (data.participants) setParticipants(data.participants);
+      if (data.participantsVersion !== undefined) participantsVersionRef.current = data.participantsVersion;
       if (data.currentBids) setBids(data.currentBids);
       if (data.timer && data.timer.lotId) setCurrentLotId(data.timer.lotId);
       
@@ -166,7 +170,7 @@ function AuctionRoom() {
         receiveTime: new Date().toISOString(),
         latencyMs: data.serverTime ? (Date.now() - new Date(data.serverTime).getTime()) : 'N/A'
       });
-      setBids((prev) => [data.bid, ...prev]);
+      setBids((prev) => prependBid(prev, data.bid));
       // Note: Full reload removed for performance - bid_update handles UI state
     };
 
@@ -191,6 +195,9 @@ function AuctionRoom() {
         loadAuction();
       }
       
+      // Protocol 2: the bid history entry rides on bid_update
+      if (data.bid) setBids((prev) => prependBid(prev, data.bid));
+      
       // Only accept bid updates with seq >= current seq (prevents stale updates)
       if (data.seq >= bidSequence) {
         console.log(`✅ Applying bid update: ${formatCurrency(data.amount)} by ${data.bidder?.displayName} (seq: ${data.seq}, latency: ${serverLatency}ms)`);
@@ -271,9 +278,7 @@ function AuctionRoom() {
       setBidAmount("");
       setCurrentBid(null);
       setCurrentBidder(null);
-      if (data.participants) {
-        setParticipants(data.participants);
-      }
+      applyParticipantDelta(socket, auctionId, data, participantsVersionRef, setParticipants);
       loadAuction();
       // REMOVED: loadClubs() - we trust the sold event data instead of reloading
     };
@@ -293,9 +298,7 @@ function AuctionRoom() {
       console.log("Final winning bid:", data.finalWinningBid);
       
       // Update participants with final state
-      if (data.participants) {
-        setParticipants(data.participants);
-      }
+      applyParticipantDelta(socket, auctionId, data, participantsVersionRef, setParticipants);
       
       // CRITICAL FIX: Update final club status immediately and DON'T reload clubs
       // Reloading causes race condition - trust the event data
@@ -394,11 +397,17 @@ function AuctionRoom() {
     };
     socket.on('connect', onReconnect);
     
-    // Handle waiting room updates
+    // Handle waiting room updates - the server only sends who joined/left since the last update
     const onWaitingRoomUpdated = (data) => {
       debugLogger.logSocketEvent('waiting_room_updated', data);
-      console.log('🚪 Waiting room updated:', data.usersInWaitingRoom);
-      setAuction(prev => ({ ...prev, usersInWaitingRoom: data.usersInWaitingRoom }));
+      console.log('🚪 Waiting room updated:', { joined: data.joined, left: data.left });
+      setAuction(prev => {
+        if (!prev) return prev;
+        const left = new Set(data.left || []);
+        const users = (prev.usersInWaitingRoom || []).filter(id => !left.has(id));
+        (data.joined || []).forEach(id => { if (!users.includes(id)) users.push(id); });
+        return { ...prev, usersInWaitingRoom: users };
+      });
     };
     socket.on('waiting_room_updated', onWaitingRoomUpdated);
     
@@ -647,7 +656,8 @@ function AuctionRoom() {
       console.log("📤 bid:sent", { auctionId, clubId: currentClub.id, amount });
       debugLogger.log('bid:sent', { clubId: currentClub.id, amount });
       
-      const response = await axios.post(`${API}/auction/${auctionId}/bid`, {
+      // Socket ack (HTTP fallback when disconnected) - same validation as the REST endpoint
+      const response = await submitBid(auctionId, {
         userId: user.id,
         clubId: currentClub.id,
         amount,
@@ -1196,7 +1206,6 @@ function AuctionRoom() {
   // Get clubs in auction queue for the horizontal scroll
   // IMPORTANT: Shuffle the display order so users can't determine auction sequence
   // The shuffle is seeded by auction ID so it's consistent during the session but random per auction
-  const auctionQueue = auction?.clubQueue || [];
   
   // Seeded shuffle function - consistent within session but hides real order
   const seededShuffle = (arr) => {
@@ -1210,7 +1219,8 @@ function AuctionRoom() {
     return shuffled;
   };
   
-  const clubsInQueue = auctionQueue.map(id => clubs.find(c => c.id === id)).filter(Boolean);
+  // /auction/:id/clubs only lists the clubs in this auction's queue
+  const clubsInQueue = clubs;
   const queueClubs = seededShuffle(clubsInQueue).slice(0, 8);
 
   // Shuffled clubs list for "View All" modal - hides auction order
@@ -1336,7 +1346,7 @@ function AuctionRoom() {
                 const isCurrent = club.id === currentClub?.id;
                 const isSold = club.winner && club.winner !== 'unsold';
                 const isUnsold = club.winner === 'unsold';
-                const inQueue = auction?.clubQueue?.includes(club.id);
+                const inQueue = club.lotNumber != null;
                 
                 return (
                   <div 
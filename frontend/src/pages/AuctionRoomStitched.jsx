@@ -7,6 +7,8 @@ import { useSocketRoom } from "../hooks/useSocketRoom";
 import { formatCurrency, parseCurrencyInput, isValidCurrencyInput } from "../utils/currency";
 import { debounceSocketEvent } from "../utils/performance";
 import { debugLogger } from "../utils/debugLogger";
+import { applyParticipantDelta } from "../utils/participants";
+import { AUCTION_PROTOCOL, prependBid, submitBid } from "../utils/socket";
 import BottomNav from "../components/BottomNav";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
@@ -56,6 +58,7 @@ function AuctionRoomStitched() {
   const [selectedClubForLot, setSelectedClubForLot] = useState(null);
   const [league, setLeague] = useState(null);
   const [participants, setParticipants] = useState([]);
+  const participantsVersionRef = useRef(null); // Last participantsVersion applied (sold / auction_complete deltas)
   const [participantCount, setParticipantCount] = useState(0);
   const [currentLotId, setCurrentLotId] = useState(null);
   const [sport, setSport] = useState(null);
@@ -117,7 +120,7 @@ function AuctionRoomStitched() {
     console.log(`🎧 [AuctionRoom] Setting up socket listeners (Count: ${listenerCount})`);
     
     // Join auction room on connect
-    socket.emit('join_auction', { auctionId, userId: user.id }, (ack) => {
+    socket.emit('join_auction', { auctionId, userId: user.id, timerMode: 'deadline', protocol: AUCTION_PROTOCOL }, (ack) => {
       if (ack && ack.ok) {
         console.log(`✅ Joined auction room: ${ack.room}, size: ${ack.roomSize}`);
       }
@@ -134,6 +137,7 @@ function AuctionRoomStitched() {
       if (data.currentBidder) setCurrentBidder(data.currentBidder);
       if (data.seq !== undefined) setBidSequence(data.seq);
       if (data.participants) setParticipants(data.participants);
+      if (data.participantsVersion !== undefined) participantsVersionRef.current = data.participantsVersion;
       if (data.currentBids) setBids(data.currentBids);
       if (data.timer && data.timer.lotId) setCurrentLotId(data.timer.lotId);
       
@@ -163,7 +167,7 @@ function AuctionRoomStitched() {
         receiveTime: new Date().toISOString(),
         latencyMs: data.serverTime ? (Date.now() - new Date(data.serverTime).getTime()) : 'N/A'
       });
-      setBids((prev) => [data.bid, ...prev]);
+      setBids((prev) => prependBid(prev, data.bid));
     };
 
     // Handle bid_update
@@ -186,6 +190,9 @@ function AuctionRoomStitched() {
         loadAuction();
       }
       
+      // Protocol 2: the bid history entry rides on bid_update
+      if (data.bid) setBids((prev) => prependBid(prev, data.bid));
+      
       if (data.seq >= bidSequence) {
         console.log(`✅ Applying bid update: ${formatCurrency(data.amount)} by ${data.bidder?.displayName} (seq: ${data.seq}, latency: ${serverLatency}ms)`);
         setCurrentBid(data.amount);
@@ -253,7 +260,7 @@ function AuctionRoomStitched() {
       setBidAmount("");
       setCurrentBid(null);
       setCurrentBidder(null);
-      if (data.participants) setParticipants(data.participants);
+      applyParticipantDelta(socket, auctionId, data, participantsVersionRef, setParticipants);
       loadAuction();
     };
 
@@ -269,7 +276,7 @@ function AuctionRoomStitched() {
       debugLogger.logSocketEvent('auction_complete', data);
       console.log("Auction complete:", data);
       
-      if (data.participants) setParticipants(data.participants);
+      applyParticipantDelta(socket, auctionId, data, participantsVersionRef, setParticipants);
       
       if (data.finalClubId && data.finalWinningBid) {
         console.log("✅ Updating final club status to 'sold' (no reload)");
@@ -355,11 +362,17 @@ function AuctionRoomStitched() {
     };
     socket.on('connect', onReconnect);
     
-    // Handle waiting room updates
+    // Handle waiting room updates - the server only sends who joined/left since the last update
     const onWaitingRoomUpdated = (data) => {
       debugLogger.logSocketEvent('waiting_room_updated', data);
-      console.log('🚪 Waiting room updated:', data.usersInWaitingRoom);
-      setAuction(prev => ({ ...prev, usersInWaitingRoom: data.usersInWaitingRoom }));
+      console.log('🚪 Waiting room updated:', { joined: data.joined, left: data.left });
+      setAuction(prev => {
+        if (!prev) return prev;
+        const left = new Set(data.left || []);
+        const users = (prev.usersInWaitingRoom || []).filter(id => !left.has(id));
+        (data.joined || []).forEach(id => { if (!users.includes(id)) users.push(id); });
+        return { ...prev, usersInWaitingRoom: users };
+      });
     };
     socket.on('waiting_room_updated', onWaitingRoomUpdated);
     
@@ -582,12 +595,13 @@ function AuctionRoomStitched() {
       console.log("📤 bid:sent", { auctionId, clubId: currentClub.id, amount });
       debugLogger.log('bid:sent', { clubId: currentClub.id, amount });
       
-      const response = await axios.post(`${API}/auction/${auctionId}/bid`, {
+      // Socket ack (HTTP fallback when disconnected) - same validation as the REST endpoint
+      const response = await submitBid(auctionId, {
         userId: user.id,
         clubId: currentClub.id,
         amount,
       }, {
-        timeout: 10000
+        timeout: 10000 // 10 second timeout
       });
       
       const duration = performance.now() - startTime;
@@ -965,7 +979,7 @@ function AuctionRoomStitched() {
               {league?.name || 'Auction'}
             </h1>
             <p className="text-[10px]" style={{ color: 'var(--text-muted, rgba(255,255,255,0.4))' }}>
-              Lot {auction?.currentLot || 0} / {auction?.clubQueue?.length || 0}
+              Lot {auction?.currentLot || 0} / {auction?.queueLength ?? auction?.clubQueue?.length ?? 0}
             </p>
           </div>
           {auction?.status === "paused" && (
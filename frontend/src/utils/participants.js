@@ -0,0 +1,47 @@
+/**
+ * Participant deltas for auction events
+ * sold / auction_complete carry only the participant records that changed plus a
+ * participantsVersion; a version gap triggers one full fetch over the socket.
+ */
+
+/**
+ * Merge changed participant records into the current list (matched by userId)
+ * @param {Array} participants - Current participant list
+ * @param {Array} updates - Changed records (may omit fields such as userEmail)
+ * @returns {Array} - New participant list
+ */
+export const mergeParticipantUpdates = (participants, updates) => {
+  if (!updates || updates.length === 0) return participants;
+  const byUser = new Map(updates.map(update => [update.userId, update]));
+  const merged = participants.map(p => (byUser.has(p.userId) ? { ...p, ...byUser.get(p.userId) } : p));
+  updates.forEach(update => {
+    if (!participants.some(p => p.userId === update.userId)) merged.push(update);
+  });
+  return merged;
+};
+
+/**
+ * Apply the participant delta carried by an auction event
+ * @param {object} socket - Socket.IO client
+ * @param {string} auctionId - Auction the event belongs to
+ * @param {object} data - Event payload with participantUpdates / participantsVersion
+ * @param {object} versionRef - Ref holding the last applied participantsVersion (null if unknown)
+ * @param {function} setParticipants - State setter for the participant list
+ */
+export const applyParticipantDelta = (socket, auctionId, data, versionRef, setParticipants) => {
+  if (!Array.isArray(data.participantUpdates) || typeof data.participantsVersion !== "number") return;
+
+  const known = versionRef.current;
+  if (known !== null && data.participantsVersion - known > data.participantUpdates.length) {
+    // Missed an update - fetch the full participant state once
+    socket.emit("fetch_participants", { auctionId }, (ack) => {
+      if (!ack || !ack.ok) return;
+      versionRef.current = ack.participantsVersion;
+      setParticipants(prev => mergeParticipantUpdates(prev, ack.participants));
+    });
+    return;
+  }
+
+  versionRef.current = Math.max(known || 0, data.participantsVersion);
+  setParticipants(prev => mergeParticipantUpdates(prev, data.participantUpdates));
+};
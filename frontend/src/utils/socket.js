@@ -4,16 +4,33 @@
  * Maintains one persistent connection with automatic reconnection and error handling
  */
 import io from "socket.io-client";
+import axios from "axios";
 import toast from "react-hot-toast";
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL || "";
 
+// Auction socket protocol: 2 = bid_update carries the bid (no separate bid_placed)
+export const AUCTION_PROTOCOL = 2;
+
 // Single global socket instance
 let socket = null;
 let currentUser = null;
 let currentRooms = new Set(); // Track joined rooms for reconnection
 let reconnectToastId = null;
 let isManualDisconnect = false;
+// Last replayable auction event seen, per auction: { streamId, streamSeq }
+const auctionStreams = new Map();
+
+/**
+ * Remember the newest stream position carried by an auction event or snapshot
+ */
+const trackAuctionStream = (payload) => {
+  if (!payload || !payload.auctionId || !payload.streamId || typeof payload.streamSeq !== "number") return;
+  const last = auctionStreams.get(payload.auctionId);
+  if (!last || last.streamId !== payload.streamId || payload.streamSeq > last.streamSeq) {
+    auctionStreams.set(payload.auctionId, { streamId: payload.streamId, streamSeq: payload.streamSeq });
+  }
+};
 
 /**
  * Get or create the global socket instance with enhanced reconnection
@@ -25,6 +42,8 @@ export const getSocket = () => {
       transports: ["websocket"], // WebSocket-only for Railway (no sticky sessions)
       upgrade: false, // Don't attempt transport upgrade
       withCredentials: true,
+      // Read on every (re)connect so a refreshed token is used; the server verifies it once per connection
+      auth: (cb) => cb({ token: localStorage.getItem("accessToken") || undefined }),
       reconnection: true,
       reconnectionAttempts: 10,
       reconnectionDelay: 500,
@@ -56,12 +75,15 @@ export const getSocket = () => {
             socket.emit("join_league", { leagueId });
           } else if (room.startsWith("auction_")) {
             const auctionId = room.replace("auction_", "");
-            socket.emit("join_auction", { auctionId });
+            socket.emit("join_auction", { auctionId, timerMode: "deadline", protocol: AUCTION_PROTOCOL, resume: getAuctionResume(auctionId) });
           }
         });
       }
     });
 
+    // Track stream positions so reconnects replay only missed events
+    socket.onAny((event, payload) => trackAuctionStream(payload));
+
     // Connection error
     socket.on("connect_error", (error) => {
       console.error("❌ Socket connection error:", error.message);
@@ -149,6 +171,7 @@ export const setSocketUser = (user) => {
 export const clearSocketUser = () => {
   currentUser = null;
   currentRooms.clear();
+  auctionStreams.clear();
   isManualDisconnect = true;
   console.log("👤 Socket user cleared");
 };
@@ -179,10 +202,71 @@ export const leaveLeagueRoom = (leagueId) => {
 export const joinAuctionRoom = (auctionId) => {
   const socket = getSocket();
   console.log("🟧 Joining auction room:", auctionId);
-  socket.emit("join_auction", { auctionId });
+  socket.emit("join_auction", { auctionId, timerMode: "deadline", protocol: AUCTION_PROTOCOL });
   currentRooms.add(`auction_${auctionId}`);
 };
 
+/**
+ * Submit a bid over the auction socket (place_bid with ack), falling back to
+ * POST /auction/{id}/bid when the socket is down. Resolves/rejects with the same
+ * shapes as axios ({ data } / error.response.{status, data.detail}) so callers
+ * keep one error path. Each bid carries a clientBidId, so a retry after a lost
+ * ack is answered with the original result instead of bidding twice.
+ */
+const newClientBidId = () =>
+  (window.crypto?.randomUUID?.() || `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}`);
+
+const postBid = (auctionId, bid, timeout) =>
+  axios.post(`${BACKEND_URL}/api/auction/${auctionId}/bid`, bid, {
+    timeout,
+    headers: { "Idempotency-Key": bid.clientBidId },
+  });
+
+export const submitBid = (auctionId, bid, { timeout = 10000 } = {}) => {
+  const socket = getSocket();
+  const keyedBid = { clientBidId: newClientBidId(), ...bid };
+  if (!socket.connected) {
+    return postBid(auctionId, keyedBid, timeout);
+  }
+  return new Promise((resolve, reject) => {
+    socket.timeout(timeout).emit("place_bid", { auctionId, ...keyedBid }, (err, ack) => {
+      if (err) {
+        // No ack in time - safe to retry over HTTP, the same clientBidId can't bid twice
+        postBid(auctionId, keyedBid, timeout).then(resolve, reject);
+      } else if (ack && ack.ok) {
+        resolve({ data: ack });
+      } else {
+        const error = new Error(ack?.detail || "Bid rejected");
+        error.response = { status: ack?.status || 500, data: { detail: ack?.detail }, headers: {} };
+        reject(error);
+      }
+    });
+  });
+};
+
+/**
+ * Add a bid to a newest-first bid history unless it is already there
+ * (bid_update and replayed events can deliver the same bid twice)
+ */
+export const prependBid = (bids, bid) => {
+  if (!bid || bids.some(b => b.id === bid.id)) return bids;
+  return [bid, ...bids];
+};
+
+/**
+ * Last stream position seen for an auction (send as `resume` when rejoining)
+ */
+export const getAuctionResume = (auctionId) => {
+  return auctionStreams.get(auctionId) || null;
+};
+
+/**
+ * Forget an auction's stream position so the next join gets a full snapshot
+ */
+export const forgetAuctionStream = (auctionId) => {
+  auctionStreams.delete(auctionId);
+};
+
 /**
  * Leave an auction room
  */
@@ -191,6 +275,7 @@ export const leaveAuctionRoom = (auctionId) => {
   console.log("🟧 Leaving auction room:", auctionId);
   // Note: No leave event needed, socket will disconnect or join other rooms
   currentRooms.delete(`auction_${auctionId}`);
+  forgetAuctionStream(auctionId);
 };
 
 /**
@@ -209,6 +294,27 @@ export const disconnectSocket = () => {
     socket.disconnect();
     socket = null;
     currentRooms.clear();
+    auctionStreams.clear();
     console.log("🔌 Socket manually disconnected");
   }
 };
+
+/**
+ * Watch an auction read-only on the /spectate namespace (no bidding, no ticks).
+ * onFrame gets the coalesced spectator view whenever the auction changes.
+ * Returns a function that stops watching.
+ */
+export const watchAuction = (auctionId, onFrame) => {
+  const spectator = io(`${BACKEND_URL}/spectate`, {
+    path: "/api/socket.io",
+    transports: ["websocket"],
+    upgrade: false,
+    reconnection: true,
+    reconnectionDelayMax: 5000,
+  });
+  const decoder = new TextDecoder();
+  spectator.on("spectator_frame", (frame) => onFrame(JSON.parse(decoder.decode(frame))));
+  // (Re)subscribe on every connect; the first frame arrives right after the ack
+  spectator.on("connect", () => spectator.emit("watch_auction", { auctionId }));
+  return () => spectator.disconnect();
+};
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Catalog Scaling Benchmark
+Checks that per-lot latency stays flat as the auction catalog grows.
+
+For each catalog size a synthetic sport is seeded straight into Mongo, a league
+with two managers is created through the API and its auction is started; then
+for the first few lots one bid is placed and the lot is completed, timing the
+bid, complete-lot and GET /auction calls. Every size should report roughly the
+same medians. Seeded assets, users and leagues are removed afterwards.
+
+Usage:
+    BASE_URL=http://localhost:8001/api MONGO_URL=mongodb://localhost:27017 DB_NAME=test_database \\
+        python load_tests/catalog_scaling_benchmark.py
+"""
+
+import asyncio
+import os
+import statistics
+import time
+import uuid
+
+import aiohttp
+from motor.motor_asyncio import AsyncIOMotorClient
+
+# Configuration
+BASE_URL = os.environ.get("BASE_URL", "http://localhost:8001/api")
+MONGO_URL = os.environ.get("MONGO_URL", "mongodb://localhost:27017")
+DB_NAME = os.environ.get("DB_NAME", "test_database")
+CATALOG_SIZES = [int(size) for size in os.environ.get("CATALOG_SIZES", "100,500,1000,2000").split(",")]
+LOTS_PER_SIZE = int(os.environ.get("LOTS_PER_SIZE", "5"))
+NEXT_LOT_WAIT_SECONDS = 3.5  # Server pauses 3s between lots
+BENCH_SPORT = "catalog-bench"
+
+
+class CatalogScalingBenchmark:
+    def __init__(self):
+        self.db = AsyncIOMotorClient(MONGO_URL)[DB_NAME]
+        self.run_id = uuid.uuid4().hex[:8]
+        self.league_ids = []
+        self.user_ids = []
+
+    async def timed(self, session, method, path, **kwargs):
+        start = time.perf_counter()
+        async with session.request(method, f"{BASE_URL}{path}", **kwargs) as resp:
+            body = await resp.json(content_type=None)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if resp.status >= 400:
+                raise RuntimeError(f"{method} {path} -> {resp.status}: {body}")
+            return body, elapsed_ms
+
+    async def seed_assets(self, size):
+        await self.db.assets.delete_many({"sportKey": BENCH_SPORT})
+        await self.db.assets.insert_many([
+            {"id": f"bench-{self.run_id}-{i}", "sportKey": BENCH_SPORT, "name": f"Bench Player {i:05d}",
+             "meta": {"team": f"Team {i % 10}"}}
+            for i in range(size)
+        ])
+
+    async def create_user(self, session, label):
+        user, _ = await self.timed(session, "POST", "/users", json={
+            "name": f"Bench {label}", "email": f"bench-{self.run_id}-{label}@example.com"
+        })
+        self.user_ids.append(user["id"])
+        return user["id"]
+
+    async def start_auction(self, session, size, commissioner_id, manager_id):
+        league, _ = await self.timed(session, "POST", "/leagues", json={
+            "name": f"Catalog Bench {size} {self.run_id}",
+            "commissionerId": commissioner_id,
+            "sportKey": BENCH_SPORT,
+            "competitionCode": None,
+            "budget": 10_000_000_000,
+            "clubSlots": size,
+            "minManagers": 2,
+            "maxManagers": 8,
+            "timerSeconds": 300,  # Lots are completed explicitly, never by the timer
+        })
+        self.league_ids.append(league["id"])
+        for user_id in (commissioner_id, manager_id):
+            await self.timed(session, "POST", f"/leagues/{league['id']}/join",
+                             json={"userId": user_id, "inviteToken": league["inviteToken"]})
+
+        started, _ = await self.timed(session, "POST", f"/leagues/{league['id']}/auction/start")
+        auction_id = started["auctionId"]
+        if started.get("status") == "waiting":
+            await self.timed(session, "POST", f"/auction/{auction_id}/begin",
+                             headers={"X-User-ID": commissioner_id})
+        return auction_id
+
+    async def run_size(self, session, size):
+        await self.seed_assets(size)
+        commissioner_id = await self.create_user(session, f"{size}-commissioner")
+        manager_id = await self.create_user(session, f"{size}-manager")
+        auction_id = await self.start_auction(session, size, commissioner_id, manager_id)
+
+        timings = {"bid": [], "complete_lot": [], "get_auction": []}
+        for lot in range(LOTS_PER_SIZE):
+            _, bid_ms = await self.timed(session, "POST", f"/auction/{auction_id}/bid",
+                                         json={"userId": manager_id, "amount": 1_000_000 + lot})
+            _, complete_ms = await self.timed(session, "POST", f"/auction/{auction_id}/complete-lot")
+            _, get_ms = await self.timed(session, "GET", f"/auction/{auction_id}")
+            timings["bid"].append(bid_ms)
+            timings["complete_lot"].append(complete_ms)
+            timings["get_auction"].append(get_ms)
+            await asyncio.sleep(NEXT_LOT_WAIT_SECONDS)
+        return {name: statistics.median(values) for name, values in timings.items()}
+
+    async def cleanup(self):
+        auctions = await self.db.auctions.find({"leagueId": {"$in": self.league_ids}}, {"_id": 0, "id": 1}).to_list(None)
+        auction_ids = [auction["id"] for auction in auctions]
+        await self.db.bids.delete_many({"auctionId": {"$in": auction_ids}})
+        await self.db.auction_lots.delete_many({"auctionId": {"$in": auction_ids}})
+        await self.db.auctions.delete_many({"id": {"$in": auction_ids}})
+        await self.db.league_participants.delete_many({"leagueId": {"$in": self.league_ids}})
+        await self.db.leagues.delete_many({"id": {"$in": self.league_ids}})
+        await self.db.users.delete_many({"id": {"$in": self.user_ids}})
+        await self.db.assets.delete_many({"sportKey": BENCH_SPORT})
+
+    async def run(self):
+        results = {}
+        try:
+            async with aiohttp.ClientSession() as session:
+                for size in CATALOG_SIZES:
+                    print(f"⏱️  Catalog of {size} lots...")
+                    results[size] = await self.run_size(session, size)
+        finally:
+            await self.cleanup()
+
+        print(f"\n{'lots':>6} | {'bid ms':>8} | {'complete-lot ms':>15} | {'GET auction ms':>14}")
+        for size, medians in results.items():
+            print(f"{size:>6} | {medians['bid']:>8.1f} | {medians['complete_lot']:>15.1f} | {medians['get_auction']:>14.1f}")
+
+        smallest, largest = results[CATALOG_SIZES[0]], results[CATALOG_SIZES[-1]]
+        growth = largest["complete_lot"] / smallest["complete_lot"] if smallest["complete_lot"] else 0
+        print(f"\ncomplete-lot median at {CATALOG_SIZES[-1]} lots is {growth:.2f}x the {CATALOG_SIZES[0]}-lot median")
+
+
+if __name__ == "__main__":
+    asyncio.run(CatalogScalingBenchmark().run())
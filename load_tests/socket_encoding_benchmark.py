@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Socket Encoding Benchmark
+Compares encode CPU time and bytes on the wire for auction stream events under
+the three Socket.IO encodings: stdlib json (the old default), FastJson (orjson)
+and the compact MessagePack frames sent to clients that negotiate binary mode.
+
+A broadcast is encoded once per encoding and the same frame is written to every
+socket in the room, so the CPU column is per broadcast and the wire column is
+frame size x ROOM_SIZE. Runs offline - no server or database needed.
+
+Usage:
+    ROOM_SIZE=500 ITERATIONS=20000 python load_tests/socket_encoding_benchmark.py
+"""
+
+import json
+import os
+import sys
+import time
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+from auction import wire  # noqa: E402
+
+# Configuration
+ROOM_SIZE = int(os.environ.get("ROOM_SIZE", "500"))
+ITERATIONS = int(os.environ.get("ITERATIONS", "20000"))
+PARTICIPANTS = int(os.environ.get("PARTICIPANTS", "12"))
+
+
+def sample_events():
+    now = datetime.now(timezone.utc)
+    now_ms = int(now.timestamp() * 1000)
+    stream = {"auctionId": str(uuid.uuid4()), "streamId": uuid.uuid4().hex, "streamSeq": 412}
+    lot_id = f"{stream['auctionId']}-lot-37"
+    timer = {"lotId": lot_id, "seq": 88, "endsAt": now_ms + 27_500, "serverNow": now_ms}
+    bid = {
+        "id": str(uuid.uuid4()), "auctionId": stream["auctionId"], "userId": str(uuid.uuid4()),
+        "clubId": str(uuid.uuid4()), "amount": 23_500_000.0, "timestamp": now.isoformat(),
+        "userName": "Alice Example",
+    }
+    participants = [
+        {"userId": str(uuid.uuid4()), "userName": f"Manager {i}", "budgetRemaining": 180_000_000.0 - i,
+         "totalSpent": 20_000_000.0 + i, "clubsWon": [str(uuid.uuid4()) for _ in range(i % 5)]}
+        for i in range(PARTICIPANTS)
+    ]
+    return {
+        "tick": timer,
+        "bid_update": {
+            "lotId": lot_id, "amount": bid["amount"], "seq": 19, "serverTime": now.isoformat(), "bid": bid,
+            "bidder": {"userId": bid["userId"], "displayName": bid["userName"]}, **stream,
+        },
+        "sold": {
+            "clubId": bid["clubId"], "clubName": "Example United", "winningBid": bid, "unsold": False,
+            "participantUpdates": participants[:2], "participantsVersion": 31, "timer": timer, **stream,
+        },
+        "auction_snapshot": {
+            "status": "active", "currentLot": 37, "currentClubId": bid["clubId"],
+            "currentClub": {"id": bid["clubId"], "name": "Example United", "meta": {"country": "England"}},
+            "currentBid": bid["amount"], "currentBidder": {"userId": bid["userId"], "displayName": "Alice"},
+            "timerEndsAt": now.isoformat(), "soldClubs": [str(uuid.uuid4()) for _ in range(36)],
+            "unsoldClubs": [], "seq": 19, "participants": participants, "participantsVersion": 31,
+            "currentBids": [bid] * 6, "sealedRound": None, "timer": timer, **stream,
+        },
+    }
+
+
+def encoders():
+    rows = [
+        ("stdlib json", lambda payload: json.dumps(payload, separators=(",", ":")).encode()),
+        ("FastJson" + ("" if wire.orjson else " (no orjson)"), lambda payload: wire.FastJson.dumps(payload).encode()),
+    ]
+    if wire.msgpack is not None:
+        rows.append(("msgpack compact", wire.pack))
+    else:
+        print("⚠️  msgpack not installed - binary mode skipped")
+    return rows
+
+
+def measure(encode, payload):
+    frame = encode(payload)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        encode(payload)
+    return (time.perf_counter() - start) / ITERATIONS * 1_000_000, len(frame)
+
+
+def main():
+    print(f"Room of {ROOM_SIZE} sockets, {ITERATIONS} encodes per measurement\n")
+    rows = encoders()
+    print(f"{'event':>16} | {'encoding':>18} | {'µs/broadcast':>12} | {'frame B':>8} | {'room KB':>9}")
+    for event, payload in sample_events().items():
+        baseline = None
+        for name, encode in rows:
+            micros, size = measure(encode, payload)
+            baseline = baseline or (micros, size)
+            print(f"{event:>16} | {name:>18} | {micros:>12.2f} | {size:>8} | {size * ROOM_SIZE / 1024:>9.1f}"
+                  f"   ({micros / baseline[0]:.2f}x cpu, {size / baseline[1]:.2f}x bytes)")
+        print()
+
+
+if __name__ == "__main__":
+    main()